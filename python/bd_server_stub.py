@@ -0,0 +1,126 @@
+#!python3
+# Reference stub of bd_server.py for testing sump3.py Backdoor framing without
+# hardware. Hardware is modeled as a flat 32bit memory that reads back 0 until
+# written. Real bd_server.py is at https://github.com/blackmesalabs/MesaBusProtocol
+#
+# Usage:
+#   python bd_server_stub.py [port] [-legacy]
+#     port    : TCP port to listen on. Default 21567
+#     -legacy : Text framing only. Ignore "b 1" like bd_server.py before binary
+#
+# Packet   : 8 char hex header of payload byte length followed by the payload.
+# Text     : "w addr d0 d1..", "W addr d0 d1..", "r addr [n-1]", "k addr [n-1]",
+#            "p", "q" and "b 1" to request binary framing for the session.
+# Binary   : cmd(1 byte), addr(u32), count(u32) then count u32 DWORDs for
+#            writes. Read responses are count u32 DWORDs. Little-endian.
+import sys;
+import socket;
+import struct;
+
+#####################################
+def main():
+  args = sys.argv + [None]*4;# args[0] is script name
+  port = 21567;
+  legacy = False;
+  for each in args[1:]:
+    if each == "-legacy":
+      legacy = True;
+    elif each != None:
+      port = int( each, 10 );
+
+  mem = {};
+  server = socket.socket(socket.AF_INET,socket.SOCK_STREAM);
+  server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1);
+  server.bind( ( "127.0.0.1", port ) );
+  server.listen(1);
+  print("bd_server_stub listening on port %d" % port );
+  running = True;
+  while running:
+    conn, addr = server.accept();
+    print("Connection from %s:%d" % addr );
+    running = serve( conn, mem, legacy );
+    conn.close();
+  server.close();
+  return;
+
+#####################################
+# Handle one client. Multiple packets may arrive in a single recv() when the
+# client pipelines requests, so packets are carved out of a stream buffer.
+def serve( conn, mem, legacy ):
+  binary = False;
+  buf = b"";
+  while True:
+    while len( buf ) < 8:
+      data = conn.recv(65536);
+      if not data:
+        return True;
+      buf += data;
+    payload_len = int( buf[0:8].decode("utf-8"), 16 );
+    while len( buf ) < 8 + payload_len:
+      data = conn.recv(65536);
+      if not data:
+        return True;
+      buf += data;
+    payload = buf[8:8+payload_len];
+    buf = buf[8+payload_len:];
+
+    if binary:
+      (cmd, addr, count) = struct.unpack( "<cII", payload[0:9] );
+      cmd = cmd.decode("utf-8");
+      data = list( struct.unpack( "<%dI" % count, payload[9:9+4*count] ) ) if cmd in "wW" else [];
+      rts = process( mem, cmd, addr, count, data );
+      if rts == None:
+        return False;
+      tx_packet( conn, struct.pack( "<%dI" % len(rts), *rts ) );
+    else:
+      words = payload.decode("utf-8").split() + [None] * 2;
+      cmd = words[0];
+      if cmd == "b":
+        if legacy:
+          continue;# Old servers had no reply for unknown commands
+        binary = True;
+        tx_packet( conn, "b 1".encode("utf-8") );
+        continue;
+      addr = int( words[1], 16 ) if words[1] != None else 0;
+      if cmd in [ "r", "k" ]:
+        count = int( words[2], 16 ) + 1 if words[2] != None else 1;
+        data = [];
+      else:
+        data = [ int( each, 16 ) for each in words[2:] if each != None ];
+        count = len( data );
+      rts = process( mem, cmd, addr, count, data );
+      if rts == None:
+        return False;
+      if cmd in [ "r", "k" ]:
+        txt = " ".join( [ "%08x" % each for each in rts ] );
+      else:
+        txt = "";
+      tx_packet( conn, txt.encode("utf-8") );
+  return True;
+
+#####################################
+# Returns list of DWORDs read, [] for writes or None for quit
+def process( mem, cmd, addr, count, data ):
+  if cmd == "q":
+    return None;
+  elif cmd == "w":
+    for (i, each) in enumerate( data ):
+      mem[ addr + 4*i ] = each;
+  elif cmd == "W":
+    for each in data:
+      mem[ addr ] = each;
+  elif cmd == "r":
+    return [ mem.get( addr + 4*i, 0 ) for i in range( count ) ];
+  elif cmd == "k":
+    return [ mem.get( addr, 0 ) ] * count;
+  return [];
+
+def tx_packet( conn, payload ):
+  conn.sendall( ( "%08x" % len(payload) ).encode("utf-8") + payload );
+  return;
+
+try:
+  if __name__=='__main__': main()
+except KeyboardInterrupt:
+  print('Break!')
+# EOF
@@ -210,6 +210,34 @@
 # 2026.01.28 : ping() added to help debug bd_server connect issues.
 # 2026.01.29 : don't count RAM of RLE pods that are disabled. Report disabled pods.
 # 2026.02.01 : Preliminary AI assist using Google Gemini added.
+# 2026.10.17 : Backdoor negotiates binary u32 payload framing with bd_server.
+# 2026.10.17 : Backdoor rx_tcp_packet() receives into a preallocated buffer.
+# 2026.10.17 : sump3_hw q_rd(),q_wr(),q_run() queue for pipelined config reads.
+#              Pipelining needs bd_server_binary_en 1 or openocd NoAckMode.
+# 2026.10.17 : OpenOCD keeps one GDB session open with NoAckMode, block writes.
+# 2026.10.17 : OpenOCD probes and backs off read burst length per target.
+# 2026.10.17 : OpenOCD burst probe starts at 31 DWORDs. openocd_burst_max.
+# 2026.10.17 : sump_rlepod_download_all() pipelines Pods, decodes on workers.
+# 2026.10.17 : On-demand RLE download only reads RAM pages of applied signals.
+# 2026.10.17 : Sparse RLE download reads state page 1st, then valid ranges only.
+# 2026.10.17 : RLE samples held in memory by class Capture, not re-parsed text.
+# 2026.10.17 : RLE RAM pages unpacked with NumPy shifts and masks if available.
+# 2026.10.17 : rle_rotate_roll_cull() replaces three text passes over RLE RAM.
+# 2026.10.17 : RLE data words packed as ints with a per Pod unknown bit mask.
+# 2026.10.17 : All RLE signals of a Pod are ripped together in one sample walk.
+# 2026.10.17 : RLE signals keep only their own transitions. sump_rle_keep_raw.
+# 2026.10.17 : On-demand downloads decode and populate only the Pods that changed.
+# 2026.10.17 : RLE RAM image is held per (hub,pod) so a Pod is spliced in O(1).
+# 2026.10.17 : sump_download runs on a DownloadWorker thread. sump_download_background.
+# 2026.10.17 : RLE Pods are parsed by a process pool. sump_rle_decode_processes.
+# 2026.10.17 : RLE process pool is spawned once and also time adjusts and decodes.
+# 2026.10.17 : LS samples decode once into LsCapture columns, rotated by index.
+# 2026.10.17 : Signal values and rle_time packed as int64 arrays. __slots__. sump_memory.
+# 2026.10.17 : create_drawing_lines() bisects RLE rle_time to the visible samples.
+# 2026.10.17 : RLE time bounds cached per signal and per rle timezone.
+# 2026.10.17 : Zoomed out RLE binary signals drawn from an RleLod pyramid. screen_rle_lod_en.
+# 2026.10.17 : Waveform text rendered through an LRU GlyphCache. screen_glyph_cache_size.
+# 2026.10.17 : RLE windows painted from an LRU TileCache of waveform tiles. screen_tile_cache_en,mb.
 #
 # NOTE: Bug in cmd_create_bit_group(), it just enables triggerable and maskable for
 #       bottom 32 RLE bits instead of looking at actual hardware configuration.
@@ -239,8 +267,17 @@ import gzip;
 import fnmatch;
 import re;
 import time;
+import bisect;
 #import gc
 from collections import deque
+from collections import OrderedDict
+from array import array
+
+# NumPy is optional. When present RLE RAM pages are unpacked a Pod at a time.
+try:
+  import numpy;
+except ImportError:
+  numpy = None;
 
 # https://pygame-gui.readthedocs.io/en/v_067/index.html
 # python -m pip install pygame-gui
@@ -361,10 +398,29 @@ class main:
       file_name = os.path.join( file_path, file_name );
       if os.path.exists( file_name ):
         self.sump.rd_pod_cfg( file_name );
+
+      # Decode last capture's RLE samples into memory
+      file_name = os.path.join( file_path, "sump_rle_ram.txt" );
+      if os.path.exists( file_name ):
+        self.rle_ram_dict = rle_ram_split( file2list( file_name ) );
+        self.rle_capture.load_rle_ram( self.rle_ram_dict,
+          workers = int( self.vars["sump_rle_decode_processes"], 10 ) );
+        self.rle_capture.finalize();
+      else:
+        file_name = os.path.join( file_path, "sump_rle_samples.txt" );
+        if os.path.exists( file_name ):
+          self.rle_capture.load_rle_samples( file2list( file_name ) );
+          self.rle_capture.finalize();
+
+      file_name = os.path.join( file_path, "sump_ls_samples.txt" );
+      if os.path.exists( file_name ):
+        self.ls_capture.load_samples( file2list( file_name ) );
   
     init_display(self);
     self.font = get_font( self,self.vars["font_name"],self.vars["font_size"]);
     self.font_toolbar = get_font( self,self.vars["font_name"],self.vars["font_size_toolbar"]);
+    self.glyph_cache = GlyphCache( int( self.vars["screen_glyph_cache_size"], 10 ) );
+    self.tile_cache  = TileCache( int( self.vars["screen_tile_cache_mb"], 10 ) * 1024 * 1024 );
 
     # Calculate Width and Height of font for future reference
     txt = self.font_toolbar.render("4",True, ( 255,255,255 ) );
@@ -1322,6 +1378,9 @@ class main:
       self.process_events();# Ubuntu is crashing here with: XIO: fatal IO error 0 (Success) on X server "localhost:12.0"
       self.ui_manager.update( time_delta = 0 );
 
+      if self.download_worker != None:
+        sump_download_poll( self );
+
       if self.mode_acquire and self.sump_connected:
         spinner = rotate_spinner( spinner );
         self.pygame.display.set_caption(self.name+" "+self.vers+" "+self.copyright+" HW Status: Waiting for trigger " + spinner);
@@ -1394,7 +1453,7 @@ class main:
 
       if self.vars["bd_server_keep_alive"].lower() in ["true","yes","1"]:
         keep_alive_cnt+=1;
-        if self.sump_connected and keep_alive_cnt > 5000:
+        if self.sump_connected and keep_alive_cnt > 5000 and self.download_worker == None:
           self.bd.ping();
 #         print("Ping!")
           keep_alive_cnt = 0;
@@ -3083,6 +3142,11 @@ def convert_object_id_to_cmd( self, id_str ):
 # shutdown process
 def shutdown(self):
   log( self, ["shutdown()"] );
+  if self.download_worker != None:
+    self.download_worker.cancelled = True;
+    sump_download_wait( self );
+  rle_ram_save( self );
+  rle_process_pool_close( self );
   if self.sump_connected:
     cmd_thread_pool_surrender_id(self);
     cmd_sump_sleep(self);
@@ -3345,78 +3409,13 @@ def draw_digital_lines( self, my_window ):
         thickness = 3;
       self.pygame.draw.line(my_surface,self.color_grid,(0,y),(w,y), thickness);
 
-  analog_line_width = int( self.vars["screen_analog_line_width"], 10 );
-  analog_bold_width = int( self.vars["screen_analog_bold_width"], 10 );
-
-  # Draw the analog waveforms           
-  for (each_sig, y_space, each_line_list, each_point_list) in my_draw_list:
-    if len( each_line_list ) != 0 and each_sig.format == "analog" and each_sig.hidden == False:
-      sig_color = rgb2color( each_sig.color );
-#     if each_sig.selected:
-#       sig_color = self.color_selected;
-#     elif each_sig.trigger and each_sig.triggerable:
-      if each_sig.trigger and each_sig.triggerable:
-        sig_color = self.color_trigger;
-      if each_sig.selected:
-        sig_line_width = analog_bold_width;# 1 is hard to see
-      else:
-        sig_line_width = analog_line_width;# 1 is hard to see
-      try:
-        self.pygame.draw.lines(my_surface,sig_color,False,each_line_list,sig_line_width);
-        circle_radius = 2;
-#       if int( self.vars["screen_adc_sample_points"], 10 ) == 1:
-        if True:
-          for (x,y) in each_point_list:
-            self.pygame.draw.line(my_surface,sig_color, (x,y-1),(x,y+1), 2);
-#           self.pygame.draw.circle(my_surface,sig_color,(x,y),circle_radius,0);
-      except:
-        log(self,["  ERROR-2011 : Analog drawing failure"]);
-
-  # Draw trigger
-  if my_trigger_x != None:
-    x1 = my_trigger_x;
-    x2 = my_trigger_x;
-    y1 = 0;
-    y2 = h;
-    self.pygame.draw.line(my_surface,self.color_trigger,(x1,y1),(x2,y2), 1);
-
-  # Draw the binary digital signals
-  for (each_sig, y_space, each_line_list, each_point_list) in my_draw_list:
-    if len( each_line_list ) != 0 and each_sig.format == "binary" and each_sig.hidden == False:
-      sig_color = rgb2color( each_sig.color );
-      if each_sig.selected:
-        sig_color = self.color_selected;
-#     elif each_sig.trigger and each_sig.triggerable:
-#       sig_color = self.color_trigger;
-      if len( each_line_list ) >= 2 :
-        try:
-          self.pygame.draw.lines(my_surface,sig_color,False,each_line_list,1);
-        except:
-          log(self,["  ERROR-1993 %d %s" % ( len(each_line_list), each_line_list )]);
-
-  # Draw the gridlines
-# if my_window.grid_enable :
-#   x_step = int( w / 10.0 );
-#   y_step = int( h / 10.0 );
-#   for x in range( 0,w,x_step):
-#     self.pygame.draw.line(my_surface,self.color_grid,(x,0),(x,h), 1);
-#   for y in range( 0,h,y_step):
-#     self.pygame.draw.line(my_surface,self.color_grid,(0,y),(w,y), 1);
+  if my_window.tile_en:
+    draw_waveform_tiles( self, my_window );
+  else:
+    draw_waveform_layer( self, my_surface, my_draw_list, my_trigger_x );
 
   txt_y_offset = 1;
 
-  # Draw hex values if there is enough vertical spacing
-  for (each_sig, y_space, each_line_list, each_point_list) in my_draw_list:
-    if self.txt_height < y_space:
-      if len( each_line_list ) != 0 and each_sig.format == "hex" and each_sig.hidden == False:
-        for each_val in each_line_list:
-          (x1,y1,txt) = each_val;
-          if txt != None:
-            try:
-              my_surface.blit(txt, (x1,int(y1+txt_y_offset)) );
-            except:
-              log(self,["  ERROR-2041 (%s,%s)" % (x1,int(y1+txt_y_offset))]);
-
   # Draw the signal names - 1st drawing a black box beneath. 
   # Don't draw if spacing is less than font height
   assigned  = len( self.container_view_list )-2;
@@ -3703,6 +3702,141 @@ def draw_digital_lines( self, my_window ):
   my_image.set_image( my_surface );
   return;
 
+########################################################################
+# Paint the analog, trigger, binary and hex elements of a draw_list from
+# create_drawing_lines() onto my_surface. This is either the window itself
+# or a tile for the tile_cache.
+def draw_waveform_layer( self, my_surface, my_draw_list, my_trigger_x ):
+  h = my_surface.get_height();
+  analog_line_width = int( self.vars["screen_analog_line_width"], 10 );
+  analog_bold_width = int( self.vars["screen_analog_bold_width"], 10 );
+
+  # Draw the analog waveforms           
+  for (each_sig, y_space, each_line_list, each_point_list) in my_draw_list:
+    if len( each_line_list ) != 0 and each_sig.format == "analog" and each_sig.hidden == False:
+      sig_color = rgb2color( each_sig.color );
+#     if each_sig.selected:
+#       sig_color = self.color_selected;
+#     elif each_sig.trigger and each_sig.triggerable:
+      if each_sig.trigger and each_sig.triggerable:
+        sig_color = self.color_trigger;
+      if each_sig.selected:
+        sig_line_width = analog_bold_width;# 1 is hard to see
+      else:
+        sig_line_width = analog_line_width;# 1 is hard to see
+      try:
+        self.pygame.draw.lines(my_surface,sig_color,False,each_line_list,sig_line_width);
+        circle_radius = 2;
+#       if int( self.vars["screen_adc_sample_points"], 10 ) == 1:
+        if True:
+          for (x,y) in each_point_list:
+            self.pygame.draw.line(my_surface,sig_color, (x,y-1),(x,y+1), 2);
+#           self.pygame.draw.circle(my_surface,sig_color,(x,y),circle_radius,0);
+      except:
+        log(self,["  ERROR-2011 : Analog drawing failure"]);
+
+  # Draw trigger
+  if my_trigger_x != None:
+    x1 = my_trigger_x;
+    x2 = my_trigger_x;
+    y1 = 0;
+    y2 = h;
+    self.pygame.draw.line(my_surface,self.color_trigger,(x1,y1),(x2,y2), 1);
+
+  # Draw the binary digital signals
+  for (each_sig, y_space, each_line_list, each_point_list) in my_draw_list:
+    if len( each_line_list ) != 0 and each_sig.format == "binary" and each_sig.hidden == False:
+      sig_color = rgb2color( each_sig.color );
+      if each_sig.selected:
+        sig_color = self.color_selected;
+#     elif each_sig.trigger and each_sig.triggerable:
+#       sig_color = self.color_trigger;
+      if len( each_line_list ) >= 2 :
+        try:
+          self.pygame.draw.lines(my_surface,sig_color,False,each_line_list,1);
+        except:
+          log(self,["  ERROR-1993 %d %s" % ( len(each_line_list), each_line_list )]);
+
+  # Draw the gridlines
+# if my_window.grid_enable :
+#   x_step = int( w / 10.0 );
+#   y_step = int( h / 10.0 );
+#   for x in range( 0,w,x_step):
+#     self.pygame.draw.line(my_surface,self.color_grid,(x,0),(x,h), 1);
+#   for y in range( 0,h,y_step):
+#     self.pygame.draw.line(my_surface,self.color_grid,(0,y),(w,y), 1);
+
+  txt_y_offset = 1;
+
+  # Draw hex values if there is enough vertical spacing
+  for (each_sig, y_space, each_line_list, each_point_list) in my_draw_list:
+    if self.txt_height < y_space:
+      if len( each_line_list ) != 0 and each_sig.format == "hex" and each_sig.hidden == False:
+        for each_val in each_line_list:
+          (x1,y1,txt) = each_val;
+          if txt != None:
+            try:
+              my_surface.blit(txt, (x1,int(y1+txt_y_offset)) );
+            except:
+              log(self,["  ERROR-2041 (%s,%s)" % (x1,int(y1+txt_y_offset))]);
+  return;
+
+########################################################################
+# RLE windows map time to pixels linearly, so at a fixed zoom the whole
+# capture is one wide strip cut into tiles. A pan blits the tiles that were
+# already painted and only renders the tiles newly exposed on an edge.
+def draw_waveform_tiles( self, my_win ):
+  my_surface = my_win.surface;
+  w = my_surface.get_width();
+  samples_shown = my_win.samples_shown;
+  if samples_shown == None or samples_shown == 0:
+    return;
+  self.tile_cache.set_signature( my_win.name, tile_signature( self, my_win ) );
+  tile_w = self.tile_cache.tile_w;
+  rle_time_to_pixels = float( w / samples_shown );
+  # Strip pixel at window left. Whole as create_drawing_lines() snaps the pan
+  x_left = int( round( my_win.samples_start_offset * rle_time_to_pixels ) );
+  for k in range( x_left // tile_w, ( x_left + w ) // tile_w + 1 ):
+    key = ( my_win.name, samples_shown, w, k );
+    tile = self.tile_cache.get( key );
+    if tile == None:
+      tile = create_waveform_tile( self, my_win, rle_time_to_pixels, k );
+      self.tile_cache.put( key, tile );
+    my_surface.blit( tile, ( k * tile_w - x_left, 0 ) );
+  return;
+
+# Render tile k of the strip. The tile is drawn wider by a margin on both
+# sides and cropped, so hex text and edges crossing a tile boundary match
+# their neighbors.
+def create_waveform_tile( self, my_win, rle_time_to_pixels, k ):
+  tile_w = self.tile_cache.tile_w;
+  margin = self.tile_cache.margin;
+  h = my_win.surface.get_height();
+  tile_win = window( my_win.name );
+  tile_win.timezone    = my_win.timezone;
+  tile_win.signal_list = my_win.signal_list;
+  tile_win.y_offset    = my_win.y_offset;
+  tile_win.surface     = self.pygame.Surface( ( tile_w + 2*margin, h ) );
+  tile_span = ( ( tile_w + 2*margin ) / rle_time_to_pixels,
+                ( k * tile_w - margin ) / rle_time_to_pixels );
+  draw_list = create_drawing_lines( self, tile_win, tile_span );
+  tile_win.surface.fill( self.color_bg );
+  draw_waveform_layer( self, tile_win.surface, draw_list[:-1], draw_list[-1] );
+  tile = self.pygame.Surface( ( tile_w, h ) );
+  tile.blit( tile_win.surface, ( 0,0 ), pygame.Rect( margin, 0, tile_w, h ) );
+  return tile;
+
+# Everything other than zoom and pan that changes what a tile looks like.
+def tile_signature( self, my_win ):
+  sig_list = tuple( ( id( each_sig ), each_sig.visible, each_sig.hidden, each_sig.selected,
+                      each_sig.format, each_sig.color, each_sig.nibble_cnt,
+                      id( each_sig.values ), id( each_sig.rle_time ),
+                      tuple( each_sig.fsm_state_dict.items() ) )
+                    for each_sig in my_win.signal_list );
+  return ( sig_list, my_win.y_offset, my_win.trigger_index, my_win.surface.get_height(),
+           self.vars["font_size"], self.txt_height, self.vars["screen_rle_lod_en"],
+           tuple( self.color_bg ), tuple( self.color_selected ), tuple( self.color_trigger ) );
+
 
 ########################################################################
 # Create the waveforms for the 3 different windows. Windows get assigned
@@ -3739,15 +3873,34 @@ def create_waveforms( self ):
   if self.debug_mode:
     stop_time = self.pygame.time.get_ticks();
     render_time = stop_time - start_time;
-    log( self, ["create_waveforms() Render Time = %d ms" % render_time] );
+    log( self, ["create_waveforms() Render Time = %d ms" % render_time, self.glyph_cache.stats(),
+                self.tile_cache.stats() ] );
   return;
 
+# Earliest and latest time of all the signals in all the "rle" windows. Each
+# signal caches its own bounds when populated, so this is only recomputed
+# when new samples are populated or the rle windows hold other signals.
+def rle_timezone_bounds( self ):
+  sig_list = tuple( each_sig for each_win in self.window_list if each_win.timezone == "rle"
+                              for each_sig in each_win.signal_list );
+  if self.rle_time_bounds == None or self.rle_time_bounds[0] != sig_list:
+    bounds_list = [ each_sig.rle_time_bounds for each_sig in sig_list
+                                             if each_sig.rle_time_bounds != None ];
+    if len( bounds_list ) != 0:
+      bounds = ( min( each[0] for each in bounds_list ), max( each[1] for each in bounds_list ) );
+    else:
+      bounds = None;
+    self.rle_time_bounds = ( sig_list, bounds );
+  return self.rle_time_bounds[1];
+
 
 ################################################################################
 # Make a list of things to draw ( like binary waveforms ). This is slow but
 # the actual drawing of the list later is fast. Only call this as-needed when
 # something changes (zoom,pan, new signals added, etc )
-def create_drawing_lines( self, my_win ):
+# With a tile_span of ( samples_to_draw, samples_start_offset ) an RLE window
+# is drawn at that time span instead of its own zoom and pan, for tiles.
+def create_drawing_lines( self, my_win, tile_span = None ):
   draw_list = [];
   my_surface = my_win.surface;
   my_sig_list = my_win.signal_list;
@@ -3780,7 +3933,7 @@ def create_drawing_lines( self, my_win ):
           # There's a small issue with user_select being used and applying a view
           # with a different user_select. It will continue to attempt to download
           # samples that aren't there on every pan, zoom, etc.
-          if self.sump_connected:
+          if self.sump_connected and tile_span == None:
 #           print( each_sig.source );
             download_rle_ondemand( self, each_sig.source );
 
@@ -3809,26 +3962,25 @@ def create_drawing_lines( self, my_win ):
           type_rle = True;
           break;
 
+  # RLE windows painted from the tile_cache only need the cursor values here
+  my_win.tile_en = ( type_rle and tile_span == None and not my_win.grid_enable and
+                     int( self.vars["screen_tile_cache_en"], 10 ) == 1 );
+  lines_en = not my_win.tile_en;
+
   if len( my_sig_list ) != 0:
     if not type_rle:
       # Not all signals have values ( groups ), so find signal with max number of values.
       samples_to_draw = max([ len(each.values) for each in my_sig_list ]);# list comprehension
     else:
-      rle_flat_time_list = [];
 # New 2024.12.16 : This doesn't work as the short time is never displayed relative to long
 # time from two RLE pods in two different windows. This means that "zoom_full" is always
 # relative to the longest RLE capture. This is better than alternative of never seeing short
 # time relative to long time
 #     if True:
 #       each_win = my_win;
-      for each_win in self.window_list:
-        if each_win.timezone == "rle":
-          for each_sig in each_win.signal_list:
-            rle_flat_time_list += each_sig.rle_time;# List of all the times of all the signals
-
-      if len( rle_flat_time_list ) != 0:
-        rle_time_min = min( rle_flat_time_list );
-        rle_time_max = max( rle_flat_time_list );
+      rle_bounds = rle_timezone_bounds( self );
+      if rle_bounds != None:
+        ( rle_time_min, rle_time_max ) = rle_bounds;
         rle_time_total = abs(rle_time_min) + rle_time_max;
         my_win.samples_total = rle_time_total;
         my_win.trigger_index = abs(rle_time_min);
@@ -3856,6 +4008,8 @@ def create_drawing_lines( self, my_win ):
     # Zoom reduces the samples_to_draw so we only see a fraction on the display
     samples_to_draw = int( samples_to_draw / zoom );
     my_win.samples_shown = samples_to_draw;
+    if type_rle and tile_span != None:
+      ( samples_to_draw, pan ) = tile_span;
 
     # Now we know the display width (w) and the number of samples to draw, so calculate
     # floating point pixel spacing between samples.
@@ -3867,6 +4021,10 @@ def create_drawing_lines( self, my_win ):
     # A pan "click" is 1/10th the number of samples on the screen
     # Use the pan value (mouse wheel controlled) and this ratio to figure 1st sample drawn
     samples_start_offset = pan;
+    # Tiles are cut on whole pixels of the strip, so a tiled window is panned
+    # in whole pixels too. Every x then truncates the same as a full repaint.
+    if my_win.tile_en and x_space != 0:
+      samples_start_offset = round( pan * x_space ) / x_space;
 
     # Assign the x_space and samples_start_offset value to the parent window. This is done for 
     # every signal that has samples, but the values will all be the same.
@@ -3899,6 +4057,7 @@ def create_drawing_lines( self, my_win ):
       point_list = [];
       viewable_value_list = [];
       rle_value_time_pairs = [];
+      rle_lod_line_list = None;
       if each_sig.format == "analog":
         x = - x_space;
 
@@ -3933,7 +4092,30 @@ def create_drawing_lines( self, my_win ):
         need_pre_leftmost   = True;
         need_post_rightmost = True;
 #       print( each_sig.name, samples_to_draw );
-        for ( i, each_value ) in enumerate( each_sig.values ):
+        # rle_time is ascending so bisect to just past both screen edges
+        # instead of walking every sample. The search is 1ps wider each side
+        # so a fractional pan can't lose an edge sample, the test below still
+        # decides exactly what is drawn.
+        i_start = 0;
+        i_stop  = 0;
+        if len( each_sig.values ) != 0 and ( lines_en or each_sig.format != "binary" ):
+          rle_time_left = samples_start_offset - abs( rle_time_min );
+          i_start = bisect.bisect_right( each_sig.rle_time, rle_time_left - 1 );
+          i_stop  = bisect.bisect_right( each_sig.rle_time, rle_time_left + max( samples_to_draw, 0 ) + 1 );
+          i_start = max( i_start-1, 0 );
+          i_stop  = min( i_stop+1, len( each_sig.values ) );
+
+        # More samples than pixel columns. Binary signals are then drawn from
+        # the LOD pyramid and need no sample pairs at all.
+        if ( each_sig.format == "binary" and i_stop - i_start > w and samples_to_draw > 0 and
+             int( self.vars["screen_rle_lod_en"], 10 ) == 1 ):
+          if each_sig.rle_lod == None:
+            each_sig.rle_lod = RleLod( each_sig.values, each_sig.rle_time );
+          rle_lod_line_list = each_sig.rle_lod.line_list( each_sig.values, each_sig.rle_time,
+                                rle_time_left, float( w / samples_to_draw ), w, y1, y2 );
+          i_stop = i_start;
+        for i in range( i_start, i_stop ):
+          each_value = each_sig.values[i];
           rle_time = each_sig.rle_time[i];
           # Adjust time so T=0 starts relative to most negative of ALL signal samples
           rle_time += abs( rle_time_min );
@@ -3990,10 +4172,11 @@ def create_drawing_lines( self, my_win ):
             else:
               sig_color = rgb2color( each_sig.color );
 
-            txt_r_nospace = self.font.render("<>",True, sig_color );
+            txt_r_nospace = render_text( self, "<>", sig_color );
 #           txt_open_bracket = self.font.render("<",True, sig_color );
-            txt_close_bracket = self.font.render(">",True, sig_color );
+            txt_close_bracket = render_text( self, ">", sig_color );
             w2 = txt_close_bracket.get_width();
+            hex_str_dict = {};# value : hex_str for this signal
             if len( rle_value_time_pairs ) > 1:
               ( last_value, last_time ) = rle_value_time_pairs[0];
               cur_val_list = [];
@@ -4008,30 +4191,25 @@ def create_drawing_lines( self, my_win ):
 
                 # The sample BEFORE the 1st onscreen sample
                 if len( cur_val_list ) == 0:
-                  hex_str = None;
-                  if len( each_sig.fsm_state_dict ) != 0:
-                    if each_sig.fsm_state_dict.get(last_value) != None:
-                      hex_str = each_sig.fsm_state_dict[last_value];
-                  if hex_str == None:
-                    hex_str = "%08x" % last_value;
-                    hex_str = hex_str[ - each_sig.nibble_cnt :];
+                  hex_str = hex_value_str( each_sig, last_value, hex_str_dict );
                   txt = "<"+hex_str+" ";
                   cur_val_list += [(my_win,x1-1,y1,txt+">")];
 
+                if not lines_en:
+                  if each_value != last_value:
+                    hex_str = hex_value_str( each_sig, each_value, hex_str_dict );
+                    cur_val_list += [(my_win,x1,y1,"<"+hex_str+" >")];
+                  last_value = each_value;
+                  continue;
+
                 if each_value != last_value:
-                  hex_str = None;
-                  if len( each_sig.fsm_state_dict ) != 0:
-                    if each_sig.fsm_state_dict.get(each_value) != None:
-                      hex_str = each_sig.fsm_state_dict[each_value];
-                  if hex_str == None:
-                    hex_str = "%08x" % each_value;
-                    hex_str = hex_str[ - each_sig.nibble_cnt :];
+                  hex_str = hex_value_str( each_sig, each_value, hex_str_dict );
                   txt = "<"+hex_str+" ";
 
                   if True:
                     cur_val_list += [(my_win,x1,y1,txt+">")];
 #                   print(txt);
-                  txt_r = self.font.render(txt,True, sig_color );
+                  txt_r = render_text( self, txt, sig_color );
                   if vasili:
                     w1 = txt_r.get_width();
                     vasili = False;
@@ -4042,15 +4220,9 @@ def create_drawing_lines( self, my_win ):
                 # The RLE time of it may be off screen. We're showing value before new value.
                 if txt_r != None and not first_drawn:
                   first_drawn = True;
-                  hex_str2 = None;
-                  if len( each_sig.fsm_state_dict ) != 0:
-                    if each_sig.fsm_state_dict.get(last_value) != None:
-                      hex_str2 = each_sig.fsm_state_dict[last_value];
-                  if hex_str2 == None:
-                    hex_str2 = "%08x" % last_value;
-                    hex_str2 = hex_str2[ - each_sig.nibble_cnt :];
+                  hex_str2 = hex_value_str( each_sig, last_value, hex_str_dict );
                   txt2 = ""+hex_str2+">";
-                  txt_r2 = self.font.render(txt2,True, sig_color );
+                  txt_r2 = render_text( self, txt2, sig_color );
                   w3 = txt_r2.get_width();
                   line_list += [ (x1-w3,y1,txt_r2) ];# Draw to left of current sample
 
@@ -4071,7 +4243,7 @@ def create_drawing_lines( self, my_win ):
                   else:
                     if last_hex_str != None:
                       if ( x1 - last_x ) > ( w1 + w2 ):
-                        txt_wider = self.font.render("< "+last_hex_str,True, sig_color );
+                        txt_wider = render_text( self, "< "+last_hex_str, sig_color );
                         line_list[-1] = (last_x,last_y,txt_wider );
                     line_list += [ (x1-w2,y1,txt_close_bracket) ];# Turn "<01   " into "<01  >"
                   last_hex_str = hex_str;
@@ -4097,8 +4269,9 @@ def create_drawing_lines( self, my_win ):
                 last_value   = each_value;
                 last_time    = each_time;
                 # end of for (each_value, each_time) in rle_value_time_pairs[1:]:
-              for (i, each_cur) in enumerate(self.cursor_list):
-                each_cur.sig_value_list[ y1 ] = cur_val_list;
+              if tile_span == None:
+                for (i, each_cur) in enumerate(self.cursor_list):
+                  each_cur.sig_value_list[ y1 ] = cur_val_list;
               draw_list += [ ( each_sig, y_space, line_list, point_list ) ];
             else:
               draw_list += [ ( each_sig, y_space, [], []    ) ];
@@ -4117,7 +4290,9 @@ def create_drawing_lines( self, my_win ):
           else:
 #           log(self,["ERROR-2372 : samples_to_draw = %d" % samples_to_draw]);
             rle_time_to_pixels = None;
-          if len( rle_value_time_pairs ) > 1 and rle_time_to_pixels != None:
+          if rle_lod_line_list != None:
+            line_list = rle_lod_line_list;
+          elif len( rle_value_time_pairs ) > 1 and rle_time_to_pixels != None:
             ( last_value, last_time ) = rle_value_time_pairs[0];
             for (each_value, each_time) in rle_value_time_pairs[1:]:
               x1 = int( last_time * rle_time_to_pixels );
@@ -4183,7 +4358,7 @@ def create_drawing_lines( self, my_win ):
           if each_value != last_value:
             hex_str = "%08x" % each_value;
             hex_str = hex_str[ - each_sig.nibble_cnt :];
-            txt = self.font.render("<"+hex_str+">",True, sig_color );
+            txt = render_text( self, "<"+hex_str+">", sig_color );
           else:
             txt = None;
           last_value = each_value;
@@ -4394,6 +4569,23 @@ def compress_line_list( line_list ):
     y1 = y;  x1 = x;
   return new_line_list[:-1];# Remove the final (None,None)
 
+# Text for a hex signal value. FSM state name if it has one, else the hex
+# digits. hex_str_dict remembers values already looked up.
+def hex_value_str( each_sig, value, hex_str_dict ):
+  hex_str = hex_str_dict.get( value );
+  if hex_str == None:
+    hex_str = each_sig.fsm_state_dict.get( value );
+    if hex_str == None:
+      hex_str = "%08x" % value;
+      hex_str = hex_str[ - each_sig.nibble_cnt :];
+    hex_str_dict[ value ] = hex_str;
+  return hex_str;
+
+# Waveform text goes through the glyph cache as the same few hex values are
+# rendered again on every redraw.
+def render_text( self, txt, color ):
+  return self.glyph_cache.render( self.font, self.vars["font_size"], txt, color );
+
 
 ###############################################################################
 # Initialize the Display
@@ -6262,6 +6454,12 @@ def cmd_save_pza( self, words ):
   file_out = words[1];
 
   download_rle_ondemand_all( self );
+  populate_signal_values_from_samples( self, dirty_only = True );
+  rle_ram_save( self );
+  # Readers that predate sump_rle_ram.txt only know sump_rle_samples.txt
+  if int( self.vars["sump_rle_samples_export"], 10 ) == 0 and len( self.rle_capture.pod_list ) != 0:
+    file_name = os.path.join( os.path.abspath( self.vars["sump_path_ram"] ), "sump_rle_samples.txt" );
+    list2file( file_name, self.rle_capture.samples_list() );
 
   if file_out == None:
     filename_path = self.vars["sump_path_pza"];
@@ -6310,6 +6508,11 @@ def cmd_load_pza( self, words ):
 #   pza_list = file2list( file_in );# Clear Text
     pza_list = filegz2list( file_in );# Gzipped
 
+    # A pizza needn't hold every file ( vcd2pza.py only makes
+    # sump_rle_samples.txt ) so the previous capture's files must not be
+    # left behind to be decoded under the new pizza's signal names.
+    sump_ram_files_delete( self, os.path.abspath( self.vars["sump_path_ram"] ) );
+
     view_rom_list = [];
     view_rom_found = False;
 
@@ -6349,6 +6552,17 @@ def cmd_load_pza( self, words ):
     file_name = os.path.join( file_path, file_name );
     if os.path.exists( file_name ):
       self.sump.rd_pod_cfg( file_name );
+    file_name = os.path.join( file_path, "sump_rle_ram.txt" );
+    if os.path.exists( file_name ):
+      self.rle_ram_dict = rle_ram_split( file2list( file_name ) );
+    else:
+      self.rle_ram_dict = {};
+    self.rle_ram_stale = False;
+    create_sump_digital_rle( self );
+    self.ls_capture = LsCapture();
+    file_name = os.path.join( file_path, "sump_ls_samples.txt" );
+    if os.path.exists( file_name ):
+      self.ls_capture.load_samples( file2list( file_name ) );
     rts += ["load_pza() created %d files." % count ];
   else:
     rts += ["ERROR %s file not found" % file_in ];
@@ -6476,7 +6690,8 @@ def cmd_sump_connect( self ):
                          ip_addr,
                          int( self.vars["bd_server_socket"], 10 ),
                          int( self.vars["aes_key"], 16 ),
-                         int( self.vars["aes_authentication"], 10 )
+                         int( self.vars["aes_authentication"], 10 ),
+                         int( self.vars["bd_server_binary_en"], 10 )
                       );
     else:
       log( self, ["  ERROR: Failed to ping %s" % ip_addr ] );
@@ -6522,6 +6737,8 @@ def cmd_sump_connect( self ):
   self.pygame.display.set_caption(self.name+" "+self.vers+" "+self.copyright+" Reading HW Configuration..");
   self.pygame.event.pump();
   found_sump3_hw = self.sump.rd_cfg();# populate sump.cfg_dict[] with HW Configuration
+  if found_sump3_hw and self.vars["bd_connection"] == "openocd":
+    self.bd.probe_burst( self.sump.addr_ctrl, self.sump.addr_data, self.sump.cmd_rd_hw_id_rev );
 
 # if ( self.sump.cfg_dict['hw_id'] != 0x0ADC ):
 # if ( self.sump.cfg_dict['hw_id'] != 0x53 ):
@@ -7095,6 +7312,7 @@ def cmd_thread_lock( self ):
           log( self, ["cmd_thread_lock() : %08x %08x" % ( thread_lock_status, a ) ] );
     self.sump.wr_ctrl( ctrl_status );# Put that Sump3 HW ctrl state back
     log( self, ["cmd_thread_lock() : Locked to sump_thread_id %08x" % ( thread_lock_status ) ] );
+  self.thread_locked = True;
   return;
 
 def cmd_thread_unlock( self ):
@@ -7105,6 +7323,7 @@ def cmd_thread_unlock( self ):
     self.sump.wr( self.sump.cmd_wr_thread_lock_clear, self.thread_id );
     self.sump.wr_ctrl( ctrl_status );# Put that Sump3 HW ctrl state back
     log( self, ["cmd_thread_unlock()"] );
+  self.thread_locked = False;
   return;
 
 ########################################################
@@ -7112,6 +7331,7 @@ def cmd_thread_unlock( self ):
 def cmd_sump_arm( self ):
   log( self, ["sump_arm()"] );
   self.sump_rle_download_history_dict = {};# Remember if a [Hub,Pod] has already been downloaded.
+  self.sump_rle_page_dict = {};# Raw RLE RAM pages downloaded so far for each [Hub,Pod]
   if not self.sump_connected:
     txt = "  ERROR-1977: Sump HW not connected";
     log( self, [ txt ]);
@@ -7531,17 +7751,39 @@ def cmd_sump_query( self ):
 
 ########################################################
 # Download sump capture data to RAM text files
+# With sump_download_background=1 the download and decode run on a
+# DownloadWorker thread and the GUI keeps showing the previous capture until
+# sump_download_poll() swaps the new one in.
 def cmd_sump_download( self ):
   log( self, ["sump_download()"] );
+  if self.download_worker != None:
+    log( self, ["sump_download() : Download already in progress"] );
+    return;
+  if int( self.vars["sump_download_background"], 10 ) == 1 and self.sump_connected:
+    self.status_downloading = True;
+    self.download_worker = DownloadWorker( parent = self );
+    self.download_worker.start();
+    return;
+  start_time = self.pygame.time.get_ticks();
+  if sump_download_capture( self ):
+    sump_download_finish( self, start_time );
+  return;
+
+# The hardware half of sump_download. Returns True if a capture was downloaded.
+# When run by a DownloadWorker, self is its DownloadWorkerApp.
+def sump_download_capture( self ):
   self.sump_rle_download_history_dict = {};# Remember if a [Hub,Pod] has already been downloaded.
+  self.sump_rle_page_dict = {};# Raw RLE RAM pages downloaded so far for each [Hub,Pod]
+  self.rle_ram_dict = {};
+  self.rle_capture = Capture( parent = self );
+  self.ls_capture = LsCapture();
   self.pygame.display.set_caption(self.name+" "+self.vers+" "+self.copyright+" Downloading...");
   self.pygame.event.pump();
-  start_time = self.pygame.time.get_ticks();
   if not self.sump_connected:
     txt = "  ERROR-1977: Sump HW not connected";
     log( self, [ txt ]);
     self.pygame.display.set_caption(self.name+" "+self.vers+" "+self.copyright + " "+txt );
-    return;
+    return False;
   else:
     cmd_thread_lock(self);
     self.sump.rd_status();
@@ -7560,7 +7802,7 @@ def cmd_sump_download( self ):
       txt = "cmd_sump_download(): ERROR: Sump3 HW Communication";
       self.pygame.display.set_caption(self.name+" "+self.vers+" "+self.copyright+" "+txt);
       log( self, [ txt ] );
-      return;
+      return False;
 
     capture_cfg_list = [];
     for key in self.sump.cfg_dict:
@@ -7571,12 +7813,7 @@ def cmd_sump_download( self ):
     file_path = os.path.abspath( self.vars["sump_path_ram"] );
 
     # Delete any old files
-    for each in ["sump_ls_ram.txt","sump_hs_ram.txt","sump_rle_ram.txt",
-      "sump_ls_samples.txt","sump_hs_samples.txt","sump_rle_samples.txt" ]:
-      file_name = os.path.join( file_path, each );
-      if os.path.exists( file_name ):
-        log( self, ["Deleting old %s" % file_name ]);
-        os.remove( file_name );
+    sump_ram_files_delete( self, file_path );
 
     file_name = "sump_capture_cfg.txt";
     file_name = os.path.join( file_path, file_name );
@@ -7637,7 +7874,7 @@ def cmd_sump_download( self ):
       elif title == "HS":
         create_sump_digital_fast(self, file_in, file_out );
       elif title == "RLE":
-        create_sump_digital_rle(self,  file_in, file_out );
+        create_sump_digital_rle(self);
 
   # Emulate an on-demand RLE pod download. Iterate the list of pods
   # and download the specified pod if "[download_needed]" is found
@@ -7674,7 +7911,20 @@ def cmd_sump_download( self ):
 
   if dl_ondemand == 0:
     download_rle_ondemand_all(self);
+  return True;
+
+# Delete the RAM and samples files of the previous capture from file_path
+def sump_ram_files_delete( self, file_path ):
+  for each in ["sump_ls_ram.txt","sump_hs_ram.txt","sump_rle_ram.txt",
+    "sump_ls_samples.txt","sump_hs_samples.txt","sump_rle_samples.txt" ]:
+    file_name = os.path.join( file_path, each );
+    if os.path.exists( file_name ):
+      log( self, ["Deleting old %s" % file_name ]);
+      os.remove( file_name );
+  return;
 
+# The GUI half of sump_download, always on the main thread
+def sump_download_finish( self, start_time ):
 # self.pygame.display.set_caption(\
 #   self.name+" "+self.vers+" "+self.copyright+" Populating user signals..");
   populate_signal_values_from_samples( self );
@@ -7690,14 +7940,60 @@ def cmd_sump_download( self ):
   stop_time = self.pygame.time.get_ticks();
   delta_time = stop_time - start_time;
   log( self, ["sump_download() : Completed in %d ms.\n" % delta_time] );
+  if self.vars["bd_connection"] == "openocd":
+    self.bd.report_rate();
   cmd_thread_unlock(self);
   return;
 
+# Called every pass of the main loop while a DownloadWorker exists. Shows its
+# progress and once it has stopped either swaps in the new capture or
+# leaves the previous one in place if it was cancelled or failed.
+def sump_download_poll( self ):
+  worker = self.download_worker;
+  txt = None;
+  while not worker.progress_queue.empty():
+    txt = worker.progress_queue.get();
+  if txt != None:
+    self.pygame.display.set_caption( txt );
+  if worker.thread.is_alive():
+    return;
+  self.download_worker = None;
+  if worker.status == "done":
+    worker.swap();
+    sump_download_finish( self, worker.start_time );
+  else:
+    worker.discard();
+    self.status_downloading = False;
+    cmd_thread_unlock(self);
+    txt = "sump_download() : Download %s. Keeping previous capture." % worker.status;
+    log( self, [ txt ] );
+    self.pygame.display.set_caption(self.name+" "+self.vers+" "+self.copyright+" "+txt);
+  return;
+
+# Block until a background download finishes. Commands other than pan and
+# zoom wait on this so that scripts see the new capture.
+def sump_download_wait( self ):
+  if self.download_worker != None:
+    self.download_worker.thread.join();
+    sump_download_poll( self );
+  return;
+
+def cmd_sump_download_cancel( self ):
+  rts = [];
+  if self.download_worker == None:
+    rts += ["sump_download_cancel() : No download in progress"];
+  else:
+    self.download_worker.cancelled = True;
+    rts += ["sump_download_cancel() : Cancelling download"];
+  return rts;
+
 # create_drawing_lines() will check to see if a signal has no values
 # and call this to download RLE samples ondemand
 def download_rle_ondemand( self, rle_sig_source ):
 # print("download_rle_ondemand( %s )" % rle_sig_source );
 # start_time = self.pygame.time.get_ticks();
+  if self.download_worker != None:
+    return;# HW is busy with a new capture, the previous one is still shown
   if "digital_rle" in rle_sig_source:
     # "digital_rle[0][1][1:0]"
     source_name = rle_sig_source.replace("["," ");
@@ -7709,6 +8005,17 @@ def download_rle_ondemand( self, rle_sig_source ):
     if self.sump_rle_download_history_dict.get( (hub,pod) ) == None:
       download_rle_ondemand_hubpod( self, hub, pod );
       self.sump_rle_download_history_dict[ (hub,pod) ] = True;
+    else:
+      # Already downloaded, but perhaps not the data pages this signal needs
+      entry = self.sump_rle_page_dict.get( (hub,pod) );
+      bit_rip = rle_source_bit_rip( self, rle_sig_source );
+      if entry != None and bit_rip != None:
+        ( hub_i, pod_i, bit_top, bit_bot ) = bit_rip;
+        ( hdr, page_dict ) = entry;
+        for i in range( bit_bot // 32, ( bit_top // 32 ) + 1 ):
+          if i < hdr["num_dwords"] and page_dict.get( i ) == None:
+            download_rle_ondemand_hubpod( self, hub, pod );
+            break;
 # stop_time = self.pygame.time.get_ticks();
 # delta_time = stop_time - start_time;
 # log( self, ["download_rle_ondemand() : Completed in %d ms.\n" % delta_time]);
@@ -7716,11 +8023,7 @@ def download_rle_ondemand( self, rle_sig_source ):
 
 def download_rle_ondemand_hubpod( self, hub, pod ):
   log( self,[ "download_rle_ondemand_hubpod(%d:%d)" % (hub,pod) ]);
-  filename = "sump_rle_ram.txt";
-  from os import path;
-  file_path = os.path.abspath( self.vars["sump_path_ram"] );
-  filename  = os.path.join( file_path, filename );
-  if not os.path.exists( filename ):
+  if len( self.rle_ram_dict ) == 0:
     return;
 
   self.pygame.display.set_caption(\
@@ -7728,71 +8031,66 @@ def download_rle_ondemand_hubpod( self, hub, pod ):
   self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
   self.pygame.event.pump();
 
-  rle_ram_list = file2list( filename );
   rle_ram_updated = False;
-  new_rle_ram_list = sump_rlepod_download(self, hub_num=hub, pod_num=pod, rle_ram_list=rle_ram_list );
-  if new_rle_ram_list != None:
-    rle_ram_list = new_rle_ram_list;
+  page_select = int( self.vars["sump_download_rle_page_select"], 10 ) == 1;
+  new_pod_txt_list = sump_rlepod_download(self, hub_num=hub, pod_num=pod, rle_ram_dict=self.rle_ram_dict,
+                                          page_select=page_select );
+  if new_pod_txt_list != None:
     rle_ram_updated = True;
 
-  # Generate a new rle_samples file if the rle_ram file changed
+  # Decode just this Pod and update just the signals that rip from it.
+  # sump_rle_ram.txt is rewritten once by rle_ram_save(), not per Pod.
   if rle_ram_updated == True:
-    list2file( filename, rle_ram_list );
-    file_in  = "sump_rle_ram.txt";
-    file_out = "sump_rle_samples.txt";
-    log( self,[ "Changes to %s" % file_in ]);
-    log( self,[ "Updating %s" % file_out ]);
-    create_sump_digital_rle(self,  file_in, file_out );
-    populate_signal_values_from_samples( self );
+    self.rle_ram_dict[ (hub,pod) ] = new_pod_txt_list;
+    self.rle_ram_stale = True;
+    create_sump_digital_rle( self, key_list = [ (hub,pod) ] );
+    populate_signal_values_from_samples( self, dirty_only = True );
 
   self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright+"");
   self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
   self.pygame.event.pump();
   return;
 
-# Called by cmd_save_pza()
+# Called by cmd_save_pza() and sump_download_capture()
 def download_rle_ondemand_all( self ):
   log( self,[ "download_rle_ondemand_all()"]);
   start_time = self.pygame.time.get_ticks();
-  filename = "sump_rle_ram.txt";
-  from os import path;
-  file_path = os.path.abspath( self.vars["sump_path_ram"] );
-  filename  = os.path.join( file_path, filename );
-  rle_ram_list = file2list( filename );
   rle_ram_updated = False;
-  spinner = "|";
+  hub_pod_list = [];
   for (i,each_pod_list) in enumerate( self.sump.rle_hub_pod_list ):
     for (j,each_pod) in enumerate( each_pod_list ):
       log( self,[ "RLE Hub,Pod List : %d,%d %s" % ( i,j,each_pod) ]);
-      txt = "(%d,%d) " % ( i,j );
-      spinner = rotate_spinner( spinner );
-      self.pygame.display.set_caption(self.name+" "+self.vers+" "+self.copyright+" Downloading "+txt+spinner);
-      self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
-      self.pygame.event.pump();
-      new_rle_ram_list = sump_rlepod_download(self, hub_num=i, pod_num=j,
-                                               rle_ram_list=rle_ram_list );
-      if new_rle_ram_list != None:
-        rle_ram_list = new_rle_ram_list;
-        rle_ram_updated = True;
+      hub_pod_list += [ (i,j) ];
+  new_pod_dict = sump_rlepod_download_all( self, hub_pod_list, self.rle_ram_dict );
+  if new_pod_dict != None:
+    rle_ram_updated = True;
 
-  # Generate a new rle_samples file if the rle_ram file changed
+  # Decode only the Pods that changed in the RLE RAM image
   if rle_ram_updated == True:
-    list2file( filename, rle_ram_list );
-    file_in  = "sump_rle_ram.txt";
-    file_out = "sump_rle_samples.txt";
-    log( self,[ "Changes to %s" % file_in ]);
-    log( self,[ "Updating %s" % file_out ]);
-    create_sump_digital_rle(self,  file_in, file_out );
+    self.rle_ram_dict.update( new_pod_dict );
+    self.rle_ram_stale = True;
+    create_sump_digital_rle( self, key_list = list( new_pod_dict ) );
 
   self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright);
   self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
   self.pygame.event.pump();
-  populate_signal_values_from_samples( self );
   stop_time = self.pygame.time.get_ticks();
   delta_time = stop_time - start_time;
   log( self, ["download_rle_ondemand_all() : Completed in %d ms.\n" % delta_time]);
   return;
 
+# On-demand downloads only change rle_ram_dict in memory. Write it out to
+# sump_rle_ram.txt once, before a Pizza save or on shutdown.
+def rle_ram_save( self ):
+  if not self.rle_ram_stale:
+    return;
+  file_path = os.path.abspath( self.vars["sump_path_ram"] );
+  filename  = os.path.join( file_path, "sump_rle_ram.txt" );
+  list2file( filename, rle_ram_join( self.rle_ram_dict ) );
+  log( self,[ "Changes to %s" % filename ]);
+  self.rle_ram_stale = False;
+  return;
+
 
 ########################################################
 # assign the sample values to the signals that point to them
@@ -7800,23 +8098,22 @@ def download_rle_ondemand_all( self ):
 #   1) from sump_download 
 #   2) whenever a view is assigned
 #   3) whenever a Pizza is loaded
-def populate_signal_values_from_samples( self ):
+#   4) with dirty_only after an on-demand download, for just the RLE signals
+#      of the Pods in self.rle_capture.dirty_set
+def populate_signal_values_from_samples( self, dirty_only = False ):
   log( self,["populate_signal_values()"]);
   self.pygame.display.set_caption(\
     self.name+" "+self.vers+" "+self.copyright+" populate_signal_values_from_samples()...");
   self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
-  f1 = "sump_ls_samples.txt";
   f2 = "sump_hs_samples.txt";
-  f3 = "sump_rle_samples.txt";
   file_path = os.path.abspath( self.vars["sump_path_ram"] );
-  fp1 = os.path.join( file_path, f1 );
   fp2 = os.path.join( file_path, f2 );
-  fp3 = os.path.join( file_path, f3 );
-# if ( os.path.exists( fp1 ) and os.path.exists( fp2 ) and os.path.exists( fp3 ) ):
+# if ( os.path.exists( fp1 ) and os.path.exists( fp2 ) ):
   if True:
-    create_signal_values_digital(self, f1, f2, f3 );
+    create_signal_values_digital(self, f2, dirty_only );
     inherit_sample_timing(self);
     identify_invalid_signals( self );
+    log( self, capture_memory_report( self ) );
     self.refresh_waveforms = True;
   self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright);
   self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
@@ -7824,6 +8121,46 @@ def populate_signal_values_from_samples( self ):
   return;
 
 
+########################################################
+# Bytes held by the decoded capture, per RLE Pod, for LS and for the signal
+# values. A buffer shared by several signals, like a Pod's time array, is
+# only counted once. Python ints in lists and tuples are counted at their
+# own size since that is what they cost.
+def capture_memory_report( self ):
+  seen = set();
+  def buf_bytes( obj ):
+    if obj == None or id( obj ) in seen:
+      return 0;
+    seen.add( id( obj ) );
+    rts = sys.getsizeof( obj );
+    if type( obj ) in [ list, tuple ]:
+      rts += sum( sys.getsizeof( each ) for each in obj if each != None );
+    return rts;
+
+  rts = ["capture_memory_report()"];
+  total = 0;
+  for key in self.rle_capture.pod_list:
+    pod = self.rle_capture.pod_dict[ key ];
+    pod_bytes = sum( buf_bytes( each ) for each in [ pod.state, pod.time_raw, pod.time, pod.data ] );
+    rts += ["  Hub-%d Pod-%d : %s samples %s bytes" % \
+      ( key[0], key[1], comma_separated( len( pod.state ) ), comma_separated( pod_bytes ) )];
+    total += pod_bytes;
+  ls = self.ls_capture;
+  ls_bytes = sum( buf_bytes( each ) for each in [ ls.state, ls.time, ls.digital ] + ls.analog_list );
+  rts += ["  LS : %s samples %s bytes" % \
+    ( comma_separated( len( ls.state ) ), comma_separated( ls_bytes ) )];
+  total += ls_bytes;
+  sig_bytes = 0;
+  sig_samples = 0;
+  for each_sig in self.signal_list:
+    sig_bytes += buf_bytes( each_sig.values ) + buf_bytes( each_sig.rle_time );
+    sig_samples += len( each_sig.values );
+  rts += ["  Signals : %s samples %s bytes" % \
+    ( comma_separated( sig_samples ), comma_separated( sig_bytes ) )];
+  total += sig_bytes;
+  rts += ["  Total : %s bytes" % comma_separated( total )];
+  return rts;
+
 ########################################################
 # Signals may have user_ctrl attributes that must match
 # the acquisition user_ctrl settings. 
@@ -7942,28 +8279,25 @@ def inherit_sample_timing( self ):
 # Unlikely, but safest to plan for it.
 def sump_read_config( self ):
   log( self,["sump_read_config()"]);
-  hwid_data       = self.sump.rd( self.sump.cmd_rd_hw_id_rev            )[0];
-  ana_ram_data    = self.sump.rd( self.sump.cmd_rd_ana_ram_width_len    )[0];
-  dig_ram_data    = self.sump.rd( self.sump.cmd_rd_dig_ram_width_len    )[0];
-  dig_freq_data   = self.sump.rd( self.sump.cmd_rd_dig_ck_freq          )[0];
-  tick_freq_data  = self.sump.rd( self.sump.cmd_rd_tick_freq            )[0];
-  tick_divisor    = self.sump.rd( self.sump.cmd_wr_tick_divisor         )[0];
-  ana_first_ptr   = self.sump.rd( self.sump.cmd_rd_ana_first_sample_ptr )[0];
-  dig_first_ptr   = self.sump.rd( self.sump.cmd_rd_dig_first_sample_ptr )[0];
-  ana_post_trig   = self.sump.rd( self.sump.cmd_wr_ana_post_trig_len    )[0];
-  dig_post_trig   = self.sump.rd( self.sump.cmd_wr_dig_post_trig_len    )[0];
-  user_ctrl       = self.sump.rd( self.sump.cmd_wr_user_ctrl            )[0];
+  s = self.sump;
+  for each in [ s.cmd_rd_hw_id_rev, s.cmd_rd_ana_ram_width_len,
+                s.cmd_rd_dig_ram_width_len, s.cmd_rd_dig_ck_freq,
+                s.cmd_rd_tick_freq, s.cmd_wr_tick_divisor,
+                s.cmd_rd_ana_first_sample_ptr, s.cmd_rd_dig_first_sample_ptr,
+                s.cmd_wr_ana_post_trig_len, s.cmd_wr_dig_post_trig_len,
+                s.cmd_wr_user_ctrl, s.cmd_wr_record_config,
+                s.cmd_rd_record_profile, s.cmd_wr_trig_type,
+                s.cmd_wr_trig_digital_field, s.cmd_wr_trig_analog_field,
+                s.cmd_wr_trig_delay, s.cmd_wr_trig_nth,
+                s.cmd_rd_trigger_src, s.cmd_rd_view_rom_kb ]:
+    s.q_rd( each );
+  ( hwid_data, ana_ram_data, dig_ram_data, dig_freq_data, tick_freq_data,
+    tick_divisor, ana_first_ptr, dig_first_ptr, ana_post_trig, dig_post_trig,
+    user_ctrl, ana_rec_config, ana_rec_profile, trig_type, trig_dig_field,
+    trig_ana_field, trig_delay, trig_nth, trig_src_core, view_rom_kb ) = \
+    [ each[0] for each in s.q_run() ];
 # user_stim       = self.sump.rd( self.sump.cmd_wr_user_stim            )[0];
-  ana_rec_config  = self.sump.rd( self.sump.cmd_wr_record_config        )[0];
-  ana_rec_profile = self.sump.rd( self.sump.cmd_rd_record_profile       )[0];
-  trig_type       = self.sump.rd( self.sump.cmd_wr_trig_type            )[0];
-  trig_dig_field  = self.sump.rd( self.sump.cmd_wr_trig_digital_field   )[0];
-  trig_ana_field  = self.sump.rd( self.sump.cmd_wr_trig_analog_field    )[0];
-  trig_delay      = self.sump.rd( self.sump.cmd_wr_trig_delay           )[0];
-  trig_nth        = self.sump.rd( self.sump.cmd_wr_trig_nth             )[0];
 # rle_pod_cnt     = self.sump.rd( self.sump.cmd_rd_rle_hub_config       )[0];
-  trig_src_core   = self.sump.rd( self.sump.cmd_rd_trigger_src          )[0];
-  view_rom_kb     = self.sump.rd( self.sump.cmd_rd_view_rom_kb          )[0];
 
   # New 2023.11.14
   a = self.sump.cfg_dict;
@@ -8050,8 +8384,10 @@ def sump_ram2file( self, ram_type, file_name ):
   file_name = os.path.join( file_path, file_name );
 
   if ram_type == "rle":
-    time_sample_list = sump_rleram2file( self );
-    list2file( file_name, time_sample_list );
+    rle_ram_list = sump_rleram2file( self );
+    list2file( file_name, rle_ram_list );
+    self.rle_ram_dict = rle_ram_split( rle_ram_list );
+    self.rle_ram_stale = False;
 #   hexlist2file( file_name, time_sample_list );
     return;
 
@@ -8127,68 +8463,150 @@ def sump_rlepod_placeholder( self, hub_num, pod_num ):
   return pod_txt_list;
 
 ########################################################
-# Given the Hub and Pod number, download a single RLE Pod if needed
-# If it isn't needed, return None
-def sump_rlepod_download( self, hub_num, pod_num, rle_ram_list ):
-  start_time = self.pygame.time.get_ticks();
-  log( self,["sump_rlepod_download(%d:%d)" % ( hub_num, pod_num) ]);
-  self.pygame.display.set_caption(\
-    self.name+" "+self.vers+" "+self.copyright+" sump_rlepod_download(%d:%d)" % (hub_num,pod_num) );
-  self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
-  self.pygame.event.pump();
-  need_to_download = False;
+# The RLE RAM image is held as one segment of lines per Pod, keyed (hub,pod)
+# in image order, so a single Pod can be found and replaced without walking
+# or copying the whole capture. Any lines ahead of the first Pod are kept
+# under key None.
+def rle_ram_split( rle_ram_list ):
+  seg_list = [ [] ];
+  for each_line in rle_ram_list:
+    if each_line[0:16] == "#[rle_pod_start]":
+      seg_list.append( [] );
+    seg_list[-1].append( each_line );
+  rts = {};
+  if len( seg_list[0] ) != 0:
+    rts[ None ] = seg_list[0];
+  for (i,each_seg) in enumerate( seg_list[1:] ):
+    hub_i = None;
+    pod_i = None;
+    for each_line in each_seg:
+      words = " ".join(each_line.split()).split(' ') + [None] * 5;
+      if words[1] == "rle_hub_instance":
+        hub_i = int( words[3], 10 );
+      elif words[1] == "rle_pod_instance":
+        pod_i = int( words[3], 10 );
+      if hub_i != None and pod_i != None:
+        break;
+    if hub_i == None or pod_i == None or rts.get( (hub_i,pod_i) ) != None:
+      rts[ ( None, i ) ] = each_seg;# Malformed, but keep it in the image
+    else:
+      rts[ (hub_i,pod_i) ] = each_seg;
+  return rts;
+
+# Flatten the Pod segments back to lines
+def rle_ram_join( rle_ram_dict ):
+  rts = [];
+  for each_seg in rle_ram_dict.values():
+    rts += each_seg;
+  return rts;
+
+########################################################
+# Scan the rle_ram_list once for every "#[download_needed]" placeholder and
+# every "#[download_partial]" Pod that is missing some data pages.
+# Returns a dictionary of (start,stop) line spans to replace for key (hub,pod)
+def sump_rlepod_find( rle_ram_list ):
+  rts = {};
   hub_i = None;
   pod_i = None;
-  insert_line = None;
+  partial_i = None;
   for (i,each_line) in enumerate( rle_ram_list ):
+    if each_line[0:1] != "#":
+      continue;
     words = " ".join(each_line.split()).split(' ') + [None] * 5;
     if words[1] == "rle_hub_instance":
       hub_i = int( words[3], 10 );
     if words[1] == "rle_pod_instance":
       pod_i = int( words[3], 10 );
     if words[0] == "#[download_needed]":
-      if hub_i == hub_num and pod_i == pod_num:
-        need_to_download = True;
-        insert_line = i;
-        log( self,["download_needed for (%d:%d)" % ( hub_num,pod_num) ]);
+      rts[ (hub_i,pod_i) ] = (i,i+1);
+    if words[0] == "#[download_partial]":
+      partial_i = i;
     if words[0] == "#[rle_pod_stop]":
+      if partial_i != None:
+        rts[ (hub_i,pod_i) ] = (partial_i,i);
       hub_i = None;
       pod_i = None;
+      partial_i = None;
+  return rts;
 
-  if need_to_download == False:
+########################################################
+# Return the set of DWORD pages of a Pod's RAM that must be downloaded.
+# The pages holding the state and timestamp bits are always needed. With
+# page_select, data pages are limited to bits used by applied signals.
+def sump_rlepod_pages_needed( self, hub_num, pod_num, hdr, page_select ):
+  num_dwords = hdr["num_dwords"];
+  if not page_select:
+    return set( range( 0, num_dwords ) );
+  rts = set( range( hdr["data_bits"] // 32, num_dwords ) );
+  for each_sig in self.signal_list:
+    if each_sig.source == None or each_sig.rle_masked:
+      continue;
+    bit_rip = rle_source_bit_rip( self, each_sig.source );
+    if bit_rip != None:
+      ( hub_i, pod_i, bit_top, bit_bot ) = bit_rip;
+      if hub_i == hub_num and pod_i == pod_num:
+        for i in range( bit_bot // 32, ( bit_top // 32 ) + 1 ):
+          if i < num_dwords:
+            rts.add( i );
+  return rts;
+
+########################################################
+# Parse "digital_rle[0][1][3:0]" or "digital_rle[hub_name][pod_name][3]"
+# Returns (hub,pod,bit_top,bit_bot) or None if not an RLE source
+def rle_source_bit_rip( self, sig_source ):
+  if "digital_rle" not in sig_source:
+    return None;
+  a = sig_source;
+  a = a.replace("["," ");
+  a = a.replace("]"," ");
+  a = a.replace(":"," ");
+  words = " ".join(a.split()).split(' ') + [None] * 5;
+  key = "%s.%s" % ( words[1], words[2] );
+  try:
+    if self.sump.rle_hub_pod_dict.get(key) != None:
+      ( hub_i, pod_i ) = self.sump.rle_hub_pod_dict[ key ];
+    else:
+      hub_i = int( words[1], 10 );
+      pod_i = int( words[2], 10 );
+    bit_top = int( words[3], 10 );
+    if words[4] != None:
+      bit_bot = int( words[4], 10 );
+    else:
+      bit_bot = bit_top;
+  except:
     return None;
+  return ( hub_i, pod_i, bit_top, bit_bot );
 
-  new_rle_ram_list = rle_ram_list[0:insert_line] + ["# New Line"] + rle_ram_list[insert_line+1:];
+########################################################
+# Read the Hub and Pod registers that describe a Pod's RAM as one queued
+# request. Returns a dictionary of settings including the "# name = value"
+# header lines, or None if the Pod has nothing to download.
+def sump_rlepod_rd_header( self, hub_num, pod_num, rle_bit_mask ):
+  s = self.sump;
+  s.q_wr( s.cmd_wr_rle_pod_inst_addr, (hub_num<<16)+(0<<8)+(0x00<<0) );
+  s.q_rd( s.cmd_rd_rle_hub_ck_freq );
+  s.q_rd( s.cmd_rd_rle_pod_trigger_src );
+  for each in [ s.rle_pod_addr_pod_hw_cfg, s.rle_pod_addr_pod_ram_cfg,
+                s.rle_pod_addr_trigger_latency, s.rle_pod_addr_pod_user_ctrl,
+                s.rle_pod_addr_pod_trigger_src ]:
+    s.q_rd_pod( hub=hub_num,pod=pod_num,reg=each );
+  ( hub_ck_freq, trig_src_hub, pod_hw_cfg, pod_ram_cfg, pod_trig_lat,
+    pod_user_ctrl, trig_src_pod ) = [ each[0] for each in s.q_run() ];
+  hub_ck_freq_mhz = float( float(hub_ck_freq) / float( 2**20 ) );
 
-  pod_txt_list = [];
-
-  self.bd.wr( self.sump.addr_ctrl, [ 0x32 ] );
-  self.bd.wr( self.sump.addr_data, [ (hub_num<<16)+(0<<8)+(0x00<<0) ] );
-  hub_ck_freq = self.sump.rd( self.sump.cmd_rd_rle_hub_ck_freq)[0];
-  hub_ck_freq_mhz = float( float(hub_ck_freq) / float( 2**20 ) );
-
-  trig_src_hub = self.sump.rd( self.sump.cmd_rd_rle_pod_trigger_src)[0];
-
-  pod_hw_cfg    = self.sump.rd_pod( hub=hub_num,pod=pod_num,reg=self.sump.rle_pod_addr_pod_hw_cfg )[0];
-  pod_hw_rev    = ( pod_hw_cfg & 0xFF000000 ) >> 24;
-  pod_en        = ( pod_hw_cfg & 0x00000001 ) >> 0;
+  pod_hw_rev    = ( pod_hw_cfg & 0xFF000000 ) >> 24;
+  pod_en        = ( pod_hw_cfg & 0x00000001 ) >> 0;
 
   if pod_en == 0:
     return None;
 
-  pod_ram_cfg   = self.sump.rd_pod( hub=hub_num,pod=pod_num,reg=self.sump.rle_pod_addr_pod_ram_cfg )[0];
   pod_num_addr_bits = ( pod_ram_cfg & 0x000000FF ) >> 0;
   pod_num_data_bits = ( pod_ram_cfg & 0x00FFFF00 ) >> 8;
   pod_num_ts_bits   = ( pod_ram_cfg & 0xFF000000 ) >> 24;
 
-  pod_trig_lat  = self.sump.rd_pod( hub=hub_num,pod=pod_num,reg=self.sump.rle_pod_addr_trigger_latency )[0];
   pod_trig_lat_core_cks = ( pod_trig_lat & 0x000000FF ) >> 0;
   pod_trig_lat_mosi_cks = ( pod_trig_lat & 0x0000FF00 ) >> 8;
   pod_trig_lat_miso_cks = ( pod_trig_lat & 0x00FF0000 ) >> 16;
-
-  pod_user_ctrl = self.sump.rd_pod( hub=hub_num,pod=pod_num,reg=self.sump.rle_pod_addr_pod_user_ctrl)[0];
-
-  trig_src_pod  = self.sump.rd_pod( hub=hub_num,pod=pod_num,reg=self.sump.rle_pod_addr_pod_trigger_src)[0];
 # log( self,["Trigger Source : Hub-%d = %08x and Pod-%d = %08x" % ( hub_num, trig_src_hub, pod_num, trig_src_pod)]);
 
   log( self,[ "pod_hw_cfg  is %08x" % pod_hw_cfg]);
@@ -8196,21 +8614,13 @@ def sump_rlepod_download( self, hub_num, pod_num, rle_ram_list ):
   log( self,[ "  pod_num_addr_bits is %d" % pod_num_addr_bits]);
   log( self,[ "  pod_num_data_bits is %d" % pod_num_data_bits]);
   log( self,[ "  pod_num_ts_bits is %d" % pod_num_ts_bits ]);
-  
 
   if pod_num_addr_bits == 0:
     return None;
-  
+
   rle_state_bits = 2;# 0=Invalid,1=Pre-Trig,2=Trigger,3=Post-Trigger
   rle_total_bits = rle_state_bits + pod_num_ts_bits + pod_num_data_bits;
   rle_ram_length = 2**pod_num_addr_bits;
-  rle_timestamp_bits = pod_num_ts_bits;
-
-
-  # TODO: Don't recalulate this every time. Use a stored version
-  rle_mask_hash = proc_rle_mask(self, self.sump.rle_hub_pod_list );
-# (rle_bit_mask,rle_bulk_mask) = rle_mask_hash[(hub_num,pod_num)];
-  (rle_bit_mask )              = rle_mask_hash[(hub_num,pod_num)];
 
   a = [];
 # a+=[ ("#[rle_pod_start]"                                   )];
@@ -8236,170 +8646,392 @@ def sump_rlepod_download( self, hub_num, pod_num, rle_ram_list ):
   means = time.ctime(now)
   a+=[ ("# download_time    = %08x"   % (int( now ) ) )];
 
-  pod_txt_list += a;
-
-  if True :
-#   if pod_num_data_bits % 4 != 0:
-#     log( self, ["ERROR: invalid data bit width of %d for RLE Pod" % (pod_num_data_bits)]);
+  # Calculate how many DWORD pages need to be read to get total bit count
+  num_dwords = rle_total_bits // 32;
+  if rle_total_bits % 32 != 0: num_dwords += 1;
 
-    # Calculate how many DWORD pages need to be read to get total bit count
-    num_dwords = rle_total_bits // 32;
-    if rle_total_bits % 32 != 0: num_dwords += 1;
+  log( self,[ "rle_total_bits = %d" % rle_total_bits]);
+  log( self,[ "num_dwords     = %d" % num_dwords]);
 
-    log( self,[ "rle_total_bits = %d" % rle_total_bits]);
-    log( self,[ "num_dwords     = %d" % num_dwords]);
-
-    # RAM is DWORD paged in width. Since the address is autoincremented
-    # after each read, read entire ram length one dword page at a time
-    # and then have python combine the lists together using zip.
-    list_of_lists = [];
-    for j in range( 0, num_dwords ):
-      self.pygame.display.set_caption(\
-        self.name+" "+self.vers+" "+self.copyright+" Downloading RLE Hub-%d Pod-%d Page-%d of %d" \
-           % ( hub_num,pod_num,j,(num_dwords-1) ) );
-      self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
+  hdr = {};
+  hdr["txt_list"]       = a;
+  hdr["data_bits"]      = pod_num_data_bits;
+  hdr["timestamp_bits"] = pod_num_ts_bits;
+  hdr["total_bits"]     = rle_total_bits;
+  hdr["ram_length"]     = rle_ram_length;
+  hdr["num_dwords"]     = num_dwords;
+  return hdr;
 
+########################################################
+# RAM is DWORD paged in width. Since the address is autoincremented
+# after each read, read entire ram length one dword page at a time.
+# The pages in page_list are queued and read back as one request.
+# If range_list of (start,stop) addresses is given, only those parts of
+# each page are read and the rest is filled with 0 ( Invalid ).
+# A page that comes back short ( failed transaction ) is read again from its
+# page pointer. Pages that still fail are left out, so the Pod is partial.
+# Returns a dictionary of DWORD lists where key is page number.
+def sump_rlepod_rd_pages( self, hub_num, pod_num, hdr, page_list, range_list = None ):
+  rle_ram_length = hdr["ram_length"];
+  if range_list == None:
+    range_list = [ ( 0, rle_ram_length ) ];
+  rts = {};
+  for attempt in range( 0, 3 ):
+    todo_list = [ j for j in page_list if rts.get( j ) == None ];
+    if len( todo_list ) == 0:
+      break;
+    for j in todo_list:
       # Set the Page to read out RLE samples, timestamps and 2bit codes
       log( self,[ "sump_rlepod_download() : Hub = %d : Pod = %d : Page = %d :  RAM Length = %d " % \
         ( hub_num, pod_num, j, rle_ram_length )]);
-      self.sump.wr_pod( hub=hub_num,pod=pod_num,
-                        reg=self.sump.rle_pod_addr_ram_page_ptr, data=((j<<20)+0x0000) );
-      self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
-      dword_list = self.sump.rd_pod(hub=hub_num,pod=pod_num,
-                                    reg=self.sump.rle_pod_addr_ram_data,num_dwords=rle_ram_length);
-#     self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
-#     print("len(dword_list) = %d " % len( dword_list ) );
-#     if ( hub_num == 0 and pod_num == 0 ):
-#       list2file( ("j%d.txt"%(j)) , ["%08x" % each for each in dword_list ] );
-      list_of_lists += [ dword_list ];
-
-    self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright );
-    self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
-    self.pygame.event.pump();
+      for ( start, stop ) in range_list:
+        self.sump.q_wr_pod( hub=hub_num,pod=pod_num,
+                            reg=self.sump.rle_pod_addr_ram_page_ptr, data=((j<<20)+start) );
+        self.sump.q_rd_pod( hub=hub_num,pod=pod_num,
+                            reg=self.sump.rle_pod_addr_ram_data,num_dwords=(stop-start));
+    rd_list = self.sump.q_run();
+    for (i,j) in enumerate( todo_list ):
+      part_list = rd_list[ i*len(range_list) : (i+1)*len(range_list) ];
+      if [ len( each ) for each in part_list ] != [ stop-start for ( start, stop ) in range_list ]:
+        log( self,[ "WARNING: sump_rlepod_download() : Hub = %d : Pod = %d : Page = %d read short" % \
+          ( hub_num, pod_num, j )]);
+        continue;
+      if range_list == [ ( 0, rle_ram_length ) ]:
+        rts[j] = part_list[0];
+        continue;
+      dword_list = [ 0x00000000 ] * rle_ram_length;
+      for (k,( start, stop )) in enumerate( range_list ):
+        dword_list[start:stop] = part_list[k];
+      rts[j] = dword_list;
+  return rts;
 
-    # Now reorder so that the DWORDs from each RAM address are together
-    # Only store the hex nibbles that have info
-    ram_list = list(zip( *list_of_lists ));
-    dword_hex_list = [];
-    for dword_list in ram_list:
-      txt = "";
-      for each in reversed(dword_list):
-        txt = txt + "%08x" % each;
-      num_nibbles = rle_total_bits // 4;
-      if rle_total_bits % 4 != 0: num_nibbles += 1;
-      txt = txt[-num_nibbles:];
-      data_nibbles = pod_num_data_bits // 4;
-
-
-# Pre 2023.11.30 scheme where data had to be on nibble boundaries
-#     # Data has to fall on nibble boundaries but timestamp and state bits 
-#     # can span across nibbles, so do things the hard math way here.
-#     data_txt = txt[-data_nibbles:];
-#     time_txt = txt[:-data_nibbles];
-#     num_nibbles = rle_timestamp_bits // 4;
-#     if rle_timestamp_bits % 4 != 0: num_nibbles += 1;
-#     time_int = int( time_txt, 16 );
-#     state_int = time_int >> rle_timestamp_bits;
-#     time_int = time_int & ((2**rle_timestamp_bits)-1);
-#     time_txt = "%016x" % time_int;
-#     time_txt = time_txt[-num_nibbles:];
-#     state_txt = "%01x" % state_int;
-#     txt = state_txt + " " + time_txt + " " + data_txt;
-#     dword_hex_list += [ txt ];
-
-      # New 2023.11.30 scheme allows odd number of data bits
-      # First separate data from code+timestamp bits
-      # Note, this is done in ASCII hex space and not numerically
-      # as RLE pods can be 8192 bits wide. 2^8192 is a REALLY large number.
-      extra_bits = 0;
-      if pod_num_data_bits % 4 != 0:
-        extra_bits = pod_num_data_bits % 4;
-        extra_nibble = txt[-data_nibbles-1];
-        if   extra_bits == 1 : bit_and = 0x1; bit_mask = 0xE;
-        elif extra_bits == 2 : bit_and = 0x3; bit_mask = 0xC;
-        elif extra_bits == 3 : bit_and = 0x7; bit_mask = 0x8;
-        # print("Extra bits %d : Extra Nibble %s" % ( extra_bits, extra_nibble ) )
-        nib_data = "%01x" % ( int( extra_nibble, 16 ) & bit_and  );
-        nib_time = "%01x" % ( int( extra_nibble, 16 ) & bit_mask );
-        time_txt = txt[:-data_nibbles-1]+nib_time;
-        data_txt = nib_data + txt[-data_nibbles:];
+########################################################
+# The 2bit state code is the MSBs of each RAM entry. Return the page(s)
+# holding it. 2 pages only when the state code straddles a DWORD boundary.
+def sump_rlepod_state_pages( hdr ):
+  rle_total_bits = hdr["total_bits"];
+  return sorted( set( [ (rle_total_bits-2) // 32, (rle_total_bits-1) // 32 ] ) );
+
+########################################################
+# Given the state page(s), return a list of (start,stop) RAM address ranges
+# holding valid ( non-zero state ) entries. Short runs of invalid entries
+# between valid ones are kept so that the ranges become fewer, longer bursts.
+def sump_rlepod_valid_ranges( hdr, page_dict, gap_len = 16 ):
+  rle_total_bits = hdr["total_bits"];
+  state_pages = sump_rlepod_state_pages( hdr );
+  lsb = ( rle_total_bits - 2 ) - 32 * state_pages[0];
+  lo_list = page_dict[ state_pages[0] ];
+  if len( state_pages ) == 2:
+    hi_list = page_dict[ state_pages[1] ];
+  else:
+    hi_list = [ 0 ] * len( lo_list );
+  rts = [];
+  for (i,( lo, hi )) in enumerate( zip( lo_list, hi_list ) ):
+    if ( ( ( hi << 32 ) | lo ) >> lsb ) & 0x3 != 0:
+      if len( rts ) != 0 and i - rts[-1][1] <= gap_len:
+        rts[-1] = ( rts[-1][0], i+1 );
       else:
-        time_txt = txt[:-data_nibbles];
-        data_txt = txt[-data_nibbles:];
-
-      # Now seprate code from timestamp bits 
-      num_nibbles = rle_timestamp_bits // 4;
-      if rle_timestamp_bits % 4 != 0: num_nibbles += 1;
-      time_int = int( time_txt, 16 );
-      time_int = time_int >> extra_bits;# Shift off 1-3 data bits
-
-      state_int = time_int >> rle_timestamp_bits;
-      time_int = time_int & ((2**rle_timestamp_bits)-1);
-      time_txt = "%016x" % time_int;
-      time_txt = time_txt[-num_nibbles:];
-      state_txt = "%01x" % state_int;
-      txt = state_txt + " " + time_txt + " " + data_txt;
-      dword_hex_list += [ txt ];
-
-
-#   list2file("foo1.txt", dword_hex_list );
-    dword_hex_list = rle_rotate(self, dword_hex_list );
-#   list2file("foo2.txt", dword_hex_list );
-    dword_hex_list = rle_time_roll( dword_hex_list, rle_timestamp_bits );
-#   list2file("foo3.txt", dword_hex_list );
-    dword_hex_list = rle_time_cull( self, dword_hex_list );
-#   list2file("foo4.txt", dword_hex_list );
-    pod_txt_list += dword_hex_list;
-# else:
-#   pod_txt_list +=[ ("#[download_needed]")];
-# pod_txt_list +=[ ("#[rle_pod_stop]")];
+        rts += [ ( i, i+1 ) ];
+  return rts;
+
+########################################################
+# Bring a Pod's raw RAM pages in self.sump_rle_page_dict up to date with the
+# pages currently needed, reading the Pod header the first time only.
+# Returns the (hdr,page_dict) entry or None if the Pod has nothing.
+def sump_rlepod_fetch( self, hub_num, pod_num, rle_bit_mask, page_select ):
+  entry = self.sump_rle_page_dict.get( (hub_num,pod_num) );
+  if entry == None:
+    hdr = sump_rlepod_rd_header( self, hub_num, pod_num, rle_bit_mask );
+    if hdr == None:
+      return None;
+    entry = ( hdr, {} );
+    self.sump_rle_page_dict[ (hub_num,pod_num) ] = entry;
+  ( hdr, page_dict ) = entry;
+  need = sump_rlepod_pages_needed( self, hub_num, pod_num, hdr, page_select );
+  missing = sorted( need - set( page_dict ) );
+  if len( missing ) != 0:
+    log( self,[ "sump_rlepod_fetch(%d:%d) : Pages %s of %d" % \
+      ( hub_num, pod_num, missing, hdr["num_dwords"] ) ]);
+    # Sparse is two phase. Read the state page first and then only the
+    # valid address ranges of every other page.
+    range_list = None;
+    if int( self.vars["sump_download_rle_sparse"], 10 ) == 1:
+      if hdr.get("valid_ranges") == None:
+        state_pages = sump_rlepod_state_pages( hdr );
+        page_dict.update( sump_rlepod_rd_pages( self, hub_num, pod_num, hdr,
+          [ each for each in state_pages if page_dict.get( each ) == None ] ) );
+        if len( [ each for each in state_pages if page_dict.get( each ) == None ] ) != 0:
+          return entry;# No state page, so no valid ranges to read yet
+        hdr["valid_ranges"] = sump_rlepod_valid_ranges( hdr, page_dict );
+        valid_cnt = sum( [ stop - start for ( start, stop ) in hdr["valid_ranges"] ] );
+        log( self,[ "sump_rlepod_fetch(%d:%d) : %d of %d entries in %d valid ranges" % \
+          ( hub_num, pod_num, valid_cnt, hdr["ram_length"], len( hdr["valid_ranges"] ) ) ]);
+        missing = [ each for each in missing if page_dict.get( each ) == None ];
+      range_list = hdr["valid_ranges"];
+    if len( missing ) != 0:
+      page_dict.update( sump_rlepod_rd_pages( self, hub_num, pod_num, hdr, missing, range_list ) );
+  return entry;
+
+########################################################
+# Unpack the DWORD pages of one Pod into state, timestamp and data columns
+# of ints in RAM address order. Pages not in page_dict unpack as 0.
+# A RAM entry is { state[1:0], timestamp[ts-1:0], data[n-1:0] } and pods can
+# be 8192 bits wide, so the fields are pulled out with shifts and masks on
+# a 2-D uint32 NumPy array of the whole Pod when NumPy is available, else one
+# Python int per entry. Any bits above state up to the nibble boundary end up
+# in state as they always did in the "state time data" hex lines.
+def sump_rlepod_unpack( hdr, page_dict ):
+  import struct;
+  data_bits  = hdr["data_bits"];
+  ts_bits    = hdr["timestamp_bits"];
+  ram_length = hdr["ram_length"];
+  num_dwords = hdr["num_dwords"];
+  num_nibbles = hdr["total_bits"] // 4;
+  if hdr["total_bits"] % 4 != 0: num_nibbles += 1;
+  state_bits = 4*num_nibbles - ts_bits - data_bits;
+  field_list = [ ( data_bits+ts_bits, state_bits ), ( data_bits, ts_bits ), ( 0, data_bits ) ];
+
+  if numpy != None:
+    pages = numpy.zeros( ( ram_length, num_dwords ), dtype=numpy.uint32 );
+    for ( j, dword_list ) in page_dict.items():
+      pages[:,j] = dword_list;
+    rts = [];
+    row_list = None;
+    for ( lsb, width ) in field_list:
+      if width <= 64:
+        rts += [ rle_field( pages, lsb, width ).tolist() ];
+      else:
+        # Too wide for uint64 so make one Python int per RAM entry
+        if row_list == None:
+          raw = pages.astype("<u4").tobytes();
+          n = 4*num_dwords;
+          row_list = [ int.from_bytes( raw[i:i+n], "little" ) for i in range( 0, len(raw), n ) ];
+        mask = ( 1 << width ) - 1;
+        rts += [ [ ( each >> lsb ) & mask for each in row_list ] ];
+    return rts;
+
+  blank = [ 0x00000000 ] * ram_length;
+  list_of_lists = [ page_dict.get( j, blank ) for j in range( 0, num_dwords ) ];
+  fmt = "<%dI" % num_dwords;
+  row_list = [ int.from_bytes( struct.pack( fmt, *each ), "little" ) for each in zip( *list_of_lists ) ];
+  rts = [];
+  for ( lsb, width ) in field_list:
+    mask = ( 1 << width ) - 1;
+    rts += [ [ ( each >> lsb ) & mask for each in row_list ] ];
+  return rts;
+
+# Return bits [lsb+width-1:lsb] of every row of a 2-D uint32 page array as
+# uint64. Fields may straddle DWORD pages.
+def rle_field( pages, lsb, width ):
+  rts = numpy.zeros( pages.shape[0], dtype=numpy.uint64 );
+  if width == 0:
+    return rts;
+  for k in range( lsb // 32, ( ( lsb + width - 1 ) // 32 ) + 1 ):
+    col = pages[:,k].astype( numpy.uint64 );
+    shift = 32*k - lsb;
+    if shift >= 0:
+      rts |= col << numpy.uint64( shift );
+    else:
+      rts |= col >> numpy.uint64( -shift );
+  if width < 64:
+    rts &= numpy.uint64( ( 1 << width ) - 1 );
+  return rts;
+
+########################################################
+# Convert the DWORD pages of one Pod into "state time data" hex lines.
+# There is no HW or pygame access in here, so it may run on a worker.
+# Data nibbles of pages not downloaded are "x" and the Pod is then marked
+# "#[download_partial]" so that the rest can be fetched later. Warnings go
+# to log_list instead of the log when given one.
+def sump_rlepod_decode( self, hdr, page_dict, log_list = None ):
+  pod_num_data_bits  = hdr["data_bits"];
+  rle_timestamp_bits = hdr["timestamp_bits"];
+  if len( page_dict ) < hdr["num_dwords"]:
+    partial_list = [ "#[download_partial]" ];
+  else:
+    partial_list = [];
+
+  ( state_list, time_list, data_list ) = sump_rlepod_unpack( hdr, page_dict );
+
+  data_nibbles = pod_num_data_bits // 4;
+  if pod_num_data_bits % 4 != 0: data_nibbles += 1;
+
+  # Nibble spans of the data text that fall in pages not downloaded
+  x_span_list = [];
+  for j in range( 0, hdr["num_dwords"] ):
+    if page_dict.get( j ) == None and 8*j < data_nibbles:
+      x_span_list += [ ( data_nibbles - min( 8*j+8, data_nibbles ), data_nibbles - 8*j ) ];
+
+  # Rolled timestamps have one more bit than the hardware counter
+  ( addr_list, time_list ) = rle_rotate_roll_cull( self, state_list, time_list, rle_timestamp_bits,
+                                                   log_list );
+  time_nibbles = ( rle_timestamp_bits + 1 ) // 4;
+  if ( rle_timestamp_bits + 1 ) % 4 != 0: time_nibbles += 1;
+
+  dword_hex_list = [];
+  for ( i, time_int ) in zip( addr_list, time_list ):
+    data_txt = "%0*x" % ( data_nibbles, data_list[i] );
+    for ( a, b ) in x_span_list:
+      data_txt = data_txt[:a] + "x"*(b-a) + data_txt[b:];# Page not downloaded
+    dword_hex_list += [ "%01x %0*x %s" % ( state_list[i], time_nibbles, time_int, data_txt ) ];
+  return partial_list + hdr["txt_list"] + dword_hex_list;
+
+# sump_rlepod_decode() for a worker of the RLE process pool, which has no
+# self to log to. Returns the decoded lines and any log lines.
+def sump_rlepod_decode_job( hdr, page_dict ):
+  log_list = [];
+  txt_list = sump_rlepod_decode( None, hdr, page_dict, log_list );
+  return ( txt_list, log_list );
 
-  new_rle_ram_list = rle_ram_list[0:insert_line] + pod_txt_list + rle_ram_list[insert_line+1:];
+########################################################
+# Given the Hub and Pod number, download a single RLE Pod if needed
+# Returns the Pod's new rle_ram_dict segment. If it isn't needed, return None
+def sump_rlepod_download( self, hub_num, pod_num, rle_ram_dict, page_select = False ):
+  start_time = self.pygame.time.get_ticks();
+  log( self,["sump_rlepod_download(%d:%d)" % ( hub_num, pod_num) ]);
+  self.pygame.display.set_caption(\
+    self.name+" "+self.vers+" "+self.copyright+" sump_rlepod_download(%d:%d)" % (hub_num,pod_num) );
+  self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
+  self.pygame.event.pump();
+  seg_list = rle_ram_dict.get( (hub_num,pod_num), [] );
+  span = sump_rlepod_find( seg_list ).get( (hub_num,pod_num) );
+  if span == None:
+    return None;
+  log( self,["download_needed for (%d:%d)" % ( hub_num,pod_num) ]);
+
+  rle_mask_hash = proc_rle_mask(self, self.sump.rle_hub_pod_list );
+  entry = self.sump_rle_page_dict.get( (hub_num,pod_num) );
+  if entry != None:
+    page_cnt = len( entry[1] );
+  else:
+    page_cnt = 0;
+  entry = sump_rlepod_fetch( self, hub_num, pod_num, rle_mask_hash[(hub_num,pod_num)], page_select );
+  if entry == None or len( entry[1] ) == page_cnt:
+    return None;# Nothing new was downloaded
+  ( hdr, page_dict ) = entry;
+  pod_txt_list = sump_rlepod_decode( self, hdr, page_dict );
+
+  ( start, stop ) = span;
+  new_seg_list = seg_list[0:start] + pod_txt_list + seg_list[stop:];
   stop_time = self.pygame.time.get_ticks();
   render_time = stop_time - start_time;
   log( self,["  download time = %d ms" % render_time ] );
-  return new_rle_ram_list;
+  return new_seg_list;
 
+########################################################
+# Download every Pod in hub_pod_list that is "#[download_needed]" or partial.
+# The Sump3 ctrl and data registers select one Hub,Pod and Page at a time,
+# so every Pod shares the one pipelined Backdoor session rather than racing
+# over several. Each Pod's pages land in their own buffer and are decoded
+# ( unpack, rotate, roll and cull ) by the RLE process pool while the next
+# Pod downloads. With sump_rle_decode_processes of 1 they go to worker
+# threads instead, which under the GIL only overlap the socket I/O. The
+# hardware thread lock is taken here unless the caller ( cmd_sump_download() )
+# already holds it. Returns None if no change, otherwise a dictionary of
+# new rle_ram_dict segments for each (hub,pod).
+def sump_rlepod_download_all( self, hub_pod_list, rle_ram_dict, page_select = False ):
+  import concurrent.futures;
+  line_dict = {};
+  for each in hub_pod_list:
+    span = sump_rlepod_find( rle_ram_dict.get( each, [] ) ).get( each );
+    if span != None:
+      line_dict[ each ] = span;
+  hub_pod_list = [ each for each in hub_pod_list if line_dict.get( each ) != None ];
+  if len( hub_pod_list ) == 0:
+    return None;
+  workers = max( 1, int( self.vars["sump_download_workers"], 10 ) );
+  rle_mask_hash = proc_rle_mask(self, self.sump.rle_hub_pod_list );
+  job_dict = {};
+  page_dict_dict = {};
+  spinner = "|";
+  lock_en = not self.thread_locked;
+  proc_pool = rle_process_pool( self, int( self.vars["sump_rle_decode_processes"], 10 ) );
+  with concurrent.futures.ThreadPoolExecutor( max_workers=workers ) as thread_pool:
+    pool = proc_pool or thread_pool;
+    if lock_en:
+      cmd_thread_lock(self);
+    try:
+      for (i,j) in hub_pod_list:
+        txt = "(%d,%d) " % ( i,j );
+        spinner = rotate_spinner( spinner );
+        self.pygame.display.set_caption(self.name+" "+self.vers+" "+self.copyright+" Downloading "+txt+spinner);
+        self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
+        self.pygame.event.pump();
+        log( self,["sump_rlepod_download(%d:%d)" % ( i, j ) ]);
+        entry = sump_rlepod_fetch( self, i, j, rle_mask_hash[(i,j)], page_select );
+        if entry != None:
+          ( hdr, page_dict ) = entry;
+          page_dict_dict[ (i,j) ] = ( hdr, dict( page_dict ) );
+          job_dict[ (i,j) ] = pool.submit( sump_rlepod_decode_job, *page_dict_dict[ (i,j) ] );
+    finally:
+      if lock_en:
+        cmd_thread_unlock(self);
+
+    # Splice each decoded Pod in place of its placeholder line span
+    if len( job_dict ) == 0:
+      return None;
+    rts = {};
+    for ( key, job ) in job_dict.items():
+      try:
+        ( txt_list, log_list ) = job.result();
+      except Exception as err:
+        log( self, ["WARNING: RLE decode of (%d:%d) failed in the pool. %s" % ( key[0], key[1], str( err ) ) ]);
+        rle_process_pool_close( self );
+        ( txt_list, log_list ) = sump_rlepod_decode_job( *page_dict_dict[ key ] );
+      log( self, log_list );
+      ( start, stop ) = line_dict[ key ];
+      seg_list = rle_ram_dict[ key ];
+      rts[ key ] = seg_list[0:start] + txt_list + seg_list[stop:];
+  return rts;
 
 ########################################################
-# Rotate the RLE RAM list so that order is always [1,1,1,2,3,3,3,0,0,0]
-# Output looks like this:
+# The RLE process pool is created on first use and kept, so worker startup
+# is paid once rather than on every capture. It uses "spawn" as the caller
+# may be the DownloadWorker thread and fork() of a multithreaded pygame
+# process isn't safe. Returns None for workers <= 1 or if there is no pool.
+def rle_process_pool( self, workers ):
+  workers = min( workers, os.cpu_count() or 1 );
+  if workers <= 1:
+    rle_process_pool_close( self );
+    return None;
+  if self.rle_pool != None and self.rle_pool_workers == workers:
+    return self.rle_pool;
+  rle_process_pool_close( self );
+  try:
+    import concurrent.futures;
+    import multiprocessing;
+    self.rle_pool = concurrent.futures.ProcessPoolExecutor( max_workers=workers,
+                      mp_context=multiprocessing.get_context("spawn") );
+    self.rle_pool_workers = workers;
+  except Exception as err:
+    log( self, ["WARNING: rle_process_pool() failed. %s" % str( err ) ]);
+    self.rle_pool = None;
+  return self.rle_pool;
+
+# Drop the RLE process pool, ie on exit or after a worker died
+def rle_process_pool_close( self ):
+  if self.rle_pool != None:
+    self.rle_pool.shutdown( wait=False );
+  self.rle_pool = None;
+  self.rle_pool_workers = 0;
+  return;
+
+
+########################################################
+# Put one Pod's RAM entries in time order in a single pass over the ints.
+# Returns the RAM addresses to keep, in order, and their rolled timestamps.
+#
+# Rotate : The RAM is a ring. Start at the 1st Pre-Trig(1) after the Trigger(2)
+# so that order is always [1,1,1,2,3,3,3,0,0,0]. If there are no Pre-Trig
+# entries, start at the Trigger.
 # 1 0000006006 00012030 1st Pre-Trig Sample
 # 1 0000006007 00012033 Pre-Trig
 # 2 0000006008 00012036 Trig
 # 3 0000006009 00012039 Post-Trig
 # 3 000000600a 0001203c Last Post-Trig
 # 0 0000000000 00000000 Null Sample
-def rle_rotate( self,rle_list ):
-  c = 3 * rle_list;
-  b = [ each[0:1] for each in c ];
-
-# TODO: This crashes if "2" isn't in the list ( force_stop )
-  try:
-    t = b.index("2")+1;
-  except:
-    log(self,["  ERROR-4978 : rle_rotate() did not find a Trigger(2)"]);
-    return [];
-  b = b[t:];
-  c = c[t:];
-# print(" t of2 = %d" % t );
-# list2file("b.txt", b );
-
-  try:
-    t = b.index("1");
-  except:
-    t = b.index("2");
-  b = b[t:];
-  c = c[t:];
-# print(" t of1 = %d" % t );
-
-  b = b[0:len(rle_list)];
-  c = c[0:len(rle_list)];
-  return c;
-
-
-########################################################
-# The RLE timestamp is really big, but it's possible to be waiting for
+#
+# Roll : The RLE timestamp is really big, but it's possible to be waiting for
 # hours for a trigger to occur. For this corner case, examine the MSB
 # time bit for the post-rolled samples. If the bit goes 1 then back 
 # to 0, we know the hardware counter rolled. Compensate by adding
@@ -8407,88 +9039,71 @@ def rle_rotate( self,rle_list ):
 # from 128 to less than 128, add 256 to everything less than 128
 # after the roll was detected.
 #
-# Final step is to subtract the Trigger time from all samples so that
-# Trigger is Time-0 and pre-Trig is negative and post-Trig is positive
-def rle_time_roll( rle_list, rle_timestamp_bits ):
-  msb_value = 2**(rle_timestamp_bits-1);# ie 128= 2^^7 for an 8bit timestamp
-  msb_found_jk = False;
-  new_rle_list = [];
-  for each in rle_list:
-    words = " ".join(each.split()).split(' ');
-    time_int = int( words[1],16 );
-    if not msb_found_jk:
-      if ( time_int & msb_value ) != 0:
-        msb_found_jk = True;
-    else:
-      if ( time_int & msb_value ) == 0:
-        time_int += 2**rle_timestamp_bits;
-    # The number o
-    num_nibbles = (rle_timestamp_bits+1) // 4;
-    if (rle_timestamp_bits+1) % 4 != 0: num_nibbles += 1;
-    time_txt = "%016x" % time_int;
-    time_txt = time_txt[-num_nibbles:];
-    new_rle_list += [ words[0] + " " + time_txt + " " + words[2] ];
-  return new_rle_list;
-
-########################################################
-# It's possible for the RLE time to wrap multiple times if the number
-# of timestamp bits is insufficient. Detect that and toss any bogus
-# samples
-def rle_time_cull(self, rle_list ):
-  trigger_loc = None;
-  for (i,each) in enumerate( rle_list ):
-    words = " ".join(each.split()).split(' ');
-    if words[0] == "2":
-      trigger_loc = i; 
-      trigger_time = int(words[1],16);
-  if trigger_loc != None:
-    pre_trig  = rle_list[0:trigger_loc];
-    post_trig = rle_list[trigger_loc:];
-#   list2file("pre.txt", pre_trig );
-#   list2file("post.txt", post_trig );
-
-    new_post_trig = [];
-    start_culling = False;
-    previous_sample_time = trigger_time;
-    for each in post_trig:
-      if start_culling == False:
-        words = " ".join(each.split()).split(' ');
-        sample_time = int(words[1],16);
-        if sample_time >= previous_sample_time:
-          new_post_trig += [ each ];
-        else:
-          start_culling = True;
-        previous_sample_time = sample_time;
-#   if start_culling:
-#     log( self,["WARNING: Culled invalid RLE samples in rle_time_cull()"]);
-
-    new_pre_trig = [];
-    start_culling = False;
-    previous_sample_time = trigger_time;
-    for each in list(reversed(pre_trig)):
-      if start_culling == False:
-        words = " ".join(each.split()).split(' ');
-        sample_time = int(words[1],16);
-        if sample_time <= previous_sample_time:
-          new_pre_trig += [ each ];
-        else:
-          start_culling = True;
-        previous_sample_time = sample_time;
-#   if start_culling:
-#     log( self,["WARNING: Culled invalid RLE samples in rle_time_cull()"]);
-    old_len = len( rle_list );
-    rle_list = list(reversed(new_pre_trig)) + new_post_trig;
-    new_len = len( rle_list );
-    if ( new_len < old_len ):
-      log( self,["WARNING: Culled %d invalid RLE samples in rle_time_cull()" % ( old_len-new_len)]);
-  
-  return rle_list;
+# Cull : It's possible for the RLE time to wrap multiple times if the number
+# of timestamp bits is insufficient. Walking out from the last Trigger, time
+# must never go backwards. Everything from the first entry that does is bogus.
+def rle_rotate_roll_cull( self, state_list, time_list, rle_timestamp_bits, log_list = None ):
+  if log_list == None:
+    log_list = [];
+    log_en = True;
+  else:
+    log_en = False;
+  n = len( state_list );
+  try:
+    trig_addr = state_list.index( 2 );
+  except ValueError:
+    log_list += ["  ERROR-4978 : rle_rotate() did not find a Trigger(2)"];
+    if log_en:
+      log( self, log_list );
+    return ( [], [] );
+  try:
+    start = state_list.index( 1, trig_addr+1 );
+  except ValueError:
+    try:
+      start = state_list.index( 1, 0, trig_addr );
+    except ValueError:
+      start = trig_addr;
 
+  # k is the position in time order. RAM address is ( start + k ) % n
+  msb_value = 2**(rle_timestamp_bits-1);# ie 128= 2^^7 for an 8bit timestamp
+  roll_k = n;# Position of the 1st timestamp with the MSB set
+  trig_k = None;# Position of the last Trigger
+  for k in range( 0, n ):
+    i = ( start + k ) % n;
+    if roll_k == n and ( time_list[i] & msb_value ) != 0:
+      roll_k = k;
+    if state_list[i] == 2:
+      trig_k = k;
+
+  def rolled( k ):
+    time_int = time_list[ ( start + k ) % n ];
+    if k > roll_k and ( time_int & msb_value ) == 0:
+      time_int += 2**rle_timestamp_bits;
+    return time_int;
+
+  trigger_time = rolled( trig_k );
+  stop_k = trig_k + 1;
+  previous_sample_time = trigger_time;
+  while stop_k < n and rolled( stop_k ) >= previous_sample_time:
+    previous_sample_time = rolled( stop_k );
+    stop_k += 1;
+  start_k = trig_k;
+  previous_sample_time = trigger_time;
+  while start_k > 0 and rolled( start_k-1 ) <= previous_sample_time:
+    previous_sample_time = rolled( start_k-1 );
+    start_k -= 1;
+
+  if stop_k - start_k < n:
+    log_list += ["WARNING: Culled %d invalid RLE samples in rle_time_cull()" % ( n - ( stop_k - start_k ) )];
+  if log_en:
+    log( self, log_list );
+  addr_list = [ ( start + k ) % n for k in range( start_k, stop_k ) ];
+  return ( addr_list, [ rolled( k ) for k in range( start_k, stop_k ) ] );
 
 
 ########################################################
-# Convert the RLE timestamp RAM file to a +/- integer in ps time units
-# RAM File Input:
+# Decode the RLE RAM image into self.rle_capture with +/- integer ps times
+# RAM Image Input ( also saved as sump_rle_ram.txt ):
 #  [rle_pod_start]
 #   rle_hub_instance = 0
 #   rle_pod_instance = 0
@@ -8500,7 +9115,7 @@ def rle_time_cull(self, rle_list ):
 #   ..
 #   0 40000000 c
 #  [rle_pod_stop]
-# Sample File Output:
+# Optional sump_rle_samples.txt export:
 # [rle_pod_start]
 #  rle_hub_instance = 0
 #  rle_pod_instance = 0
@@ -8511,168 +9126,31 @@ def rle_time_cull(self, rle_list ):
 #  0011 3 425,000
 # [rle_pod_stop]
 #
-def create_sump_digital_rle( self, file_in, file_out ):
+# With a key_list only those Pods are decoded again into the existing Capture
+# and marked dirty for populate_signal_values_from_samples( dirty_only=True ).
+def create_sump_digital_rle( self, key_list = None ):
   log( self,["create_sump_digital_rle()"]);
   self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright+" create_sump_digital_rle()");
   self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
   self.pygame.event.pump();
-  from os import path;
-  file_path = os.path.abspath( self.vars["sump_path_ram"] );
-  file_in   = os.path.join( file_path, file_in );
-  file_out  = os.path.join( file_path, file_out );
-
-  ram_list = file2list( file_in );
-  lst_list = [];
-  
-  all_pods_dict = {};
 
-  # 1st pass extracts the header info for each Pod and stores it in 
-  # a dictionary. 2nd pass uses this information to translate time
-  for each in ram_list:
-    # Look for and store header data
-    if each[0:1] == "#":
-      words = " ".join(each[1:].split()).split(' ') + [None] * 5;
-      if words[0] == "[rle_pod_start]":
-        pod_dict = {};
-      elif words[0] == "[rle_pod_stop]":
-        all_pods_dict[(hub_num,pod_num)] = pod_dict;# Add this pod's dict to all_pods_dict
-      elif words[0] == "rle_pod_instance":
-        pod_num = words[2];
-      elif words[0] == "rle_hub_instance":
-        hub_num = words[2];
-      else:
-        pod_dict[ words[0] ] = words[2];
-    # Look for timestamp at trigger 
-    # Code Time    Data
-    # 
-    # 1 0000005f2a 00005f34
-    else:
-      words = " ".join(each.split()).split(' ') + [None] * 5;
-      if words[0] == "2":
-        pod_dict[ "trigger_time" ] = int( words[1] , 16 );
+  if key_list == None:
+    capture = Capture( parent = self );
+  else:
+    capture = self.rle_capture;
+  file_name = os.path.join( os.path.abspath( self.vars["sump_path_ram"] ), "sump_rle_samples.txt" );
+  if key_list == None and len( self.rle_ram_dict ) == 0 and os.path.exists( file_name ):
+    capture.load_rle_samples( file2list( file_name ) );# ie a vcd2pza.py pizza
+  else:
+    capture.load_rle_ram( self.rle_ram_dict, key_list,
+                          workers = int( self.vars["sump_rle_decode_processes"], 10 ) );
+  capture.finalize( key_list );
+  self.rle_capture = capture;
 
-  # Look for the trigger source as each hub, with a different clock, has a different
-  # miso trigger latency that will then be shared with all hubs as a trigger offset
-  # rle_hub_clock    = 100.000000 # 100 MHz clock for this hub
-  # trig_lat_miso_ck = 12         # 12 clocks at 100 MHz is the latency
-  # trig_src_hub     = 300        # Indicates Hub num 0x00 was the trig source
-  # trig_src_pod     = 00000001   # Indicated D[0] was the trigger bit
-  self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright+" locating trigger...");
-  self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
-  self.pygame.event.pump();
-  trig_src_miso_latency = 0.0;# in ps
-  for each in ram_list:
-    # Look for and store header data
-    if each[0:1] == "#":
-      words = " ".join(each[1:].split()).split(' ') + [None] * 5;
-      if words[0] == "[rle_pod_start]":
-        trig_src_hub = None;
-#       print("Oy!");
-      elif words[0] == "[rle_pod_stop]":
-#       print("Vay!");
-        if ( trig_src_hub != None and trig_src_hub & 0x300 == 0x300 ):
-          pod_i = trig_src_hub & 0x0FF;
-          if pod_i == pod_num:
-            log( self,["Trigger source is Hub-%d, Pod-%d, Bits-%08x" % ( hub_num, pod_num, trig_src_pod )]);
-            trig_src_miso_latency = float ( 1000000.0 / hub_clk ) * trig_lat_miso_ck;# Latency in pS
-      elif words[0] == "rle_pod_instance":
-        pod_num = int( words[2],10 );
-      elif words[0] == "rle_hub_instance":
-        hub_num = int( words[2], 10 );
-      elif words[0] == "rle_hub_clock":
-        hub_clk = float( words[2] );
-      elif words[0] == "trig_lat_miso_ck":
-        trig_lat_miso_ck = int( words[2], 10 );
-      elif words[0] == "trig_src_hub":
-        trig_src_hub = int( words[2], 16 );
-      elif words[0] == "trig_src_pod":
-        trig_src_pod = int( words[2], 16 );
-#     elif words[0] == "pod_user_ctrl":
-#       pod_user_ctrl = int( words[2], 16 );
-
-  # 2nd pass passes header info on through other than parsing the 
-  # pod number. Data is modifed to subtract trigger time from all samples
-  self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright+" time adjust..");
-  self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
-  self.pygame.event.pump();
-  calc_trig_offset = True;
-  trig_offset = 0;
-  for each in ram_list:
-    if each[0:1] == "#":
-      words = " ".join(each[1:].split()).split(' ') + [None] * 5;
-      if words[0] == "rle_hub_instance":
-        hub_num = words[2];
-        hub_i   = int(hub_num);
-      if words[0] == "rle_pod_instance":
-        pod_num = words[2];
-        pod_i   = int(pod_num);
-        pod_dict = all_pods_dict[(hub_num,pod_num)];
-#       pod_clk_ps = int(round(1/( float(pod_dict["clock"])/1000000.0)));# clk in ps units
-        pod_clk_ps = int(round(1/( float(pod_dict["rle_hub_clock"])/1000000.0)));# clk in ps units
-        calc_trig_offset = True;
-      lst_list += [ each ];
-    else:
-      # Trigger Offset
-      if calc_trig_offset:
-        calc_trig_offset = False;
-        trig_offset = 0;
-##       core_ck = 12500;
-#        miso_ck = 12500;# Trigger Source in 80 MHz Domain
-##       miso_ck = 10000;# Trigger Source in 100 MHz Domain
-#        if hub_i == 0:
-#          mosi_ck = 12500;
-#        else:
-#          mosi_ck = 10000;
-
-#       trig_offset += ( int(pod_dict["trig_lat_miso_ck"],10) + 0 ) * miso_ck;# HACK FREQ
-#       trig_offset += ( int(pod_dict["trig_lat_mosi_ck"],10) - 5 ) * mosi_ck;# HACK FREQ
-
-        trig_offset = trig_src_miso_latency;
-        core_ck = float( 1000000.0 / self.sump.cfg_dict['dig_freq'] );# ps
-        trig_offset += ( int(pod_dict["trig_lat_core_ck"],10) + 0 ) * core_ck;
-        trig_offset += ( int(pod_dict["trig_lat_mosi_ck"],10) - 5 ) * pod_clk_ps;
-        trig_offset = int( trig_offset );
-
-#       log( self,["Trigger Offset is %f ps : Hub-%d Pod-%d" % ( trig_offset, hub_i, pod_i ) ]);
-
-      words = " ".join(each.split()).split(' ') + [None] * 5;
-      time_hex = words[1];
-      time_raw = int(time_hex,16);
-      time_int = time_raw - pod_dict["trigger_time"];
-#     print("%s : %d - %d = %d" % (time_hex,time_raw,pod_dict["trigger_time"],time_int));
-
-      time_int *= pod_clk_ps;
-      
-      time_int = time_int + trig_offset;
-
-      data_hex = words[2];
-      data_bin = "";
-      for each_nib in data_hex: 
-        data_bin += nibble2bits(int(each_nib,16) );
-      data_bin = data_bin[::-1];# Reverse the string to Put D(0) bit at Col-0 (leftmost)
-      # Now iterate the 32bit rle_mask register and convert '0' to 'X' for bits that were masked
-      data_bin_masked = "";
-
-
-      # New 2023.08.18
-      for i in range( 0, len(data_bin) ):
-        if (i<32) and ( ((2**i) & int(pod_dict["rle_bit_mask"],16) ) != 0 ):
-          data_bin_masked += "X";
-#       elif (i>=32) and ( int(pod_dict["rle_bulk_mask"],16) == 0xFFFFFFFF ):
-#         data_bin_masked += "X";
-        else:
-          data_bin_masked += data_bin[i];
-
-      # New 2023.06.28 : Only keep valid RAM entries with actual samples.
-      if words[0] != "0":
-#       time_txt = f"{time_int:,}";# Thousands comma separator
-        time_txt = comma_separated(time_int);# Thousands comma separator
-        lst_list += [ data_bin_masked + " " + words[0] + " " + time_txt ];
-      # D0                           D31    Time in ps
-      # X1X01100000001001000000000000000 1 -12500
-      # X1X01100000001001000000000000000 2 0
-      # X0X11100000001001000000000000000 3 12500
-  list2file( file_out, lst_list );
+  if int( self.vars["sump_rle_samples_export"], 10 ) == 1:
+    file_path = os.path.abspath( self.vars["sump_path_ram"] );
+    file_out  = os.path.join( file_path, "sump_rle_samples.txt" );
+    list2file( file_out, capture.samples_list() );
   self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright+"");
   self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
   self.pygame.event.pump();
@@ -8764,149 +9242,127 @@ def create_sump_digital_slow( self, file_in, file_out ):
       j = 0;
       blank_record = False;
 
-  digital_list = [];
+  ls = LsCapture();
+  ls.width = 32 * record_dig_len;
   digital_offset = record_header_len;
+  analog_offset = record_header_len + record_dig_len;
   samples = len( ram_list ) // record_len;
   log( self,["Number of LS samples is now %d" % samples]);
-# max_time = 0; max_i = 0;
   for i in range( 0, samples ):
-    header_time = int( ram_list[ (record_len * i) + ( 0 ) ], 16 );
+    record = ram_list[ (record_len * i) : (record_len * (i+1)) ];
+    header_time = int( record[0], 16 );
     header_stamp = ( header_time & 0xC0000000 ) >> 30;
     header_time  = ( header_time & 0x3FFFFFFF ) >> 0;
-    header_str = " %01x %08x" % ( header_stamp, header_time );
-#   if header_time > max_time:
-#     max_time = header_time;
-#     max_i = i;
-    bin_str = "";
+    # Only save valid samples
+    if header_stamp == 0:
+      continue;
+    digital = 0;
     for j in range( 0, record_dig_len ):
-      value = int( ram_list[ (record_len * i) + (digital_offset + j) ], 16 );
-      dword_bin_str = dword2bits( value );
-      dword_bin_str = dword_bin_str[::-1];# Reverse the string to Put D(0) bit at Col-0 (leftmost)
-      bin_str += dword_bin_str;
-    ana_str = "";
-    analog_offset = record_header_len + record_dig_len;
+      digital |= int( record[ digital_offset + j ], 16 ) << ( 32*j );
+    value_list = [];
+    nibble_list = [];
     for j in range( 0, record_ana_len ):
-      value = int( ram_list[ (record_len * i) + (analog_offset + j) ], 16 );
+      value = int( record[ analog_offset + j ], 16 );
       id_byte = ( value & 0xFF000000 ) >> 24;
       id_valid_samples = ( id_byte & 0x80 ) >> 7;
       id_chs_per_slot  = ( id_byte & 0x60 ) >> 5;
       id_bits_per_ch   = ( id_byte & 0x1F ) >> 0;
       for k in range( 0, id_chs_per_slot ):
+        nibble_list += [ int( math.ceil( id_bits_per_ch / 4 )) ];# Round up to nearest integer
         if id_valid_samples == 0:
-          ana_str += " None";
+          value_list += [ None ];
         else:
-          ch_value = value & ( 2**id_bits_per_ch-1 );
+          value_list += [ value & ( 2**id_bits_per_ch-1 ) ];
           value = value >> id_bits_per_ch;# Shift down for the next channel if there is one
-          hex_str = "%06x" % ch_value;# Max channel size is 24 bits
-          nibs = int( math.ceil( id_bits_per_ch / 4 ));# Round up to nearest integer
-          hex_str = hex_str[-nibs:];# grab the n nibbles on the right
-          ana_str += " "+hex_str;
-#   digital_list += [ bin_str + ana_str ];
-    # Only save valid samples
-    if header_str[1] != "0":
-      digital_list += [ bin_str + ana_str + header_str ];
-
-
-  # Do a roll operation. Look for 1st trigger and then go 1,2,3 from there
-  # knowing the 1st 1 after the 1st 2 is the beginning of time
-  # "1112333311" becomes 2x
-  # "1112333311" "1112333311" 
-  #          |-------^---|
-
-# list2file( "test1.txt", digital_list );
-  dig_len = len(digital_list);
-# digital_list = 2*digital_list;# Concat
-  digital_list = 3*digital_list;# Concat 2025.09.25
-
-  code_list = []
-  for each in digital_list:
-    words = " ".join(each.split()).split(' ');
-    code_list += [ words[-2] ];
+    ls.digital.append( digital );
+    ls.add_analog( value_list, nibble_list );
+    ls.state.append( header_stamp );
+    ls.time.append( header_time );
+
+  # Do a roll operation. The RAM is a ring, so the 1st Pre-Trig(1) after the
+  # 1st Trigger(2) is the beginning of time. If there isn't one, the trigger
+  # happened on the very first sample acquired so start from the Trigger.
+  # "1112333311" becomes "1111123333"
+  n = len( ls.state );
   try:
-    t = code_list.index("2");
+    t = ls.state.index( 2 );
   except:
     log(self,["  ERROR-4979 : did not find a Trigger(2) in LS samples"]);
     return [];
+  start = t;
+  for k in range( 1, n ):
+    if ls.state[ (t+k) % n ] == 1:
+      start = (t+k) % n;
+      break;
+  if start == t:
+    log(self,["WARNING: no pre-trig LS samples found!"]);
+  ls.rotate( start );
 
-  # Remove the 1st "2" and everything before it.
-  digital_list = digital_list[(t+1):];
-  code_list    = code_list[(t+1):];
-
-  # Now find the 1st "1" and preserve it to the sample length
-  # If a "1" doesn't exist, it means trigger happened on very first sample
-  # acquire, so use it as the start point.
-  try:
-    t = code_list.index("1");
-  except:
-#   t = 0;
-# New 2025.01.22
-    try:
-      t = code_list.index("2");
-      log(self,["WARNING: no pre-trig LS samples found!"]);
-    except:
-      t = 0;
-      log(self,["WARNING: no trigger LS samples found!"]);
-
-  digital_list = digital_list[t:(t+dig_len)];
-  code_list    = code_list[t:(t+dig_len)];
-  new_len = len(digital_list);
-  if dig_len != new_len:
-    log(self,["  ERROR-5150 : LS sample roll operation complete systems failure %d  %d != %d" % ( t, new_len, dig_len) ]);
-    digital_list = [];
-
-  list2file( file_out, digital_list );
+  self.ls_capture = ls;
+  list2file( file_out, ls.samples_list() );
   return;
 
 
 ########################################################
 # convert each bit into a value list for the signals
+# RLE signals are ripped from the in memory self.rle_capture and LS signals
+# bind to the columns of self.ls_capture.
 # TODO: Needs to handle multiple DWORDs
-#def create_signal_values_digital( self, file_ls_name, file_hs_name ):
-def create_signal_values_digital( self, file_ls_name, file_hs_name, file_rle_name ):
+# dirty_only updates just the RLE signals of Pods in self.rle_capture.dirty_set
+# and leaves every other signal as it was.
+def create_signal_values_digital( self, file_hs_name, dirty_only = False ):
   log( self,["create_signal_values_digital()"]);
   self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright+" create_signal_values_digital()");
   self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
   self.pygame.event.pump();
   from os import path;
   file_path = os.path.abspath( self.vars["sump_path_ram"] );
-  file_ls_name  = os.path.join( file_path, file_ls_name  );
   file_hs_name  = os.path.join( file_path, file_hs_name  );
-  file_rle_name = os.path.join( file_path, file_rle_name );
 
-  ls_list = [];
+  ls = self.ls_capture;
   hs_list = [];
-  rle_list = [];
   log_str = [];
   
   self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright+" create_signal_values_digital() Reading Files...");
   self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
-  if os.path.exists( file_ls_name ):
-    ls_list = file2list( file_ls_name );
-  if os.path.exists( file_hs_name ):
-    hs_list = file2list( file_hs_name );
-  if os.path.exists( file_rle_name ):
-    rle_list = file2list( file_rle_name );
-
-  # Locate the actual ls trigger index by looking for "2" as 2nd to last word
-  # This will differ from the trigger location setting since the user may
-  # download before the acquisition finishes.
-  actual_digital_ls_trig_index = None;
-  for (i,each_sample) in enumerate( ls_list ):
-    words = " ".join(each_sample.split()).split(' ');
-    if len(words) > 2:
-      if words[-2] == "2":
-        actual_digital_ls_trig_index = i;
+  if dirty_only:
+    dirty_set = self.rle_capture.dirty_set;
+    sig_list = [ each_sig for each_sig in self.signal_list if each_sig.source != None and
+                 ( rle_source_bit_rip( self, each_sig.source ) or (None,None) )[0:2] in dirty_set ];
+  else:
+    sig_list = self.signal_list;
+    if os.path.exists( file_hs_name ):
+      hs_list = file2list( file_hs_name );
+
+  # The actual ls trigger index. This will differ from the trigger location
+  # setting since the user may download before the acquisition finishes.
+  actual_digital_ls_trig_index = ls.trigger_index;
 
   self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright+" create_signal_values_digital() Generating Samples...");
   self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
   self.pygame.event.pump();
 
+  # Rip the bits of every RLE signal up front, one pass per Pod for all of
+  # the signals bound to it. rle_value_dict key is (hub,pod,bit_top,bit_bot)
+  rip_dict = {};
+  for each_sig in sig_list:
+    if each_sig.source != None:
+      bit_rip = rle_source_bit_rip( self, each_sig.source );
+      if bit_rip != None:
+        rip_dict.setdefault( bit_rip[0:2], set() ).add( bit_rip[2:4] );
+  rle_value_dict = {};
+  compact = int( self.vars["sump_rle_keep_raw"], 10 ) == 0;
+  for ( key, rip_set ) in rip_dict.items():
+    cap_pod = self.rle_capture.pod_dict.get( key );
+    if cap_pod != None:
+      for ( each_rip, rts ) in cap_pod.bit_rip_all( rip_set, compact ).items():
+        rle_value_dict[ key + each_rip ] = rts;
+
   # Iterate through the signal list and assign samples and attributes
   # to each signal from the specified source ( ls, hs or rle )
 # total_bits = 32; 
-  pod_cache = {};
-  j = len( self.signal_list );
-  for (i,each_sig) in enumerate( self.signal_list ):
+  j = len( sig_list );
+  for (i,each_sig) in enumerate( sig_list ):
     self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright+" create_signal_values() %d of %d" % (i,j));
     self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
     self.pygame.event.pump();
@@ -8921,9 +9377,9 @@ def create_signal_values_digital( self, file_ls_name, file_hs_name, file_rle_nam
       if sig_source[0:10] == "digital_hs":
         sample_list = hs_list;
       elif sig_source[0:10] == "digital_ls":
-        sample_list = ls_list;
+        sample_list = [];# ls.digital
       elif sig_source[0:9] == "analog_ls":
-        sample_list = ls_list;
+        sample_list = [];# ls.analog_list
       elif sig_source[0:11] == "digital_rle":
         # Format digital_rle[0][1][31:0] :
         #    "0" is the rle_hub 
@@ -8934,7 +9390,7 @@ def create_signal_values_digital( self, file_ls_name, file_hs_name, file_rle_nam
         # 0           1 2 3 4 5 6 7   8  9    Words
         # Translate to digital_rle[31:0] to be compatible with digital_ls and digital_hs parsing
         # that follows. Extrace the pod_num and rename the sig_source
-        sample_list = rle_list;
+        sample_list = [];
         a = sig_source;
         a = a.replace("["," [ ");
         a = a.replace("]"," ] ");
@@ -8952,49 +9408,12 @@ def create_signal_values_digital( self, file_ls_name, file_hs_name, file_rle_nam
 
 
         sig_source = words[0] + " ".join(words[7:]).replace(" ","");
-        # Now given the pod_num, rip through the rle_list and extract just the pod_num samples
-        # #[rle_pod_start]
-        # # rle_pod_instance = 0
-        # X0X01100111110100000000000000000 1 -2775000
-        # #[rle_pod_stop]
-
-        # Use cached results if we already processed this rle_pod instead of doing same op 32 times.
-        if pod_cache.get(( hub_num,pod_num )):
-          (sample_list,attrib_dict) = pod_cache[(hub_num,pod_num)];
+        # The Pod's samples were decoded once into the Capture
+        cap_pod = self.rle_capture.pod_dict.get( ( hub_num,pod_num ) );
+        if cap_pod != None:
+          attrib_dict = cap_pod.attrib;
         else:
-          self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright+" pod_cache miss");
-          self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
-          self.pygame.event.pump();
-          sample_list = [];
-          parsing_jk = False;
-          hub_i = None;
-          pod_i = None;
           attrib_dict = {};
-          for each_sample in rle_list:
-            if each_sample[0:1] == "#":
-              a = each_sample;
-              a = a.replace("#","");
-              words = " ".join(a.split()).split(' ') + [None] * 5;
-              if words[0] == "rle_hub_instance":
-                hub_i = int(words[2]);
-              if words[0] == "rle_pod_instance":
-                pod_i = int(words[2]);
-                if pod_i == pod_num and hub_i == hub_num:
-                  parsing_jk = True;
-              if words[0] == "[rle_pod_stop]":
-                parsing_jk = False;
-                hub_i = None;
-                pod_i = None;
-# New 2024.01.10
-#             if words[1] == "=":
-              if words[1] == "=" and parsing_jk == True:
-                attrib_dict[words[0]] = words[2];# ie attrib_dict["rle_pod_instance"] = "0"
-            elif parsing_jk:
-              sample_list += [ each_sample ];
-          pod_cache[(hub_num,pod_num)] = (sample_list,attrib_dict);
-          self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright+" pod_cache filled");
-          self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
-          self.pygame.event.pump();
 
         # Decide if samples for this signal are valid based on pod_user_ctrl
         if attrib_dict.get("pod_user_ctrl") != None:
@@ -9014,8 +9433,7 @@ def create_signal_values_digital( self, file_ls_name, file_hs_name, file_rle_nam
           bit_l = int(bit_l,10);
           bit_h = int(bit_h,10);
           dword += int(bit_val,16) << bit_l;
-          for i in range(bit_l,bit_h+1):
-            mask += 2**i;# ie [7:4] becomes 0xF0
+          mask |= ( ( 1 << ( bit_h-bit_l+1 ) ) - 1 ) << bit_l;# ie [7:4] becomes 0xF0
 
         # Now decide if the pod_user_ctrl bits make the signal valid
         if len( each_sig.user_ctrl_list ) == 0:
@@ -9027,13 +9445,10 @@ def create_signal_values_digital( self, file_ls_name, file_hs_name, file_rle_nam
             rle_valid_user_ctrl = False;
 
       # Future designs may support both analog_ls and analog_hs
-      if sig_source[0:9] == "analog_ls" and len(sample_list) != 0:
-        words = " ".join(sample_list[0].split()).split(' ');
-        words = words[1:];# Remove the digital samples that were word[0]
-        total_words = len( words );
+      if sig_source[0:9] == "analog_ls" and len( ls.state ) != 0:
         adc_random_none_samples = int( self.vars["dbg_random_adc_none_samples"],10 );
         ls_ana_dig_alignment    = int( self.vars["sump_ls_ana_dig_alignment"],10 );
-        for i in range( 0, total_words ):
+        for ( i, each_ch ) in enumerate( ls.analog_list ):
           source = "analog_ls[%d]" % i;
           if sig_source == source:
             each_sig.values = [];
@@ -9046,22 +9461,11 @@ def create_signal_values_digital( self, file_ls_name, file_hs_name, file_rle_nam
             each_sig.values += ls_ana_dig_alignment*[ None ];
 
 #           2025.04.15 : Since we prepended 2 Nones, shorten analog list by 2 samples
-#           for each_sample in sample_list:
-#           for each_sample in sample_list[0:-4]:
-            for each_sample in sample_list[0:-ls_ana_dig_alignment]:
-              words = " ".join(each_sample.split()).split(' ');
-              words = words[1:];# Remove the digital samples that were word[0]
-              word_val = words[i];
-              if word_val == "None":
-                word_val_int = None;
-              else:
-                word_val_int = int(word_val,16);
-              # This is for software testing of not having an ADC sample
-              if adc_random_none_samples == 1:
-                rnd = random.randint(0,10);
-                if rnd == 0:
-                  word_val_int = None;
-              each_sig.values += [ word_val_int ];
+            ch_values = each_ch[0:-ls_ana_dig_alignment];
+            # This is for software testing of not having an ADC sample
+            if adc_random_none_samples == 1:
+              ch_values = [ None if random.randint(0,10) == 0 else each for each in ch_values ];
+            each_sig.values += ch_values;
 
 
       # Check for digital bit ripped of multiple bits
@@ -9083,34 +9487,16 @@ def create_signal_values_digital( self, file_ls_name, file_hs_name, file_rle_nam
           if each_sig.format == None:
             each_sig.format = "hex";
 
-          for each_item in sample_list:
-            if "digital_rle" in each_sig.source:
-              words = " ".join(each_item.split()).split(' ') + [None] * 3;
-              each_sample = words[0];
-              each_code   = words[1];
-              each_time   = words[2].replace(",","");# Remove any thousands separators
-            else:
-              each_sample = each_item;
+          # An RLE masked or not downloaded bit wipes out the entire word
+          if "digital_rle" in each_sig.source:
+            ( each_sig.values, each_sig.rle_time ) = rle_value_dict.get( ( hub_num, pod_num, top_rip, bot_rip ), ( [], [] ) );
 
-            if "digital_rle" in each_sig.source:
-              bit_cnt = 0; word_val = 0;
-              valid_sample = True;# An RLE masked bit will show up as "X" instead of "1" or "0"
-              for j in range( bot_rip, (top_rip+1) ):
-                if j < len(each_sample):
-                  if each_sample[j] == "X":
-                    valid_sample = False;# This will wipe out the entire word
-                  else:
-                    word_val += (2**bit_cnt) * int( each_sample[j] );
-                  bit_cnt += 1;
-                else:
-                  valid_sample = False;# This will wipe out the entire word
-              if valid_sample:
-                each_sig.values += [ word_val ];
-                each_sig.rle_time += [ int(each_time,10) ];
-              else:
-                each_sig.values = [];
-            # Not digital_rle so must be digital_ls or digital_hs
-            else:
+          elif "digital_ls" in each_sig.source:
+            each_sig.values = ls.bit_rip( top_rip, bot_rip );
+
+          # Not digital_rle or digital_ls so must be digital_hs
+          else:
+            for each_sample in sample_list:
               bit_cnt = 0; word_val = 0;
               try:
                 for j in range( bot_rip, (top_rip+1) ):
@@ -9131,23 +9517,18 @@ def create_signal_values_digital( self, file_ls_name, file_hs_name, file_rle_nam
           a =          a.replace("]", " ]");
           words = " ".join(a.split()).split(' ');
           i = int( words[1] );# Get the index
-          if True:
-
-            for each_item in sample_list:
-              if "digital_rle" in each_sig.source:
-                words = " ".join(each_item.split()).split(' ') + [None] * 3;
-                each_sample = words[0];
-                each_code   = words[1];
-                each_time   = words[2].replace(",","");# Remove any thousands separators
-              else:
-                each_sample = each_item;
+          if "digital_rle" in each_sig.source:
+            # An RLE Masked bit or an out of range index has no values at all
+            ( each_sig.values, each_sig.rle_time ) = rle_value_dict.get( ( hub_num, pod_num, i, i ), ( [], [] ) );
+          elif "digital_ls" in each_sig.source:
+            each_sig.values = ls.bit_rip( i, i );
+          else:
 
+            for each_sample in sample_list:
               try:
                 if each_sample[i] != "X":
                   bit_val = int( each_sample[i] );
                   each_sig.values   += [ bit_val ];
-                  if "digital_rle" in each_sig.source:
-                    each_sig.rle_time += [ int(each_time,10) ];
                 else:
                   each_sig.values = [];# Must be a RLE Masked bit, so no values at all
               except:
@@ -9158,7 +9539,14 @@ def create_signal_values_digital( self, file_ls_name, file_hs_name, file_rle_nam
           each_sig.values = [];# No Soup for You
 
       # Convert mutable values list to an immutable tuple to save memory.
-      each_sig.values = tuple( each_sig.values );
+      # RLE and digital_ls values already come packed as int64 arrays.
+      if type( each_sig.values ) != array:
+        each_sig.values = tuple( each_sig.values );
+      if len( each_sig.rle_time ) != 0:
+        each_sig.rle_time_bounds = ( min( each_sig.rle_time ), max( each_sig.rle_time ) );
+      else:
+        each_sig.rle_time_bounds = None;
+      each_sig.rle_lod = None;
 
       # Calculate the trigger index using the ram length and post trig sample info
       hs_hw_pipeline_offset = 7;
@@ -9217,6 +9605,9 @@ def create_signal_values_digital( self, file_ls_name, file_hs_name, file_rle_nam
 
       log_str +=["create_signal_values_digital() : %s -source %s -type %s num_samples = %d " % \
                 ( each_sig.name, each_sig.source, each_sig.type, len( each_sig.values ))];
+  self.rle_capture.dirty_set = set();
+  self.rle_time_bounds = None;
+  self.tile_cache.clear();# Tiles were painted from the replaced values
   log( self, log_str );
   self.pygame.display.set_caption( self.name+" "+self.vers+" "+self.copyright);
   self.pygame.time.wait( 0 );# Try to avoid timeout spinner during long downloads
@@ -9224,11 +9615,6 @@ def create_signal_values_digital( self, file_ls_name, file_hs_name, file_rle_nam
   return;
 
 
-def nibble2bits( value ):
-  bits = 4;
-  bin_str = ("%s" % "0"*(bits-len(bin(value)[2:])) + bin(value)[2:] );
-  return bin_str;
-
 def dword2bits( value ):
   bits = 32;
   bin_str = ("%s" % "0"*(bits-len(bin(value)[2:])) + bin(value)[2:] );
@@ -9237,6 +9623,9 @@ def dword2bits( value ):
 
 ###############################################################################
 class cursor(object):
+  __slots__ = ( "name", "visible", "selected", "trig_delta_t",
+                "trig_delta_unit", "x", "y", "delta_txt", "parent",
+                "sample", "color", "sig_value_list" );
   def __init__( self, name="Cursor-1", visible=False ):
     self.name          = name;
     self.visible       = visible;
@@ -9258,7 +9647,21 @@ class cursor(object):
 
 ###############################################################################
 # A signal contains time samples and various display attributes.
+# RLE and digital_ls values and rle_time are packed int64 arrays. __slots__
+# drops the per-object __dict__ of signal, cursor, window and view.
 class signal(object):
+  __slots__ = ( "name", "name_rect", "type", "window", "parent", "view_name",
+                "view_obj", "member_of", "hier_level", "source", "visible",
+                "hidden", "rle_masked", "offscreen", "collapsed",
+                "collapsable", "values", "rle_time", "trigger",
+                "triggerable", "maskable", "trigger_field", "trigger_index",
+                "selected", "vertical_offset", "units_per_division",
+                "divisions_per_range", "vertical_scale_rate", "y",
+                "bits_total", "range", "units", "units_per_code",
+                "offset_units", "offset_codes", "sample_period",
+                "sample_unit", "color", "format", "nibble_cnt", "timezone",
+                "user_ctrl_list", "fsm_state_dict", "rle_time_bounds",
+                "rle_lod" );
   def __init__( self, name="cnt_a", visible=True, \
                 bits_per_line=32, bits_total=32,format="hex"):
     self.name            = name;
@@ -9279,6 +9682,8 @@ class signal(object):
     self.collapsable     = False;# A group is collapsable for example
     self.values          = [];  # sample values - None if not available
     self.rle_time        = [];  # For RLE signals, each value has a time
+    self.rle_time_bounds = None;# ( min, max ) of rle_time, set when populated
+    self.rle_lod         = None;# RleLod built on the 1st zoomed out draw
     self.trigger         = False;
     self.triggerable     = False;# Only 32 Event Binary and Analog CHs can be triggers
     self.maskable        = False;# Only 32 Event Binary in RLE Pods can be maskable    
@@ -9313,6 +9718,13 @@ class signal(object):
 ###############################################################################
 # A window is one of three drawing areas for views.
 class window(object):
+  __slots__ = ( "name", "timezone", "view_list", "draw_list", "signal_list",
+                "grid_enable", "panel", "surface", "image", "y_offset",
+                "y_analog_offset", "zoom_pan_list", "zoom_pan_history",
+                "rle_time_range", "sample_period", "sample_unit",
+                "trigger_index", "samples_total", "samples_shown",
+                "samples_start_offset", "samples_viewport", "x_space",
+                "cursor_x_list", "tile_en" );
   def __init__( self, name="foo" ):
     self.name            = name;
     self.timezone        = None;
@@ -9338,6 +9750,7 @@ class window(object):
     self.samples_viewport = None;# ASCII represenation of what is being viewed
     self.x_space         = 0.0;# number of pixel spaces between samples
     self.cursor_x_list   = [ None, None ];
+    self.tile_en         = False;# Waveforms are painted from self.tile_cache
   def startup( self ):
     self.zoom_pan_list = ( 1.0,0,0 );
   def __del__(self):
@@ -9358,6 +9771,10 @@ class window(object):
 #    for the view to be valid. Ex [ ("[3:0]","a"),("[7:4]","b" ]
 #    See def gen_bit_rip
 class view(object):
+  __slots__ = ( "name", "filename", "timezone", "window", "color",
+                "user_ctrl_list", "rle_hub_pod_list",
+                "rle_hub_pod_user_ctrl_list", "sample_period",
+                "sample_unit", "trigger_index", "samples_total" );
 # def __init__( self, name="foo", timezone="bar" ):
   def __init__( self, name="foo" ):
     self.name             = name;
@@ -9380,6 +9797,736 @@ class view(object):
     return "name = " + self.name;
 
 
+##############################################################################
+# LRU cache of rendered text surfaces keyed by ( text, color, font size ).
+# Cached surfaces are only ever blitted, never drawn on, so they're shared.
+# Must be cleared when self.font changes.
+class GlyphCache:
+  def __init__ ( self, max_entries ):
+    self.max_entries  = max_entries;
+    self.surface_dict = OrderedDict();
+    self.hits         = 0;
+    self.misses       = 0;
+    self.evictions    = 0;
+
+  def render( self, font, font_size, txt, color ):
+    key = ( txt, tuple( color ), font_size );
+    surface = self.surface_dict.get( key );
+    if surface != None:
+      self.hits += 1;
+      self.surface_dict.move_to_end( key );
+      return surface;
+    self.misses += 1;
+    surface = font.render( txt, True, color );
+    self.surface_dict[ key ] = surface;
+    while len( self.surface_dict ) > self.max_entries:
+      self.surface_dict.popitem( last=False );
+      self.evictions += 1;
+    return surface;
+
+  def clear( self ):
+    self.surface_dict = OrderedDict();
+    return;
+
+  def stats( self ):
+    total = self.hits + self.misses;
+    if total != 0:
+      rate = 100.0 * self.hits / total;
+    else:
+      rate = 0.0;
+    return "GlyphCache %d of %d entries. %d hits %d misses ( %0.1f%% ) %d evictions" % \
+      ( len( self.surface_dict ), self.max_entries, self.hits, self.misses, rate, self.evictions );
+
+
+##############################################################################
+# LRU cache of painted waveform tiles keyed by ( window, zoom, tile index ).
+# Bounded by bytes of pixels rather than entries as window height varies.
+# Each window has a signature of whatever else a tile depends on, a new
+# signature drops all of that window's tiles.
+class TileCache:
+  def __init__ ( self, max_bytes, tile_w = 256 ):
+    self.max_bytes      = max_bytes;
+    self.tile_w         = tile_w;
+    self.margin         = tile_w // 2;
+    self.tile_dict      = OrderedDict();
+    self.signature_dict = {};# window name : signature
+    self.num_bytes      = 0;
+    self.hits           = 0;
+    self.misses         = 0;
+    self.evictions      = 0;
+
+  def set_signature( self, name, signature ):
+    if self.signature_dict.get( name ) != signature:
+      self.signature_dict[ name ] = signature;
+      for key in [ each for each in self.tile_dict if each[0] == name ]:
+        self.num_bytes -= self.tile_bytes( self.tile_dict.pop( key ) );
+    return;
+
+  def get( self, key ):
+    tile = self.tile_dict.get( key );
+    if tile != None:
+      self.hits += 1;
+      self.tile_dict.move_to_end( key );
+    else:
+      self.misses += 1;
+    return tile;
+
+  def put( self, key, tile ):
+    self.tile_dict[ key ] = tile;
+    self.num_bytes += self.tile_bytes( tile );
+    while self.num_bytes > self.max_bytes and len( self.tile_dict ) > 1:
+      ( old_key, old_tile ) = self.tile_dict.popitem( last=False );
+      self.num_bytes -= self.tile_bytes( old_tile );
+      self.evictions += 1;
+    return;
+
+  def tile_bytes( self, tile ):
+    return tile.get_width() * tile.get_height() * tile.get_bytesize();
+
+  def clear( self ):
+    self.tile_dict = OrderedDict();
+    self.signature_dict = {};
+    self.num_bytes = 0;
+    return;
+
+  def stats( self ):
+    total = self.hits + self.misses;
+    if total != 0:
+      rate = 100.0 * self.hits / total;
+    else:
+      rate = 0.0;
+    return "TileCache %d tiles %d of %d KB. %d hits %d misses ( %0.1f%% ) %d evictions" % \
+      ( len( self.tile_dict ), self.num_bytes // 1024, self.max_bytes // 1024, self.hits,
+        self.misses, rate, self.evictions );
+
+
+##############################################################################
+# Capture holds the decoded RLE samples of every Pod in memory. Signals are
+# populated directly from it instead of from sump_rle_samples.txt text lines.
+# It is built from the RLE RAM image, which is the same "state time data"
+# hex lines that are saved in sump_rle_ram.txt
+class Capture:
+  def __init__ ( self, parent ):
+    self.parent   = parent;
+    self.pod_list = [];# (hub,pod) in RLE RAM image order
+    self.pod_dict = {};# (hub,pod) : CapturePod
+    self.trig_src_miso_latency = 0.0;# in ps
+    self.dirty_set = set();# (hub,pod) decoded since signals were last populated
+
+  # Parse the rle_ram_dict Pod segments. With a key_list only those Pods are
+  # parsed and replace their own entries, otherwise the Capture starts over.
+  # Pods are independent so with workers > 1 they are parsed and converted
+  # to trigger relative ps by the RLE process pool, one Pod per job, falling
+  # back to serial if that fails. The trigger source latency every Pod
+  # needs comes from the "#" headers first. Bit rips stay here as they
+  # depend on the signals and are a numpy column op per rip.
+  # samples_en is for segments of sump_rle_samples.txt lines instead.
+  def load_rle_ram( self, rle_ram_dict, key_list = None, workers = 1, samples_en = False ):
+    if key_list == None:
+      self.pod_list = [];
+      self.pod_dict = {};
+      key_list = list( rle_ram_dict.keys() );
+    key_list = [ key for key in key_list if rle_ram_dict.get( key ) != None ];
+    seg_list = [ rle_ram_dict[ key ] for key in key_list ];
+    attrib_list  = [ ( key, self.pod_dict[ key ].attrib ) for key in self.pod_list if key not in key_list ];
+    attrib_list += [ ( key, rle_seg_attrib( each_seg ) ) for ( key, each_seg ) in zip( key_list, seg_list ) ];
+    ( trig_key, latency ) = rle_trig_src( attrib_list );
+    core_ck = self.core_ck();
+    n = len( seg_list );
+    pod_list = None;
+    # Tiny images aren't worth the pickling round trip
+    if n > 1 and sum( len( each ) for each in seg_list ) >= 8192:
+      pool = rle_process_pool( self.parent, workers );
+      if pool != None:
+        try:
+          pod_list = list( pool.map( rle_pod_load, seg_list, [ samples_en ] * n,
+                                     [ core_ck ] * n, [ latency ] * n ) );
+        except Exception as err:
+          log( self.parent, ["WARNING: Capture.load_rle_ram() process pool failed. %s" % str( err ) ]);
+          rle_process_pool_close( self.parent );
+          pod_list = None;
+    if pod_list == None:
+      pod_list = [ rle_pod_load( each_seg, samples_en, core_ck, latency ) for each_seg in seg_list ];
+    for pod in pod_list:
+      if pod == None:
+        continue;
+      key = ( pod.hub, pod.pod );
+      if self.pod_dict.get( key ) == None:
+        self.pod_list += [ key ];
+      self.pod_dict[ key ] = pod;
+      self.dirty_set.add( key );
+    return;
+
+  # Import the sump_rle_samples.txt format of samples_list(), which is also
+  # what vcd2pza.py writes. Times there are already ps from the trigger.
+  def load_rle_samples( self, samples_list ):
+    self.load_rle_ram( rle_ram_split( samples_list ), samples_en = True );
+    return;
+
+  # Convert the raw timestamps of every Pod to +/- ps relative to the trigger.
+  # The trigger source Pod's miso latency is shared as an offset by all Pods.
+  # rle_hub_clock    = 100.000000 # 100 MHz clock for this hub
+  # trig_lat_miso_ck = 12         # 12 clocks at 100 MHz is the latency
+  # trig_src_hub     = 300        # Indicates Hub num 0x00 was the trig source
+  # trig_src_pod     = 00000001   # Indicated D[0] was the trigger bit
+  # With a key_list only those Pods are converted, unless the trigger source
+  # latency changed as that moves every Pod. Pods the process pool already
+  # converted with the same latency are left as is.
+  def finalize( self, key_list = None ):
+    old_latency = self.trig_src_miso_latency;
+    ( trig_key, self.trig_src_miso_latency ) = \
+      rle_trig_src( [ ( key, self.pod_dict[ key ].attrib ) for key in self.pod_list ] );
+    if trig_key != None and ( key_list == None or trig_key in key_list ):
+      a = self.pod_dict[ trig_key ].attrib;
+      log( self.parent,["Trigger source is Hub-%d, Pod-%d, Bits-%08x" % \
+        ( trig_key[0], trig_key[1], int( a["trig_src_pod"], 16 ) )]);
+    if key_list == None or self.trig_src_miso_latency != old_latency:
+      key_list = self.pod_list;
+
+    core_ck = self.core_ck();
+    for key in key_list:
+      pod = self.pod_dict[ key ];
+      self.dirty_set.add( key );
+      if pod.time_key != ( core_ck, self.trig_src_miso_latency ):
+        pod.time_adjust( core_ck, self.trig_src_miso_latency );
+    return;
+
+  # Core clock period in ps, None before the HW config is known
+  def core_ck( self ):
+    dig_freq = self.parent.sump.cfg_dict.get('dig_freq');
+    if dig_freq == None:
+      return None;
+    return float( 1000000.0 / dig_freq );
+
+  # Export in the old sump_rle_samples.txt format. D0 is the leftmost bit.
+  # X1X01100000001001000000000000000 1 -12500
+  def samples_list( self ):
+    rts = [];
+    for key in self.pod_list:
+      pod = self.pod_dict[ key ];
+      rts += pod.txt_list;
+      # Runs of unknown bits become "X" spans of the reversed binary string
+      x_span_list = [];
+      for i in range( 0, pod.width ):
+        if ( pod.x_mask >> i ) & 1:
+          if len( x_span_list ) != 0 and x_span_list[-1][1] == i:
+            x_span_list[-1] = ( x_span_list[-1][0], i+1 );
+          else:
+            x_span_list += [ ( i, i+1 ) ];
+      fmt = "0%db" % pod.width;
+      for ( state, data, time_ps ) in zip( pod.state, pod.data, pod.time ):
+        bits = format( data, fmt )[::-1];
+        for ( a, b ) in x_span_list:
+          bits = bits[:a] + "X"*(b-a) + bits[b:];
+        rts += [ bits + " %d " % state + comma_separated( time_ps ) ];
+      rts += [ "#[rle_pod_stop]" ];
+    return rts;
+
+
+##############################################################################
+# Samples of one RLE Pod. Only valid ( non-zero state ) RAM entries are kept.
+#   state    : 2bit codes. 1=Pre-Trig,2=Trigger,3=Post-Trig
+#   time_raw : RLE timestamps in Pod clocks after roll compensation
+#   time     : Trigger relative time in ps. See Capture.finalize()
+#   data     : ints where bit-N is D[N] of the Pod. Packed in an array('Q')
+#              for Pods up to 64 bits wide.
+#   x_mask   : data bits that are unknown ( RLE masked or not downloaded )
+# A bit rip is then just ( data >> bit_bot ) & mask for every entry.
+class CapturePod:
+  def __init__ ( self ):
+    self.hub          = None;
+    self.pod          = None;
+    self.status       = "full";# "needed", "partial" or "full"
+    self.attrib       = {};    # ie attrib["pod_user_ctrl"] = "00000000"
+    self.txt_list     = [];    # "#" header lines of the RLE RAM image
+    self.state        = array( 'B' );
+    self.time_raw     = [];
+    self.time         = int64_array( [] );
+    self.data         = [];
+    self.width        = 0;     # data bits rounded up to a nibble
+    self.x_mask       = 0;
+    self.trigger_time = None;
+    self.time_ps_en   = False; # time_raw is already ps, from sump_rle_samples.txt
+    self.time_key     = None;  # ( core_ck, trig_src_miso_latency ) of time
+
+  # "2 0000006008 00012036" is state, timestamp and data in hex. Data nibbles
+  # of RAM pages that weren't downloaded are "x"
+  def add_line( self, each ):
+    words = each.split();
+    state = int( words[0], 16 );
+    time_raw = int( words[1], 16 );
+    if state == 2:
+      self.trigger_time = time_raw;
+    if state == 0:
+      return;
+    data_hex = words[2];
+    self.width = 4 * len( data_hex );
+    if "x" in data_hex:
+      for (i,each_nib) in enumerate( reversed( data_hex ) ):
+        if each_nib == "x":
+          self.x_mask |= 0xF << (4*i);
+      data_hex = data_hex.replace("x","0");
+    self.state.append( state );
+    self.time_raw += [ time_raw ];
+    self.data += [ int( data_hex, 16 ) ];
+    return;
+
+  # "X1X01100 1 -12,500" is binary data with D0 first, state and time in ps
+  # from the trigger. X or Z bits are unknown.
+  def add_sample_line( self, each ):
+    words = each.split();
+    if len( words ) < 3:
+      return;
+    bits = words[0].upper().replace("Z","X");
+    self.width = len( bits );
+    if "X" in bits:
+      for (i,each_bit) in enumerate( bits ):
+        if each_bit == "X":
+          self.x_mask |= 1 << i;
+      bits = bits.replace("X","0");
+    self.time_ps_en = True;
+    self.state.append( int( words[1], 16 ) );
+    self.time_raw += [ int( words[2].replace(",",""), 10 ) ];
+    self.data += [ int( bits[::-1], 2 ) ];
+    return;
+
+  # Convert time_raw to +/- ps relative to the trigger. See Capture.finalize()
+  def time_adjust( self, core_ck, trig_src_miso_latency ):
+    self.time_key = ( core_ck, trig_src_miso_latency );
+    if self.time_ps_en:
+      self.time = self.time_raw;
+      return;
+    if len( self.time_raw ) == 0:
+      self.time = int64_array( [] );
+      return;
+    a = self.attrib;
+    pod_clk_ps = int(round(1/( float(a["rle_hub_clock"])/1000000.0)));# clk in ps units
+    trig_offset = trig_src_miso_latency;
+    trig_offset += ( int(a["trig_lat_core_ck"],10) + 0 ) * core_ck;
+    trig_offset += ( int(a["trig_lat_mosi_ck"],10) - 5 ) * pod_clk_ps;
+    trig_offset = int( trig_offset );
+    trigger_time = self.trigger_time;
+    if trigger_time == None:
+      trigger_time = 0;
+    self.time = int64_array( [ ( each - trigger_time ) * pod_clk_ps + trig_offset
+                               for each in self.time_raw ] );
+    return;
+
+  def close( self ):
+    self.hub = int( self.attrib["rle_hub_instance"], 10 );
+    self.pod = int( self.attrib["rle_pod_instance"], 10 );
+    self.time_raw = int64_array( self.time_raw );
+    if self.width <= 64:
+      self.data = array( 'Q', self.data );
+    if self.attrib.get("rle_bit_mask") != None:
+      self.x_mask |= int( self.attrib["rle_bit_mask"], 16 ) & ( ( 1 << self.width ) - 1 );
+    return;
+
+  # Rip every (bit_top,bit_bot) in rip_list from a single walk of the samples.
+  # Returns { (bit_top,bit_bot) : ( values, times ) } as int64 arrays. Rips
+  # that aren't compacted all share the Pod's own time array rather than a
+  # copy each. A rip is ( [], [] ) if any of its bits are unknown as the
+  # whole rip is then invalid.
+  # A Pod stores an entry whenever any of its bits change, so with compact
+  # a rip only keeps entries where its own value changes plus the first and
+  # last entries so the time span is unchanged.
+  def bit_rip_all( self, rip_list, compact = False ):
+    times = self.time;
+    rts = {};
+    shift_mask_list = [];
+    for ( bit_top, bit_bot ) in rip_list:
+      num_bits = max( 0, bit_top - bit_bot + 1 );
+      mask = ( 1 << num_bits ) - 1;
+      if num_bits != 0 and ( bit_top >= self.width or ( self.x_mask >> bit_bot ) & mask != 0 ):
+        rts[ ( bit_top, bit_bot ) ] = ( [], [] );
+      elif num_bits == 0:
+        rts[ ( bit_top, bit_bot ) ] = ( int64_array( [ 0 ] * len( times ) ), times );
+      else:
+        shift_mask_list += [ ( bit_top, bit_bot, mask ) ];
+    if len( shift_mask_list ) == 0:
+      return rts;
+
+    # Packed Pods up to 64 bits are shifted and masked a whole column at a time
+    if numpy != None and type( self.data ) == array and type( self.time ) == array:
+      words = numpy.frombuffer( self.data, dtype=numpy.uint64 );
+      time_np = numpy.frombuffer( self.time, dtype=numpy.int64 );
+      for ( bit_top, bit_bot, mask ) in shift_mask_list:
+        values = ( words >> numpy.uint64( bit_bot ) ) & numpy.uint64( mask );
+        if compact and len( values ) > 2:
+          keep = numpy.flatnonzero( values[1:-1] != values[:-2] ) + 1;
+          keep = numpy.concatenate( ( [ 0 ], keep, [ len( values )-1 ] ) );
+          rts[ ( bit_top, bit_bot ) ] = ( int64_array( values[keep] ), int64_array( time_np[keep] ) );
+        else:
+          rts[ ( bit_top, bit_bot ) ] = ( int64_array( values ), times );
+      return rts;
+
+    row_list = [ [ ( each >> bit_bot ) & mask for ( bit_top, bit_bot, mask ) in shift_mask_list ]
+                 for each in self.data ];
+    column_list = list( zip( *row_list ) );
+    if len( column_list ) == 0:
+      column_list = [ () ] * len( shift_mask_list );
+    for ( ( bit_top, bit_bot, mask ), values ) in zip( shift_mask_list, column_list ):
+      if compact:
+        ( values, rip_times ) = rle_compact( values, times );
+        rts[ ( bit_top, bit_bot ) ] = ( int64_array( values ), int64_array( rip_times ) );
+      else:
+        rts[ ( bit_top, bit_bot ) ] = ( int64_array( values ), times );
+    return rts;
+
+# Parse one Pod's segment of the RLE RAM image, or of sump_rle_samples.txt
+# with samples_en. Returns None if it holds no complete "#[rle_pod_start]"
+# to "#[rle_pod_stop]" block. Module level so a process pool can run it.
+def rle_pod_parse( seg_list, samples_en = False ):
+  rts = None;
+  pod = None;
+  for each in seg_list:
+    if each[0:1] == "#":
+      words = " ".join(each[1:].split()).split(' ') + [None] * 3;
+      if words[0] == "[rle_pod_start]":
+        pod = CapturePod();
+      if pod == None:
+        continue;
+      if words[0] == "[rle_pod_stop]":
+        pod.close();
+        rts = pod;
+        pod = None;
+        continue;
+      pod.txt_list += [ each ];
+      if words[0] == "[download_needed]":
+        pod.status = "needed";
+      elif words[0] == "[download_partial]":
+        pod.status = "partial";
+      elif words[1] == "=":
+        pod.attrib[ words[0] ] = words[2];
+    elif pod != None and samples_en:
+      pod.add_sample_line( each );
+    elif pod != None:
+      pod.add_line( each );
+  return rts;
+
+# rle_pod_parse() and the time conversion of Capture.finalize() for one Pod.
+# Module level so the RLE process pool can run it. With no core_ck yet the
+# time conversion is left to finalize()
+def rle_pod_load( seg_list, samples_en, core_ck, trig_src_miso_latency ):
+  pod = rle_pod_parse( seg_list, samples_en );
+  if pod != None and ( core_ck != None or pod.time_ps_en ):
+    pod.time_adjust( core_ck, trig_src_miso_latency );
+  return pod;
+
+# The "# name = value" header attributes of one Pod's segment, without
+# parsing its samples
+def rle_seg_attrib( seg_list ):
+  attrib = {};
+  for each in seg_list:
+    if each[0:1] != "#":
+      break;
+    words = " ".join(each[1:].split()).split(' ') + [None] * 3;
+    if words[1] == "=":
+      attrib[ words[0] ] = words[2];
+  return attrib;
+
+# Find the trigger source Pod in a list of ( (hub,pod), attrib ). Its miso
+# latency in ps is an offset shared by all Pods.
+# Returns ( (hub,pod), latency ) or ( None, 0.0 ) if there isn't one
+def rle_trig_src( key_attrib_list ):
+  rts = ( None, 0.0 );
+  for ( key, a ) in key_attrib_list:
+    if a.get("trig_src_hub") == None:
+      continue;
+    trig_src_hub = int( a["trig_src_hub"], 16 );
+    if ( trig_src_hub & 0x300 == 0x300 and ( trig_src_hub & 0x0FF ) == key[1] ):
+      hub_clk = float( a["rle_hub_clock"] );
+      rts = ( key, float ( 1000000.0 / hub_clk ) * int( a["trig_lat_miso_ck"], 10 ) );
+  return rts;
+
+# Keep the 1st, last and every entry whose value differs from the one before
+def rle_compact( values, times ):
+  n = len( values );
+  if n < 3:
+    return ( values, times );
+  keep = [ 0 ] + [ i for i in range( 1, n-1 ) if values[i] != values[i-1] ] + [ n-1 ];
+  if len( keep ) == n:
+    return ( values, times );
+  return ( [ values[i] for i in keep ], [ times[i] for i in keep ] );
+
+# Signed 64bit array, or a list of ints for the rare value that won't fit.
+# numpy columns are copied over as raw bytes.
+def int64_array( value_list ):
+  if numpy != None and type( value_list ) == numpy.ndarray:
+    if len( value_list ) != 0 and int( value_list.max() ) >= 2**63:
+      return value_list.tolist();
+    return array( 'q', value_list.astype( numpy.int64 ).tobytes() );
+  try:
+    return array( 'q', value_list );
+  except OverflowError:
+    return list( value_list );
+
+
+##############################################################################
+# Level of detail pyramid for drawing a zoomed out RLE binary signal. Time
+# from the 1st sample is cut into buckets of 2**shift ps at level 0, about the
+# mean sample spacing, and each level up merges bucket pairs until one bucket
+# spans the whole signal. A level is a bytearray that is 1 where the value
+# toggles inside that bucket. The value a quiet bucket holds is one bisect of
+# rle_time away so it isn't stored again.
+class RleLod:
+  def __init__ ( self, values, times ):
+    self.t0 = times[0];
+    self.t1 = times[-1];
+    span = self.t1 - self.t0 + 1;
+    self.shift = max( 0, ( span // len( times ) ).bit_length() - 1 );
+    num_buckets = ( ( span - 1 ) >> self.shift ) + 1;
+    if numpy != None:
+      value_np = numpy.asarray( values );
+      time_np  = numpy.asarray( times, dtype=numpy.int64 );
+      change_i = numpy.flatnonzero( value_np[1:] != value_np[:-1] ) + 1;
+      level = numpy.zeros( num_buckets, dtype=numpy.uint8 );
+      level[ ( time_np[ change_i ] - self.t0 ) >> self.shift ] = 1;
+      self.level_list = [ bytearray( level.tobytes() ) ];
+      while len( level ) > 1:
+        if len( level ) % 2 == 1:
+          level = numpy.append( level, numpy.uint8( 0 ) );
+        level = level[0::2] | level[1::2];
+        self.level_list += [ bytearray( level.tobytes() ) ];
+      return;
+    level = bytearray( num_buckets );
+    for i in range( 1, len( values ) ):
+      if values[i] != values[i-1]:
+        level[ ( times[i] - self.t0 ) >> self.shift ] = 1;
+    self.level_list = [ level ];
+    while len( level ) > 1:
+      level = bytearray( level[j] | level[j+1] if j+1 < len( level ) else level[j]
+                         for j in range( 0, len( level ), 2 ) );
+      self.level_list += [ level ];
+    return;
+
+  # Binary line_list for create_drawing_lines() of the screen starting at
+  # rle_time time_left. Uses the level whose buckets are just under a pixel
+  # wide, so at most a couple of points per pixel column. Quiet buckets are
+  # a flat line at their value, toggling runs a filled activity block.
+  def line_list( self, values, times, time_left, time_to_pixels, w, y1, y2 ):
+    ps_per_pixel = 1.0 / time_to_pixels;
+    k = max( 0, int( math.log2( max( ps_per_pixel, 1.0 ) ) ) - self.shift );
+    k = min( k, len( self.level_list ) - 1 );
+    level = self.level_list[k];
+    bucket_shift = self.shift + k;
+    time_right = time_left + w * ps_per_pixel;
+    j_start = max( 0, int( ( time_left  - self.t0 ) // ( 1 << bucket_shift ) ) );
+    j_stop  = min( len( level ), int( ( time_right - self.t0 ) // ( 1 << bucket_shift ) ) + 1 );
+
+    # Runs of ( x1, x2, value ) where value None is an activity block
+    span_list = [];
+    for j in range( j_start, j_stop ):
+      t1 = self.t0 + ( j << bucket_shift );
+      t2 = min( t1 + ( 1 << bucket_shift ), self.t1 );
+      x1 = min( max( int( ( t1 - time_left ) * time_to_pixels ), -1 ), w+1 );
+      x2 = min( max( int( ( t2 - time_left ) * time_to_pixels ), -1 ), w+1 );
+      if level[j]:
+        value = None;
+      else:
+        value = values[ bisect.bisect_right( times, t1 ) - 1 ];
+      if len( span_list ) != 0 and span_list[-1][2] == value:
+        span_list[-1] = ( span_list[-1][0], x2, value );
+      else:
+        span_list += [ ( x1, x2, value ) ];
+
+    # Activity zigzag phase is from the strip pixel, not the clipped x1, so
+    # tiles and full repaints of the same pan draw the same pixels
+    x_phase = int( round( time_left * time_to_pixels ) );
+    rts = [];
+    for ( x1, x2, value ) in span_list:
+      if value == None:
+        for x in range( x1, x2+1 ):
+          if ( x + x_phase ) % 2 == 0:
+            rts += [ ( x, y1 ), ( x, y2 ) ];
+          else:
+            rts += [ ( x, y2 ), ( x, y1 ) ];
+      elif value == 0:
+        rts += [ ( x1, y2 ), ( x2, y2 ) ];
+      else:
+        rts += [ ( x1, y1 ), ( x2, y1 ) ];
+    return rts;
+
+
+##############################################################################
+# Runs sump_download_capture() on a thread so the GUI stays live. The thread
+# sees the app through a DownloadWorkerApp, so everything the download
+# assigns ( rle_ram_dict, rle_capture, etc ) and every RAM file it writes is
+# kept apart from the capture on screen until swap(). Only the main thread
+# may touch the display, so caption updates become progress_queue messages
+# and are also where a cancel takes effect.
+class DownloadWorker:
+  def __init__ ( self, parent ):
+    import threading;
+    import queue;
+    self.parent         = parent;
+    self.progress_queue = queue.Queue();
+    self.cancelled      = False;
+    self.status         = "running";# then "done", "cancelled" or "failed"
+    self.start_time     = parent.pygame.time.get_ticks();
+    self.stage_path     = os.path.join( os.path.abspath( parent.vars["sump_path_ram"] ),
+                                        "sump_download_tmp" );
+    # Stand-in for pygame.display, pygame.event and pygame.time
+    self.display = self;
+    self.event   = self;
+    self.time    = parent.pygame.time;
+    self.app     = DownloadWorkerApp( parent, self );
+    self.thread  = threading.Thread( target = self.run, daemon = True );
+
+  def start( self ):
+    import shutil;
+    shutil.rmtree( self.stage_path, ignore_errors = True );
+    os.makedirs( self.stage_path );
+    self.thread.start();
+    return;
+
+  def run( self ):
+    try:
+      if sump_download_capture( self.app ):
+        self.status = "done";
+      else:
+        self.status = "failed";
+    except DownloadCancelled:
+      self.status = "cancelled";
+    except Exception as err:
+      log( self.parent, ["ERROR: DownloadWorker %s" % str( err ) ]);
+      self.status = "failed";
+    return;
+
+  def set_caption( self, txt ):
+    if self.cancelled:
+      raise DownloadCancelled();
+    self.progress_queue.put( txt );
+    return;
+
+  def pump( self ):
+    if self.cancelled:
+      raise DownloadCancelled();
+    return;
+
+  # Main thread only, once the thread has finished. The new RAM files replace
+  # the old capture's files and the new attributes replace the old ones.
+  def swap( self ):
+    file_path = os.path.abspath( self.parent.vars["sump_path_ram"] );
+    sump_ram_files_delete( self.parent, file_path );
+    for each in os.listdir( self.stage_path ):
+      os.replace( os.path.join( self.stage_path, each ), os.path.join( file_path, each ) );
+    self.discard();
+    for ( name, value ) in vars( self.app ).items():
+      if name not in [ "worker_parent", "pygame", "vars" ]:
+        setattr( self.parent, name, value );
+    self.parent.rle_capture.parent = self.parent;
+    return;
+
+  def discard( self ):
+    import shutil;
+    shutil.rmtree( self.stage_path, ignore_errors = True );
+    return;
+
+# The app as seen from a DownloadWorker thread. Reads fall through to the
+# real app, assignments stay here. RAM files go to the worker's stage_path.
+class DownloadWorkerApp:
+  def __init__ ( self, parent, worker ):
+    self.worker_parent = parent;
+    self.pygame = worker;
+    self.vars   = dict( parent.vars );
+    self.vars["sump_path_ram"] = worker.stage_path;
+
+  def __getattr__( self, name ):
+    return getattr( self.worker_parent, name );
+
+class DownloadCancelled( Exception ):
+  pass;
+
+
+##############################################################################
+# Low speed samples, decoded once into columns. Entry i of every column is
+# the same sample, already rotated so that time starts at index 0.
+#   state        : 2bit codes. 1=Pre-Trig,2=Trigger,3=Post-Trig
+#   time         : 30bit record header timestamps
+#   digital      : ints where bit-N is D[N]
+#   analog_list  : one list per ADC channel of ints, or None if no sample
+#   nibble_list  : hex digits of each ADC channel in sump_ls_samples.txt
+class LsCapture:
+  def __init__ ( self ):
+    self.state         = [];
+    self.time          = [];
+    self.digital       = [];
+    self.width         = 0;# digital bits
+    self.analog_list   = [];
+    self.nibble_list   = [];
+    self.trigger_index = None;
+
+  # Read back the sump_ls_samples.txt format, see samples_list()
+  def load_samples( self, ls_list ):
+    for each_sample in ls_list:
+      words = each_sample.split();
+      if len( words ) < 3:
+        continue;
+      self.width = len( words[0] );
+      self.digital.append( int( words[0][::-1], 2 ) );
+      self.add_analog( [ None if each == "None" else int( each, 16 ) for each in words[1:-2] ],
+                       [ len( each ) for each in words[1:-2] ] );
+      self.state.append( int( words[-2], 16 ) );
+      self.time.append( int( words[-1], 16 ) );
+    self.find_trigger();
+    return;
+
+  # One sample's worth of ADC channel values
+  def add_analog( self, value_list, nibble_list ):
+    for ( k, value ) in enumerate( value_list ):
+      if k == len( self.analog_list ):
+        self.analog_list += [ [ None ] * ( len( self.state ) ) ];
+        self.nibble_list += [ 0 ];
+      self.analog_list[k].append( value );
+      if value != None:
+        self.nibble_list[k] = nibble_list[k];
+    for each_ch in self.analog_list[len( value_list ):]:
+      each_ch.append( None );
+    return;
+
+  # The last Trigger(2) sample. This will differ from the trigger location
+  # setting since the user may download before the acquisition finishes.
+  def find_trigger( self ):
+    self.trigger_index = None;
+    for ( i, state ) in enumerate( self.state ):
+      if state == 2:
+        self.trigger_index = i;
+    return;
+
+  # Reorder every column to start at index start
+  def rotate( self, start ):
+    self.state   = self.state[start:]   + self.state[:start];
+    self.time    = self.time[start:]    + self.time[:start];
+    self.digital = self.digital[start:] + self.digital[:start];
+    self.analog_list = [ each[start:] + each[:start] for each in self.analog_list ];
+    self.find_trigger();
+    return;
+
+  # ( data >> bit_bot ) & mask for every sample. [] if out of range.
+  def bit_rip( self, bit_top, bit_bot ):
+    if bit_top >= self.width or bit_bot < 0:
+      return [];
+    mask = ( 1 << max( 0, bit_top - bit_bot + 1 ) ) - 1;
+    return int64_array( [ ( each >> bit_bot ) & mask for each in self.digital ] );
+
+  # sump_ls_samples.txt format. D0 is the leftmost bit, then ADC channels,
+  # then the state code and header timestamp.
+  # 01100100111000001101011010001000 a9b 389 None None 2 00000007
+  def samples_list( self ):
+    rts = [];
+    fmt = "0%db" % self.width;
+    for i in range( 0, len( self.state ) ):
+      txt = format( self.digital[i], fmt )[::-1];
+      for ( k, each_ch ) in enumerate( self.analog_list ):
+        if each_ch[i] == None:
+          txt += " None";
+        else:
+          txt += " " + ( "%06x" % each_ch[i] )[-self.nibble_list[k]:];# Max channel size is 24 bits
+      rts += [ txt + " %01x %08x" % ( self.state[i], self.time[i] ) ];
+    return rts;
+
+
 ##############################################################################
 # Virtual sump provides access to last capture's sump configuration from file
 class sump_virtual:
@@ -9445,6 +10592,8 @@ class sump3_hw:
 
     self.addr_ctrl = addr;
     self.addr_data = addr + 0x4;
+    self.q_op_list = [];# Queued bus cycles for q_run()
+    self.q_rd_list = [];# Number of read ops making up each q_rd()
 
     self.hw_id                       = 0x53;# Constant meaning "S3" for "Sump3"
 
@@ -9598,6 +10747,67 @@ class sump3_hw:
     return rts;
 
 
+  # Transaction queue. q_wr(), q_rd(), q_wr_pod() and q_rd_pod() match wr(),
+  # rd(), wr_pod() and rd_pod() but only queue the bus cycles. q_run() sends
+  # the whole queue to the Backdoor and returns a list with the DWORD list of
+  # each q_rd() in the order they were queued. The queue is only pipelined
+  # when the Backdoor is, ie bd_server_binary_en 1 or openocd in NoAckMode,
+  # otherwise it still costs one round trip per bus cycle.
+  def q_wr( self, cmd, data ):
+    self.q_op_list += [ ("w", self.addr_ctrl, [ cmd ] ) ];
+    self.q_op_list += [ ("w", self.addr_data, [ data ] ) ];
+
+  def q_rd( self, addr, num_dwords = 1 ):
+    # Note: addr of None means use existing ctrl address and just read data
+    if ( addr != None ):
+      self.q_op_list += [ ("w", self.addr_ctrl, [ addr ] ) ];
+    rd_cnt = 0;
+    while ( num_dwords > 0 ):
+      self.q_op_list += [ ("k", self.addr_data, min( num_dwords, 1024 ) ) ];
+      num_dwords -= 1024;
+      rd_cnt += 1;
+    self.q_rd_list += [ rd_cnt ];
+
+  def q_wr_pod( self, hub, pod, reg, data ):
+    self.q_wr( self.cmd_wr_rle_pod_inst_addr, (hub<<16)+(pod<<8)+(reg<<0) );
+    self.q_wr( self.cmd_wr_rle_pod_data, data );
+
+  def q_rd_pod( self, hub, pod, reg, num_dwords = 1 ):
+    self.q_wr( self.cmd_wr_rle_pod_inst_addr, (hub<<16)+(pod<<8)+(reg<<0) );
+    self.q_rd( self.cmd_wr_rle_pod_data, num_dwords );
+
+  # Placeholder for a read that isn't needed. q_run() returns [ 0 ] for it.
+  def q_skip( self ):
+    self.q_rd_list += [ None ];
+
+  # Without pipelining run the queue now, adding the 1st DWORD of each read
+  # to rd_list, so that what is queued next can depend on it. Pipelined the
+  # queue keeps building and the caller reads optional registers regardless.
+  def q_sync( self, rd_list ):
+    if not self.bd.pipelined():
+      rd_list += [ each[0] for each in self.q_run() ];
+    return;
+
+  def q_run( self ):
+    if len( self.q_op_list ) != 0:
+      rd_list = self.bd.transact( self.q_op_list );
+    else:
+      rd_list = [];
+    rts = [];
+    i = 0;
+    for rd_cnt in self.q_rd_list:
+      if rd_cnt == None:
+        rts += [ [ 0 ] ];
+        continue;
+      dword_list = [];
+      for each in rd_list[i:i+rd_cnt]:
+        dword_list += each;
+      rts += [ dword_list ];
+      i += rd_cnt;
+    self.q_op_list = [];
+    self.q_rd_list = [];
+    return rts;
+
   def rd_pod( self, hub, pod, reg, num_dwords = 1 ):
     dword_list = [];
     if num_dwords == 1:
@@ -9628,8 +10838,26 @@ class sump3_hw:
     rts += chr( ( dword & 0x000000FF ) >>  0 );
     return rts;
 
+  # Config is read in three queued phases ( core, hubs, pods ) so that a
+  # pipelined Backdoor enumerates in a few round trips instead of one per
+  # register. Name, View ROM size and disabled core registers are only read
+  # if needed, unless pipelined where reading them all is cheaper than an
+  # extra round trip to find out. Skipped registers read as 0.
   def rd_cfg( self ):
-    hwid_data     = self.rd( self.cmd_rd_hw_id_rev     )[0];
+    pipe_en = self.bd.pipelined();
+    core_rd_list = [];
+    self.q_rd( self.cmd_rd_hw_id_rev );
+    self.q_sync( core_rd_list );
+    for ( each, bit ) in [ ( self.cmd_rd_ana_ram_width_len, 0x00000002 ),
+                           ( self.cmd_rd_tick_freq,         0x00000002 ),
+                           ( self.cmd_rd_dig_ram_width_len, 0x00000001 ),
+                           ( self.cmd_rd_rle_hub_config,    None       ) ]:
+      if pipe_en or bit == None or ( core_rd_list[0] & bit ) != 0:
+        self.q_rd( each );
+      else:
+        self.q_skip();
+    core_rd_list += [ each[0] for each in self.q_run() ];
+    ( hwid_data, ana_ram_data, freq_data, dig_ram_data, rle_hub_cnt ) = core_rd_list;
 
     self.cfg_dict['hw_id']           = ( hwid_data & 0xFF000000 ) >> 24;
     self.cfg_dict['hw_rev']          = ( hwid_data & 0x00FF0000 ) >> 16;
@@ -9654,16 +10882,11 @@ class sump3_hw:
       print("Switching data_burst_len from 1 DWORD to 31 DWORDs");
       self.bd.data_burst_len = 31;
 
-    if self.cfg_dict['ana_ls_enable'] == 1:
-      ana_ram_data  = self.rd( self.cmd_rd_ana_ram_width_len )[0];
-      freq_data     = self.rd( self.cmd_rd_tick_freq     )[0];
-    else:
+    if self.cfg_dict['ana_ls_enable'] != 1:
       ana_ram_data  = 0x00000000;
       freq_data     = 0x00000000;
 
-    if self.cfg_dict['dig_hs_enable'] == 1:
-      dig_ram_data  = self.rd( self.cmd_rd_dig_ram_width_len )[0];
-    else:
+    if self.cfg_dict['dig_hs_enable'] != 1:
       dig_ram_data  = 0x00000000;
 
     self.cfg_dict['ana_ram_depth']   = ( ana_ram_data  & 0x00FFFFFF ) >> 0;
@@ -9681,21 +10904,59 @@ class sump3_hw:
       if len(rom_byte_list) != 0:
         self.view_rom_list += self.parse_view_rom( rom_byte_list=rom_byte_list, hub=0, pod=0, inst=0 );
 
-    rle_hub_cnt   = self.rd( self.cmd_rd_rle_hub_config)[0];
 #   print("RLE Hub Count is %d" % rle_hub_cnt );
     log( self.parent , ["RLE Hub Count is %d" % rle_hub_cnt] );
+
+    # Queue every hub register, then every register of every pod.
+    hub_reg_list = [ self.cmd_rd_rle_pod_config, self.cmd_rd_rle_hub_instance,
+                     self.cmd_rd_rle_hub_hw_cfg, self.cmd_rd_rle_hub_name_0_3,
+                     self.cmd_rd_rle_hub_name_4_7, self.cmd_rd_rle_hub_name_8_11 ];
+    hub_rd_list = [];
+    for i in range(0,rle_hub_cnt):
+      self.q_wr( self.cmd_wr_rle_pod_inst_addr, (i << 16) );
+      for each in hub_reg_list[0:3]:
+        self.q_rd( each );
+      self.q_sync( hub_rd_list );
+      name_en = pipe_en or ( hub_rd_list[-1] & 0x00000001 ) == 0;# hub_hw_cfg
+      for each in hub_reg_list[3:]:
+        if name_en:
+          self.q_rd( each );
+        else:
+          self.q_skip();
+      self.q_sync( hub_rd_list );
+    hub_rd_list += [ each[0] for each in self.q_run() ];
+    pod_reg_list = [ self.rle_pod_addr_pod_hw_cfg, self.rle_pod_addr_pod_ram_cfg,
+                     self.rle_pod_addr_pod_instance, self.rle_pod_addr_pod_name_0_3,
+                     self.rle_pod_addr_pod_name_4_7, self.rle_pod_addr_pod_name_8_11,
+                     self.rle_pod_addr_pod_view_rom_kb ];
+    pod_rd_list = [];
+    for i in range(0,rle_hub_cnt):
+      rle_pod_cnt = hub_rd_list[i*len(hub_reg_list)];
+      for j in range(0,rle_pod_cnt):
+        self.q_wr( self.cmd_wr_rle_pod_inst_addr, (i<<16)+(j<<8)+(0x00<<0) );
+        self.q_rd( self.cmd_wr_rle_pod_data );
+        for each in pod_reg_list[0:3]:
+          self.q_rd_pod( hub=i,pod=j,reg=each );
+        self.q_sync( pod_rd_list );
+        name_en = pipe_en or ( pod_rd_list[-3] & 0x00000020 ) == 0;# pod_hw_cfg
+        rom_en  = pipe_en or ( pod_rd_list[-3] & 0x00000002 ) != 0;
+        for each in pod_reg_list[3:]:
+          if ( each == self.rle_pod_addr_pod_view_rom_kb and rom_en ) or \
+             ( each != self.rle_pod_addr_pod_view_rom_kb and name_en ):
+            self.q_rd_pod( hub=i,pod=j,reg=each );
+          else:
+            self.q_skip();
+        self.q_sync( pod_rd_list );
+    pod_rd_list += [ each[0] for each in self.q_run() ];
+
     hub_list = [];
     for i in range(0,rle_hub_cnt):
-      self.wr( self.cmd_wr_rle_pod_inst_addr, (i << 16) );
-      rle_pod_cnt   = self.rd( self.cmd_rd_rle_pod_config)[0];
+      ( rle_pod_cnt, hub_instance, hub_hw_cfg, hub_name_0_3, hub_name_4_7,
+        hub_name_8_11 ) = hub_rd_list[0:len(hub_reg_list)];
+      hub_rd_list = hub_rd_list[len(hub_reg_list):];
 #     print("  RLE Hub #%d has %d Pods" % ( i, rle_pod_cnt ) );
 
-      hub_instance  = self.rd( self.cmd_rd_rle_hub_instance)[0];
-      hub_hw_cfg    = self.rd( self.cmd_rd_rle_hub_hw_cfg)[0];
       if ( hub_hw_cfg & 0x00000001 ) == 0:
-        hub_name_0_3  = self.rd( self.cmd_rd_rle_hub_name_0_3)[0];
-        hub_name_4_7  = self.rd( self.cmd_rd_rle_hub_name_4_7)[0];
-        hub_name_8_11 = self.rd( self.cmd_rd_rle_hub_name_8_11)[0];
         hub_name =  self.dword_to_ascii( hub_name_0_3 );
         hub_name += self.dword_to_ascii( hub_name_4_7 );
         hub_name += self.dword_to_ascii( hub_name_8_11 );
@@ -9715,18 +10976,12 @@ class sump3_hw:
 
       pod_list = [];
       for j in range(0,rle_pod_cnt):
-        self.bd.wr( self.addr_ctrl, [ 0x32 ] );
-        self.bd.wr( self.addr_data, [ (i<<16)+(j<<8)+(0x00<<0) ] );
-        self.bd.wr( self.addr_ctrl, [ 0x33 ] );
-        dword = self.bd.rd( self.addr_data )[0];
-        pod_hw_cfg    = self.rd_pod( hub=i,pod=j,reg=self.rle_pod_addr_pod_hw_cfg )[0];
-        pod_ram_cfg   = self.rd_pod( hub=i,pod=j,reg=self.rle_pod_addr_pod_ram_cfg )[0];
+        ( dword, pod_hw_cfg, pod_ram_cfg, pod_instance, pod_name_0_3,
+          pod_name_4_7, pod_name_8_11, pod_view_rom_kb ) = \
+          pod_rd_list[0:1+len(pod_reg_list)];
+        pod_rd_list = pod_rd_list[1+len(pod_reg_list):];
         pod_num_data_bits = ( pod_ram_cfg & 0x00FFFF00 ) >> 8;
-        pod_instance  = self.rd_pod( hub=i,pod=j,reg=self.rle_pod_addr_pod_instance  )[0];
         if ( pod_hw_cfg & 0x00000020 ) == 0:
-          pod_name_0_3  = self.rd_pod( hub=i,pod=j,reg=self.rle_pod_addr_pod_name_0_3  )[0];
-          pod_name_4_7  = self.rd_pod( hub=i,pod=j,reg=self.rle_pod_addr_pod_name_4_7  )[0];
-          pod_name_8_11 = self.rd_pod( hub=i,pod=j,reg=self.rle_pod_addr_pod_name_8_11 )[0];
           pod_name =  self.dword_to_ascii( pod_name_0_3 );
           pod_name += self.dword_to_ascii( pod_name_4_7 );
           pod_name += self.dword_to_ascii( pod_name_8_11 );
@@ -9744,7 +10999,6 @@ class sump3_hw:
         log( self.parent , [ "    RLE Hub %d, Pod #%d %s : HW Rev = %02x" % (i,j, name, ((pod_hw_cfg & 0xFF000000)>>24))  ] );
         # If this pod has a view rom, process it
         if ( pod_hw_cfg & 0x00000002 ) != 0:
-          pod_view_rom_kb = self.rd_pod( hub=i,pod=j,reg=self.rle_pod_addr_pod_view_rom_kb )[0];
           rom_byte_list = self.rd_pod_view_rom( hub=i,pod=j,size_kb=pod_view_rom_kb );
           self.view_rom_list += self.parse_view_rom( rom_byte_list=rom_byte_list, hub=i, pod=j, inst=pod_instance );
 
@@ -10022,8 +11276,10 @@ class sump3_hw:
         if rom_type == "core":
           data_list += self.rd( self.cmd_rd_ram_data, num_dwords=dwords_to_read);
         else:
-          data_list += self.rd_pod(hub=None,pod=None,reg=None);# Note the burst read
+          self.q_rd( None );# Single DWORD reads, queued as one request
         remaining_dwords -= dwords_to_read;
+      for each in self.q_run():
+        data_list += each;
 
       found_rom_end = False;
       for i in range( 0, len( data_list )-1 ):
@@ -10342,18 +11598,22 @@ class sump3_hw:
 ##############################################################################
 # functions to send Backdoor commands to BD_SERVER.PY over TCP Sockets
 class Backdoor:
-  def __init__ ( self, parent, ip, port, aes_key, aes_authentication ):
+  def __init__ ( self, parent, ip, port, aes_key, aes_authentication, binary_en = 0 ):
     self.aes     = None;
     self.aes_e2e = False;
     self.parent  = parent;
     self.data_burst_len = 1;
     self.status  = None;
+    self.binary  = False;# True once bd_server agrees to raw u32 payloads
+    self.rx_chunk = 1024*1024;# Largest single recv_into() request
+    self.pipeline_depth = 64;# Max requests in flight for transact()
     try:
       import socket;
     except:
       raise RuntimeError("ERROR: socket is required");
     try:
       self.sock = socket.socket(socket.AF_INET,socket.SOCK_STREAM);
+      self.sock.setsockopt( socket.SOL_SOCKET, socket.SO_RCVBUF, self.rx_chunk );
       self.sock.connect( ( ip, port ) );# "localhost", 21567
       self.sock.settimeout(5); # Dont wait forever
 
@@ -10394,6 +11654,10 @@ class Backdoor:
 #         self.sock = None;
       else:
         log( self.parent , [ "  AES Authentication not required." ] );
+
+      # Binary framing isn't supported through the AES string cipher
+      if binary_en == 1 and self.sock != None and self.aes_e2e == False:
+        self.negotiate_binary();
     except:
       log( self.parent , [ "  ERROR: Unable to open Socket %d on %s" % ( port, ip ) ] );
       self.status = "ERROR: %s" % ip;
@@ -10408,6 +11672,47 @@ class Backdoor:
   def close ( self ):
     self.sock.close();
 
+  # Ask bd_server to switch this session to binary payloads. A bd_server that
+  # predates binary framing either answers with something other than "b 1" or
+  # doesn't answer at all, in which case the session stays in text framing.
+  # A reply that never arrived may still arrive later and would be read as
+  # the header of the next response, so the socket is reopened after a timeout.
+  def negotiate_binary( self ):
+    import socket;
+    rts = "";
+    self.tx_tcp_packet("b 1\n");
+    try:
+      self.sock.settimeout(2);
+      rts = self.rx_tcp_packet();
+    except:
+      rts = None;
+    if rts == None:
+      peer = self.sock.getpeername();
+      self.sock.close();
+      if self.aes != None:
+        raise RuntimeError("ERROR: bd_server binary framing request timed out");
+      self.sock = socket.socket(socket.AF_INET,socket.SOCK_STREAM);
+      self.sock.setsockopt( socket.SOL_SOCKET, socket.SO_RCVBUF, self.rx_chunk );
+      self.sock.connect( peer );
+      rts = "";
+    self.sock.settimeout(5);
+    words = " ".join(rts.split()).split(' ') + [None] * 2;
+    if words[0] == "b" and words[1] == "1":
+      self.binary = True;
+      log( self.parent , [ "  bd_server binary payload framing enabled." ] );
+    else:
+      log( self.parent , [ "  bd_server does not support binary framing. Using text framing." ] );
+    return self.binary;
+
+  # Binary request payload is cmd(1 byte), addr(u32) and count(u32) followed
+  # by count little-endian u32 DWORDs for writes. Little-endian throughout.
+  def binary_payload( self, cmd, addr, count, data = [] ):
+    import struct;
+    payload = struct.pack( "<cII", cmd.encode("utf-8"), addr, count );
+    if len( data ) != 0:
+      payload += struct.pack( "<%dI" % len(data), *[ int(d) for d in data ] );
+    return payload;
+
   def bs(self, addr, bitfield ):
     rts = self.rd( addr, 1 );
     data_new = rts[0] | bitfield[0];  # OR in some bits
@@ -10423,6 +11728,10 @@ class Backdoor:
       cmd = "w";# Normal Write : Single or Burst with incrementing address
     else:
       cmd = "W";# Write Multiple DWORDs to same address
+    if self.binary:
+      self.tx_tcp_packet( self.binary_payload( cmd, addr, len(data), data ) );
+      self.rx_tcp_packet( binary = True );
+      return;
     payload = "".join( [cmd + " %08x" % addr] +
                        [" %08x" % int(d) for d in data] +
                        ["\n"] );
@@ -10431,12 +11740,19 @@ class Backdoor:
 
   def ping(self):
     cmd = "p";
+    if self.binary:
+      self.tx_tcp_packet( self.binary_payload( cmd, 0, 0 ) );
+      self.rx_tcp_packet( binary = True );
+      return;
     payload = cmd+"\n";
     self.tx_tcp_packet( payload );
     self.rx_tcp_packet();
 
   def quit(self):
     cmd = "q";
+    if self.binary:
+      self.tx_tcp_packet( self.binary_payload( cmd, 0, 0 ) );
+      return;
     payload = cmd+"\n";
     self.tx_tcp_packet( payload );
 #   self.rx_tcp_packet();
@@ -10446,45 +11762,110 @@ class Backdoor:
       cmd = "r";# Normal Read : Single or Burst with incrementing address
     else:
       cmd = "k";# Read Multiple DWORDs from single address
+    if self.binary:
+      self.tx_tcp_packet( self.binary_payload( cmd, addr, num_dwords ) );
+      return self.unpack_dwords( self.rx_tcp_packet( binary = True ), "<" );
 #   payload = cmd + " %08x %08x\n" % (addr,(num_dwords-1));# 0=1DWORD,1=2DWORDs
     if num_dwords == 1:
       payload = cmd + " %08x\n" % (addr);# 0=1DWORD,1=2DWORDs
     else:
       payload = cmd + " %08x %08x\n" % (addr,(num_dwords-1));# 0=1DWORD,1=2DWORDs
     self.tx_tcp_packet( payload );
-    payload = self.rx_tcp_packet().rstrip();
-    dwords = payload.split(' ');
+    if self.aes_e2e == True:
+      payload = self.rx_tcp_packet().rstrip();
+      return [ int( dword, 16 ) for dword in payload.split(' ') ];
+    # "0000abcd 12345678" hex text converts to big-endian bytes in one
+    # C level pass. Only when every word is 8 digits though, as a short
+    # word like "abcd" would otherwise merge with its neighbor.
+    word_list = self.rx_tcp_packet( binary = True ).decode("utf-8").split();
+    if set( map( len, word_list ) ) == { 8 }:
+      return self.unpack_dwords( bytes.fromhex( "".join( word_list ) ), ">" );
+    return [ int( dword, 16 ) for dword in word_list ];
+
+  # True if transact() sends more than one request per round trip
+  def pipelined( self ):
+    return self.binary;
+
+  # Send a list of ( cmd, addr, data ) bus cycles and return a list of the
+  # read results in queue order. cmd is "w" or "W" with data a DWORD list, or
+  # "r" or "k" with data the number of DWORDs. A bd_server that negotiated
+  # binary framing parses a packet stream, so requests are pipelined in
+  # batches of pipeline_depth. Otherwise it's one round trip per cycle.
+  def transact( self, op_list ):
     rts = [];
-    for dword in dwords:
-      rts += [int( dword, 16 )];
+    if not self.binary:
+      for (cmd, addr, data) in op_list:
+        if cmd in [ "w", "W" ]:
+          self.wr( addr, data, repeat = ( cmd == "W" ) );
+        else:
+          rts += [ self.rd( addr, data, repeat = ( cmd == "k" ) ) ];
+      return rts;
+    for i in range( 0, len( op_list ), self.pipeline_depth ):
+      batch = op_list[i:i+self.pipeline_depth];
+      tx_data = bytearray();
+      for (cmd, addr, data) in batch:
+        if cmd in [ "w", "W" ]:
+          payload = self.binary_payload( cmd, addr, len(data), data );
+        else:
+          payload = self.binary_payload( cmd, addr, data );
+        tx_data += ( "%08x" % len(payload) ).encode("utf-8") + payload;
+      self.sock.sendall( tx_data );
+      for (cmd, addr, data) in batch:
+        payload = self.rx_tcp_packet( binary = True );
+        if cmd in [ "r", "k" ]:
+          rts += [ self.unpack_dwords( payload, "<" ) ];
     return rts;
 
+  # Convert a buffer of packed DWORDs to a list of ints in a single step.
+  # endian is "<" for binary framing payloads and ">" for hex text.
+  def unpack_dwords( self, payload, endian ):
+    import struct;
+    if len( payload ) % 4 != 0:
+      raise ValueError("DWORD payload of %d bytes" % len( payload ) );
+    return list( struct.unpack( "%s%dI" % ( endian, len(payload) // 4 ), payload ) );
+
   def tx_tcp_packet( self, payload ):
     # A Packet is a 8char hexadecimal header followed by the payload.
     # The header is the number of bytes in the payload.
+    # Binary payloads arrive here already as bytes and are never encrypted.
+    if type( payload ) == bytes:
+      header = "%08x" % len(payload);
+      self.sock.sendall( header.encode("utf-8") + payload );
+      return;
     if self.aes_e2e == True:
       payload = self.aes.encrypt(payload);
     header = "%08x" % len(payload);
     bin_data = (header+payload).encode("utf-8");# String to ByteArray
     self.sock.send( bin_data );
 
-  def rx_tcp_packet( self ):
-    # Receive 1+ Packets of response. 1st Packet will start with header that
-    # indicates how big the entire Backdoor payload is. Sit in a loop
-    # receiving 1+ TCP packets until the entire payload is received.
-    bin_data = self.sock.recv(1024);
-    rts = bin_data.decode("utf-8");# ByteArray to String
-    header      = rts[0:8];      # Remove the header, Example "00000004"
+  def rx_tcp_packet( self, binary = False ):
+    # Receive 1+ Packets of response. The 8 byte header indicates how big the
+    # entire Backdoor payload is. The payload buffer is then allocated once at
+    # its final size and filled in place with recv_into() until complete.
+    # A binary response payload is returned as the raw bytearray.
+    header = bytearray(8);
+    self.rx_into( memoryview( header ) );
     payload_len = int(header,16);# The Payload Length in Bytes, Example 0x4
-    payload     = rts[8:];       # Start of Payload is everything after header
-    # 1st packet may not be entire payload so loop until we have it all
-    while ( len(payload) < payload_len ):
-      bin_data = self.sock.recv(1024);
-      payload += bin_data.decode("utf-8");# ByteArray to String
+    payload = bytearray( payload_len );
+    self.rx_into( memoryview( payload ) );
+    if binary:
+      return payload;
+    payload = payload.decode("utf-8");# ByteArray to String
     if self.aes_e2e == True:
       payload = self.aes.decrypt(payload);
     return payload;
 
+  # Fill the entire memoryview from the socket. recv_into() writes straight
+  # into the caller's buffer so nothing is copied or concatenated.
+  def rx_into( self, view ):
+    i = 0;
+    while i < len( view ):
+      n = self.sock.recv_into( view[i:], min( len(view)-i, self.rx_chunk ) );
+      if n == 0:
+        raise ConnectionError("bd_server closed the connection");
+      i += n;
+    return;
+
 
 
 # def bs(self, addr, bitfield ):
@@ -10508,13 +11889,68 @@ class OpenOCD:
     self.sock = True;
     self.status = None;
     self.data_burst_len = 1;# After Connect HW might change this to 31
+    self.gdb = None;         # Persistent GDB remote socket
+    self.rx_buf = bytearray();# Received bytes not yet parsed into packets
+    self.no_ack = False;     # True once QStartNoAckMode is accepted
+    self.x_en = False;       # True if openocd accepts binary X writes
+    self.pipeline_depth = 64;# Max packets in flight when no_ack
+    self.wr_burst_len = 256; # Max DWORDs per M or X write packet
+    self.op_sent = False;    # True once gdb_transact() has sent a packet
+    self.burst_list = [ 31, 28, 24, 22, 16, 8, 4, 1 ];# Read burst candidates
+    self.burst_len = 31;     # Current read burst cap. See probe_burst()
+    self.burst_max = int( parent.vars.get("openocd_burst_max","31"), 10 );# ini ceiling
+    self.rd_bytes = 0;       # Read throughput since last report_rate()
+    self.rd_secs  = 0.0;
+    self.load_burst_history();
     log( self.parent , [ "Establishing class OpenOCD interface to %s : %d" % ( ip, port )]);
+    try:
+      self.connect();
+    except:
+      log( self.parent , [ "  ERROR: class OpenOCD unable to open GDB session to %s : %d" % ( self.ip, self.port )]);
+      self.disconnect();
+    return;
+
+  # Open the GDB remote session. Turn off per-packet acks when possible since
+  # that is what allows requests to be pipelined, then health check with "?".
+  def connect( self ):
+    import socket;
+    self.gdb = socket.create_connection(( self.ip, self.port), timeout=5 );
+    self.gdb.setsockopt( socket.IPPROTO_TCP, socket.TCP_NODELAY, 1 );
+    self.rx_buf = bytearray();
+    self.no_ack = False;
+    self.no_ack = ( self.gdb_command("QStartNoAckMode") == "OK" );
+    self.gdb_command("?");
+    self.x_en = ( self.gdb_command("X00000000,0:") == "OK" );# Zero length probe
+    log( self.parent , [ "  openocd GDB session open. NoAckMode=%s X=%s" % ( self.no_ack, self.x_en ) ]);
+    return;
+
+  def disconnect( self ):
+    if self.gdb != None:
+      try:
+        self.gdb.close();
+      except:
+        pass;
+    self.gdb = None;
     return;
 
   def close ( self ):
+    self.disconnect();
     return;
 
+  # Keep alive doubles as the health check. A dead session gets reopened.
   def ping ( self ):
+    try:
+      if self.gdb == None:
+        self.connect();
+      else:
+        self.gdb_command("?");
+    except:
+      log( self.parent , [ "  WARNING: class OpenOCD ping() failed. Reconnecting." ]);
+      self.disconnect();
+      try:
+        self.connect();
+      except:
+        self.disconnect();
     return;
 
   def quit(self):
@@ -10533,16 +11969,10 @@ class OpenOCD:
     return;
 
   def wr(self, addr, data, repeat = False ):
-    try:
-      import socket;
-      with socket.create_connection(( self.ip, self.port)) as self.sock:
-        for each in data:
-#         print("w %08x %08x" % ( addr, each ) );
-          self.write_memory_32("%08x" % addr, "%08x" % each );
-          if repeat == False:
-            addr += 4;
-    except:
-      log( self.parent , [ "  ERROR: class OpenOCD wr() to %s : %d" % ( self.ip, self.port )]);
+    if repeat == False:
+      self.transact( [ ( "w", addr, data ) ] );
+    else:
+      self.transact( [ ( "W", addr, data ) ] );
     return;
 
   def send_cmd(self, cmd ):
@@ -10591,82 +12021,246 @@ class OpenOCD:
 #  1 DWORD  = 35,580 ms
 
   def rd( self, addr, num_dwords=1, repeat = False ):
-    rts = [];
-    i = num_dwords;
-    max_burst = self.data_burst_len;# 1 or 31
+    if repeat == False:
+      rts = self.transact( [ ( "r", addr, num_dwords ) ] );
+    else:
+      rts = self.transact( [ ( "k", addr, num_dwords ) ] );
+    return rts[0];
+
+  # True if transact() sends more than one packet per round trip
+  def pipelined( self ):
+    return self.no_ack;
+
+  # Same ( cmd, addr, data ) op_list as Backdoor.transact(). If the session
+  # drops it is reopened and the op_list is retried once. A timeout or
+  # malformed response while read bursts are in flight also backs off the
+  # burst length. Connect failures and "E" error replies don't.
+  # Once packets have gone out only a list of "r" reads is safe to replay.
+  # Writes and "k" reads of a data port move hardware pointers, so those
+  # fail with empty reads and the caller re-addresses and reads again.
+  def transact( self, op_list ):
+    import socket;
+    burst_en = len( [ 1 for (cmd, addr, data) in op_list
+                      if cmd in [ "r", "k" ] and data > 1 ] ) != 0;
+    replay_en = len( [ 1 for (cmd, addr, data) in op_list if cmd != "r" ] ) == 0;
+    attempt = 0;
+    while attempt < 2:
+      self.op_sent = False;
+      burst_err = False;
+      try:
+        if self.gdb == None:
+          self.connect();
+        return self.gdb_transact( op_list );
+      except ( socket.timeout, ValueError ):
+        burst_err = burst_en and self.op_sent;
+      except:
+        pass;
+      self.disconnect();
+      if burst_err:
+        self.back_off_burst();
+      if self.op_sent and not replay_en:
+        break;
+      attempt += 1;
+      if attempt == 1:
+        log( self.parent , [ "  WARNING: class OpenOCD session to %s : %d lost. Reconnecting." % ( self.ip, self.port )]);
+    log( self.parent , [ "  ERROR: class OpenOCD transact() to %s : %d" % ( self.ip, self.port )]);
+    return [ [] for (cmd, addr, data) in op_list if cmd in [ "r", "k" ] ];
+
+  # Find the largest read burst that is stable on this adapter. The data port
+  # is burst read while the ctrl port selects the constant hw_id register, so
+  # every DWORD must come back as the same value. A timeout or mismatch moves
+  # on to the next smaller burst, from data_burst_len down to 1 and never
+  # above openocd_burst_max. Results are remembered per ip:port target.
+  def probe_burst( self, addr_ctrl, addr_data, cmd ):
+    import socket;
+    key = "%s:%d" % ( self.ip, self.port );
+    if self.data_burst_len == 1:
+      return;
+    if key in self.burst_history:
+      self.burst_len = self.burst_history[ key ];
+      log( self.parent , [ "  openocd burst of %d DWORDs remembered for %s" % ( self.burst_len, key ) ]);
+      return;
+    self.wr( addr_ctrl, [ cmd ] );
+    expected = self.rd( addr_data );
+    if len( expected ) != 1:
+      return;
+    for burst_len in self.burst_list:
+      if burst_len > min( self.data_burst_len, self.burst_max ):
+        continue;
+      self.burst_len = burst_len;
+      self.rd_bytes = 0;
+      self.rd_secs  = 0.0;
+      try:
+        if self.gdb == None:
+          self.connect();
+        self.gdb.settimeout(1);
+        for i in range(0,8):
+          rts = self.gdb_transact( [ ( "k", addr_data, burst_len ) ] )[0];
+          if rts != expected * burst_len:
+            raise ValueError("openocd burst mismatch");
+        self.gdb.settimeout(5);
+        log( self.parent , [ "  openocd burst of %d DWORDs is stable at %s" % ( burst_len, self.rate_str() ) ]);
+        break;
+      except:
+        log( self.parent , [ "  openocd burst of %d DWORDs failed" % burst_len ]);
+        self.disconnect();
+    self.save_burst_history();
+    return;
 
-    # Observed unexplained openocd lockup with read bursts > 23 when using
-    # TCP access. Telnet access works fine though. HW seems fine.
-    # Issue is unresolved without explanation so capping at 23.
-    if max_burst > 22:
-      max_burst = 22;
+  # Drop to the next smaller burst after a timeout or malformed response.
+  # Returns False when there is nothing smaller left to try. This is for the
+  # current session only, only probe_burst() results are remembered.
+  def back_off_burst( self ):
+    smaller = [ each for each in self.burst_list if each < self.burst_cap() ];
+    if len( smaller ) == 0 or self.data_burst_len == 1:
+      return False;
+    log( self.parent , [ "  WARNING: openocd burst backed off from %d to %d DWORDs" % ( self.burst_cap(), smaller[0] ) ]);
+    self.burst_len = smaller[0];
+    return True;
 
-    try:
-      import socket;
-      with socket.create_connection(( self.ip, self.port)) as self.sock:
-        while i > 0:
-          if i >= max_burst:
-            rts += self.read_memory_32("%08x" % addr, max_burst );
-            i = i - max_burst;
-          else:
-            rts += self.read_memory_32("%08x" % addr, i  );
-            i = 0;
-    except:
-      log( self.parent , [ "  ERROR: class OpenOCD rd() to %s : %d" % ( self.ip, self.port )]);
-    return rts;
+  # Read burst actually used. The probed or backed off burst_len, limited by
+  # the HW data_burst_len ( 1 or 31 ) and the openocd_burst_max ini ceiling.
+  def burst_cap( self ):
+    return min( self.burst_len, self.burst_max, self.data_burst_len );
+
+  # openocd_burst_history is "ip:port@len,ip:port@len" of burst results
+  def load_burst_history( self ):
+    self.burst_history = {};
+    for each in self.parent.vars.get("openocd_burst_history","none").split(","):
+      words = each.split("@") + [None];
+      if words[1] != None:
+        try:
+          self.burst_history[ words[0] ] = int( words[1], 10 );
+        except:
+          pass;
+    return;
 
-  def checksum(self,data):
-    return format(sum(ord(c) for c in data) % 256, '02x');
+  def save_burst_history( self ):
+    self.burst_history[ "%s:%d" % ( self.ip, self.port ) ] = self.burst_len;
+    self.parent.vars["openocd_burst_history"] = ",".join(
+      [ "%s@%d" % ( key, self.burst_history[key] ) for key in self.burst_history ] );
+    return;
 
-  def send_gdb_command(self, sock, command):
-    packet = f"${command}#{self.checksum(command)}";
-    sock.sendall(packet.encode());
-    return self.receive_response(sock);
+  def rate_str( self ):
+    if self.rd_secs == 0:
+      return "0.0 KB/s";
+    return "%0.1f KB/s" % ( self.rd_bytes / 1024.0 / self.rd_secs );
+
+  # Log achieved read throughput since the last report and reset the counters
+  def report_rate( self ):
+    if self.rd_bytes != 0:
+      log( self.parent , [ "  openocd read %d KB in %0.2f s at %s with %d DWORD bursts" %
+         ( self.rd_bytes // 1024, self.rd_secs, self.rate_str(), self.burst_cap() ) ]);
+    self.rd_bytes = 0;
+    self.rd_secs  = 0.0;
+    return;
 
-  def receive_response(self,sock):
-    response = b"";
-    while True:
-      chunk = sock.recv(4096);
-      response += chunk;
-      if b'#' in chunk:
-        break;
-    start = response.find(b'$') + 1;
-    end = response.find(b'#');
-    return response[start:end].decode();
+  # Convert the op_list into GDB packets. Writes to incrementing addresses
+  # become block M or X packets. Reads are split into bursts of max_burst.
+  # In NoAckMode packets are sent pipeline_depth at a time before reading
+  # the responses back, otherwise it is one round trip per packet.
+  def gdb_transact( self, op_list ):
+    import struct;
+    # Observed unexplained openocd lockup with read bursts > 23 when using
+    # TCP access. Telnet access works fine though. HW seems fine.
+    # Issue is unresolved without explanation so the cap is now probed per
+    # target by probe_burst() and lowered by back_off_burst() on failure.
+    # Adapters that lock up rather than time out can set openocd_burst_max.
+    max_burst = self.burst_cap();
+
+    start_time = time.time();
+    rd_bytes = 0;
+    pkt_list = [];# ( packet, rd_index or None )
+    rts = [];
+    for (cmd, addr, data) in op_list:
+      if cmd == "w":
+        for i in range( 0, len(data), self.wr_burst_len ):
+          chunk = data[i:i+self.wr_burst_len];
+          pkt_list += [ ( self.wr_packet( addr+4*i, struct.pack( "<%dI" % len(chunk), *chunk ) ), None ) ];
+      elif cmd == "W":
+        for each in data:
+          pkt_list += [ ( self.wr_packet( addr, struct.pack( "<I", each ) ), None ) ];
+      else:
+        i = 0;
+        while i < data:
+          n = min( max_burst, data-i );
+          # Repeat reads stay on addr. HW burst decode handles the DWORDs.
+          if cmd == "r":
+            rd_addr = addr + 4*i;
+          else:
+            rd_addr = addr;
+          pkt_list += [ ( self.gdb_packet( "m%08x,%d" % ( rd_addr, 4*n ) ), len(rts) ) ];
+          i += n;
+        rts += [ [] ];
 
-  def swap_endian(self, hex_str):
-    # Assumes hex_str is 8 characters (32 bits)
-    bytes_list = [hex_str[i:i+2] for i in range(0, len(hex_str), 2)];
-    return ''.join(reversed(bytes_list));
+    if self.no_ack:
+      depth = self.pipeline_depth;
+    else:
+      depth = 1;
+    for i in range( 0, len( pkt_list ), depth ):
+      batch = pkt_list[i:i+depth];
+      self.op_sent = True;
+      self.gdb.sendall( b"".join( [ pkt for (pkt, j) in batch ] ) );
+      for (pkt, j) in batch:
+        value = self.rx_packet();
+        if j == None:
+          if value != "OK":
+            log( self.parent , [ "  ERROR: class OpenOCD: write %s" % value ]);
+        elif value[0:1] == "E":
+          raise RuntimeError("openocd read error %s" % value[0:16] );
+        elif len( value ) % 8 != 0 or len( value ) == 0:
+          raise ValueError("openocd malformed read response %s" % value[0:16] );
+        else:
+          raw = bytes.fromhex( value );
+          rts[j] += list( struct.unpack( "<%dI" % ( len(raw) // 4 ), raw ) );
+          rd_bytes += len( raw );
+    if rd_bytes != 0:
+      self.rd_bytes += rd_bytes;
+      self.rd_secs  += time.time() - start_time;
+    return rts;
 
-  def read_memory_32(self, address, num_dwords, endian='big'):
-    import socket;
-    host = self.ip;
-    port = self.port;
-    dword_list = [];
-    command = "m%s,%d" % ( address, 4*num_dwords );
-    value = self.send_gdb_command(self.sock, command)
-    while value:
-      dword = value[0:8];
-      value = value[8:];
-      if endian == 'big':
-        dword = self.swap_endian(dword);
-      dword_list += [ int( dword, 16) ];
-    return dword_list;
+  # Block write packet. X carries raw bytes with $ # } * escaped as } x^0x20.
+  def wr_packet( self, addr, raw ):
+    if self.x_en:
+      esc = bytearray();
+      for each in raw:
+        if each in [ 0x23, 0x24, 0x7d, 0x2a ]:
+          esc += bytes( [ 0x7d, each ^ 0x20 ] );
+        else:
+          esc.append( each );
+      return self.gdb_packet( ( "X%08x,%d:" % ( addr, len(raw) ) ).encode() + esc );
+    return self.gdb_packet( "M%08x,%d:%s" % ( addr, len(raw), raw.hex() ) );
+
+  def gdb_packet( self, command ):
+    if type( command ) == str:
+      command = command.encode();
+    return b"$" + command + ( "#%02x" % ( sum( command ) % 256 ) ).encode();
+
+  # Single request and response, used for session setup and health checks
+  def gdb_command( self, command ):
+    self.gdb.sendall( self.gdb_packet( command ) );
+    return self.rx_packet();
+
+  # Return the next "$data#cs" packet from the session, buffering whatever
+  # else arrived with it. Stray "+" acks ahead of the "$" are dropped.
+  def rx_packet( self ):
+    while True:
+      start = self.rx_buf.find( b"$" );
+      if start >= 0:
+        end = self.rx_buf.find( b"#", start );
+        if end >= 0 and len( self.rx_buf ) >= end+3:
+          value = self.rx_buf[start+1:end].decode();
+          del self.rx_buf[0:end+3];
+          if not self.no_ack:
+            self.gdb.sendall( b"+" );
+          return value;
+      chunk = self.gdb.recv( 65536 );
+      if not chunk:
+        raise ConnectionError("openocd closed the GDB session");
+      self.rx_buf += chunk;
 
-  def write_memory_32(self, address, value_hex, endian='big'):
-    import socket;
-    host = self.ip;
-    port = self.port;
-    if len(value_hex) != 8:
-        raise ValueError("Value must be 8 hex characters (32 bits)")
-    if endian == 'big':
-        value_hex = self.swap_endian(value_hex)
-    command = "M%s,4:%s" % ( address, value_hex );
-    response = self.send_gdb_command(self.sock, command)
-    if response != "OK":
-      log( self.parent , [ "  ERROR: class OpenOCD: write_memory_32()" ]);
-    return;
+  def checksum(self,data):
+    return format(sum(ord(c) for c in data) % 256, '02x');
 
 
 
@@ -10699,9 +12293,18 @@ def init_globals( self ):
   self.view_ontap_list = [];# List of all the views that are defined in files under sump_views
   self.sump_connected = False;
   self.sump_rle_download_history_dict = {};# Remember if a [Hub,Pod] has already been downloaded.
+  self.sump_rle_page_dict = {};# Raw RLE RAM pages downloaded so far for each [Hub,Pod]
+  self.rle_ram_dict = {};# RLE RAM image, sump_rle_ram.txt split by (hub,pod)
+  self.rle_ram_stale = False;# True if rle_ram_dict has changes not yet in the file
+  self.rle_capture = Capture( parent = self );# Decoded RLE samples of every Pod
+  self.ls_capture = LsCapture();# Decoded LS samples
+  self.rle_time_bounds = None;# ( rle window signals, ( min, max ) ) see rle_timezone_bounds()
   self.mode_acquire = False;
   self.thread_id = None;
   self.thread_id_en = False;
+  self.thread_locked = False;# True between cmd_thread_lock() and cmd_thread_unlock()
+  self.rle_pool = None;# RLE decode ProcessPoolExecutor. See rle_process_pool()
+  self.rle_pool_workers = 0;
 # self.screen_shot = False;
   self.file_dialog = None;# "load_pizza", "save_pizza", "source_script", "load_uut"
   self.file_dialog_box = None;
@@ -10774,6 +12377,7 @@ def init_globals( self ):
   self.text_stats = None;
   self.text_stats_tick_time = 0;
   self.status_downloading = False;
+  self.download_worker = None;# DownloadWorker of a background sump_download
 # self.rom_signal_source = None;
   self.signal_delete_list = [];# Stack of signals deleted for <DEL>,<INS>,<HOME>
   self.signal_copy_list = [];# Stack of signals copied 
@@ -10843,6 +12447,10 @@ def init_vars( self, file_ini ):
 # vars["screen_windows"            ] = "F";# 4 bits for which windows are visible
   vars["screen_windows"            ] = "9";# 4 bits for visible windows. 9 = Win1 + bd_shell
   vars["screen_window_rle_time"    ] = "1";# Draw RLE Time range in upper right of windows  
+  vars["screen_rle_lod_en"         ] = "1";# Draw zoomed out RLE binary signals from RleLod
+  vars["screen_glyph_cache_size"   ] = "4096";# Rendered waveform text surfaces kept
+  vars["screen_tile_cache_en"      ] = "1";# Paint RLE windows from cached waveform tiles
+  vars["screen_tile_cache_mb"      ] = "64";# Memory budget of cached waveform tiles
   vars["screen_console_height"     ] = "300";# bd_shell console height
   vars["screen_save_image_format"  ] = "png";# png jpg bmp 
   vars["screen_measurements_tall"  ] = "0";# Wide versus Tall cursor measurements           
@@ -10861,8 +12469,11 @@ def init_vars( self, file_ini ):
   vars["openocd_ip"                ] = "192.168.1.109";
   vars["openocd_socket"            ] = "3333";
   vars["openocd_telnet"            ] = "4444";
+  vars["openocd_burst_history"     ] = "none";# ip:port@dwords,.. from probe_burst()
+  vars["openocd_burst_max"         ] = "31";# Largest read burst ever used, ie 22
   vars["bd_server_quit_on_close"   ] = "1";
   vars["bd_server_keep_alive"      ] = "1";
+  vars["bd_server_binary_en"       ] = "0";# Negotiate raw u32 payloads with bd_server
   vars["aes_key"                   ] = "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f";
   vars["aes_authentication"        ] = "0";
   vars["ai_engine"                 ] = "None";
@@ -10903,6 +12514,13 @@ def init_vars( self, file_ini ):
   vars["sump_download_disable_hs"  ] = "0";
   vars["sump_download_disable_rle" ] = "0";
   vars["sump_download_ondemand"    ] = "1";
+  vars["sump_download_workers"     ] = "4";# Pod decode threads without a process pool
+  vars["sump_download_rle_page_select"] = "1";# On-demand reads only data pages in use
+  vars["sump_download_rle_sparse"  ] = "1";# Read state page 1st, then valid entries only
+  vars["sump_rle_samples_export"   ] = "0";# Also write sump_rle_samples.txt
+  vars["sump_rle_keep_raw"         ] = "0";# Keep every Pod entry, not just value changes
+  vars["sump_download_background"  ] = "1";# Download and decode on a worker thread
+  vars["sump_rle_decode_processes" ] = "4";# RLE Pod decode process pool, 1 = serial
 
   vars["sump_path_vcd"             ] = "sump_vcd";
   vars["sump_path_png"             ] = "sump_png";
@@ -10945,11 +12563,13 @@ def init_vars( self, file_ini ):
     "screen_color_background","screen_color_foreground","screen_color_selected",
     "screen_color_trigger","screen_color_triggerable","screen_color_cursor",
     "screen_x", "screen_y","screen_save_position",
-    "screen_width","screen_height", "screen_windows","screen_window_rle_time",
+    "screen_width","screen_height", "screen_windows","screen_window_rle_time", "screen_rle_lod_en",
+    "screen_glyph_cache_size", "screen_tile_cache_en", "screen_tile_cache_mb",
     "screen_console_height", "screen_measurements_tall", "screen_adc_sample_points", "screen_save_image_format",
     "screen_analog_line_width", "screen_analog_bold_width", "screen_max_text_stats_width",
     "bd_connection","bd_protocol","bd_server_ip","bd_server_socket","bd_server_quit_on_close","bd_server_keep_alive",
-    "openocd_ip", "openocd_socket", "openocd_telnet",
+    "bd_server_binary_en",
+    "openocd_ip", "openocd_socket", "openocd_telnet", "openocd_burst_history", "openocd_burst_max",
     "aes_key", "aes_authentication",
     "ai_engine", "ai_api_key",
     "sump_remote_file_en", "sump_remote_telnet_en", "sump_remote_telnet_port", "sump_remote_telnet_host",
@@ -10965,7 +12585,9 @@ def init_vars( self, file_ini ):
     "vcd_viewer_en", "vcd_viewer_gtkw_en", "vcd_viewer_path","vcd_viewer_height","vcd_viewer_width",
     "list_csv_format",
     "sump_download_disable_ls", "sump_download_disable_hs", "sump_download_disable_rle",
-    "sump_download_ondemand",
+    "sump_download_ondemand", "sump_download_workers", "sump_download_rle_page_select",
+    "sump_download_rle_sparse", "sump_rle_samples_export", "sump_rle_keep_raw",
+    "sump_download_background", "sump_rle_decode_processes",
     "scroll_wheel_glitch_lpf_en",
     "scroll_wheel_pan_en",  
     "scroll_wheel_pan_reversed",
@@ -11923,7 +13545,8 @@ def recursive_signal_copy( self, parent, copy_parent, group_copy, hier_offset ):
 # For some reason copy.deepcopy() is crashing, so do it manually
 def copy_signal_obj( self, src_sig ):
   dst_sig = signal( name = src_sig.name );
-  dst_sig.__dict__ = src_sig.__dict__.copy();
+  for each_attr in signal.__slots__:
+    setattr( dst_sig, each_attr, getattr( src_sig, each_attr ) );
   dst_sig.window = None;
   dst_sig.selected = False;
   return dst_sig; 
@@ -14702,6 +16325,7 @@ def cmd_font_larger( self ):
   size += 2;
   self.vars["font_size"] = str( size );
   self.font = get_font( self, self.vars["font_name"],self.vars["font_size"]);
+  self.glyph_cache.clear();
   self.refresh_waveforms = True;
   return rts;
 
@@ -14715,6 +16339,7 @@ def cmd_font_smaller( self ):
     size = 2;
   self.vars["font_size"] = str( size );
   self.font = get_font( self, self.vars["font_name"],self.vars["font_size"]);
+  self.glyph_cache.clear();
   self.refresh_waveforms = True;
   return rts;
 
@@ -15072,6 +16697,11 @@ def proc_cmd( self, cmd, quiet = False ):
 # print("proc_cmd() %s" % cmd_txt );
 # print(cmd_txt);# Also use STDOUT
 # self.cmd_console.add_output_line_to_log( cmd ,is_bold=True, remove_line_break=True);
+
+  # Let a background sump_download finish first, unless just panning or zooming
+  if ( self.download_worker != None and
+       cmd_txt not in self.dont_log_list + ["sump_download_cancel"] ):
+    sump_download_wait( self );
   valid = False;
   rts = [];
 
@@ -15137,6 +16767,8 @@ def proc_cmd( self, cmd, quiet = False ):
   elif cmd_txt == "sump_arm"          : cmd_sump_arm(self); valid = True;
   elif cmd_txt == "sump_acquire"      : cmd_sump_acquire(self); valid = True;
   elif cmd_txt == "sump_download"     : cmd_sump_download(self); valid = True;
+  elif cmd_txt == "sump_download_cancel" : rts = cmd_sump_download_cancel(self); valid = True;
+  elif cmd_txt == "sump_memory"       : rts = capture_memory_report(self); valid = True;
   elif cmd_txt == "sump_query"        : rts = cmd_sump_query(self); valid = True;
   elif cmd_txt == "sump_force_trig"   : rts = cmd_sump_force_trig(self); valid = True;
   elif cmd_txt == "sump_force_stop"   : rts = cmd_sump_force_stop(self); valid = True;
@@ -15386,6 +17018,8 @@ def init_manual( self ):
   a+=["  sump_arm          : Arm for acquisition without polling.           "];
   a+=["  sump_acquire      : Arm for acquisition with polling until done.   "];
   a+=["  sump_download     : Download acquisition to local file.            "];
+  a+=["  sump_download_cancel : Cancel a background download.               "];
+  a+=["  sump_memory       : Report memory used by the current capture.   "];
   a+=["  sump_force_trig   : Force a software induced trigger.              "];
   a+=["  sump_force_stop   : Force a software induced acquisition stop.     "];
   a+=["  sump_reset        : Reset sump HW and place in idle state.         "];
@@ -15468,11 +17102,15 @@ def init_manual( self ):
   a+=["   bd_server_socket           : '21567' TCP/IP socket of bd_server.   "];
   a+=["   bd_server_quit_on_close    : Quit bd_server when GUI closes.       "];
   a+=["   bd_server_keep_alive       : Periodically ping bd_server.          "];
+  a+=["   bd_server_binary_en        : 1 = binary DWORD payloads. Default 0.  "];
+  a+=["                                Also pipelines queued config reads.   "];
   a+=["   aes_key                    : 256 bit hex AES key.                  "];
   a+=["   aes_authentication         : 1 = use AES authentication for remote."];
   a+=["   openocd_ip                 : 'localhost' or IP ('127.0.0.1') of openocd."];
   a+=["   openocd_socket             : '3333' TCP/IP socket of openocd      "];
   a+=["   openocd_telnet             : '4444' TCP/IP socket of openocd telnet"];
+  a+=["   openocd_burst_history      : Probed read burst per target. 'none' re-probes."];
+  a+=["   openocd_burst_max          : '31' Largest read burst in DWORDs, ie '22'. "];
   a+=["  5.2 SUMP Hardware                                                  "];
   a+=["   sump_uut_addr              : Base address of SUMP Control+Data Regs.  "];
   a+=["   sump_user_ctrl             : 32 bit user_ctrl mux setting.            "];
@@ -15486,6 +17124,13 @@ def init_manual( self ):
   a+=["   sump_trigger_nth           : Nth trigger to trigger on. 1 to 2^16     "];
   a+=["   sump_trigger_type          : Trigger type. or_rising, etc.            "];
   a+=["   sump_download_ondemand     : Only downlad Pods that have views applied."];
+  a+=["   sump_download_workers      : Decode threads if no RLE process pool.  "];
+  a+=["   sump_download_rle_page_select : 1 = On-demand reads only RAM pages in use. "];
+  a+=["   sump_download_rle_sparse   : 1 = Skip invalid RLE RAM entries on download."];
+  a+=["   sump_rle_samples_export    : 1 = Write RLE samples to sump_rle_samples.txt."];
+  a+=["   sump_rle_keep_raw          : 1 = Keep RLE entries where a signal didn't change."];
+  a+=["   sump_download_background   : 1 = Download on a thread. GUI stays live.  "];
+  a+=["   sump_rle_decode_processes  : Processes decoding RLE Pods. 1 = serial.   "];
   a+=["   sump_thread_lock_en        : 1 to enable hardware thread locking.     "];
   a+=["   sump_thread_id             : Static thread_id or 00000000 for dynamic."];
   a+=["  5.3 Unit Under Test                                                    "];